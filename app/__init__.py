@@ -1,9 +1,6 @@
 import os
-import ssl
 from pathlib import Path
-from urllib.parse import urlparse
 
-import pika
 from flasgger import Swagger
 from flask import Flask
 from flask_cors import CORS
@@ -11,13 +8,12 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 
 from .config import DevelopmentConfig, DockerConfig, ProductionConfig
 from .db.db import DB
-from .db.redis import Cache
 from .extensions.celery import celery
 from .extensions.limiter import init_limiter
-from .queues.queue import RabbitMQ
 from .template import swagger_template
 from .utils.init import init_dependencies
 from .utils.logger import Logger
+from .utils.security import Security
 
 
 def create_app():
@@ -67,6 +63,15 @@ def create_app():
         template=swagger_template,
     )
 
+    # JWT settings are read once per process, not on every decode
+    Security.load_settings(app.config.get("JWT_CACHE_SIZE", 1024))
+    Security.load_hasher(
+        app.config.get("BCRYPT_POOL_SIZE", 2),
+        app.config.get("BCRYPT_QUEUE_SIZE", 8),
+        app.config.get("BCRYPT_ROUNDS", 12),
+        app.config.get("BCRYPT_TIMEOUT_SECONDS", 5),
+    )
+
     # Enable cross origin requests
     CORS(app)
 
@@ -82,42 +87,6 @@ def create_app():
         app.config["UPLOAD_FOLDER"] = upload_folder
     Path(upload_folder).mkdir(parents=True, exist_ok=True)
 
-    # Create rabbitmq connection just once when the app starts
-    broker_url = app.config.get("CELERY_BROKER_URL")
-    if not broker_url:
-        raise ValueError("RABBITMQ_URI not provided...!")
-
-    if broker_url:
-        parsed = urlparse(broker_url)
-        use_tls = parsed.scheme == "amqps"
-        parameters = (
-            pika.ConnectionParameters(
-                host=parsed.hostname,
-                port=parsed.port or (5671 if use_tls else 5672),
-                virtual_host=parsed.path.lstrip("/") or "/",
-                credentials=pika.PlainCredentials(
-                    username=parsed.username, password=parsed.password
-                ),
-                ssl_options=(
-                    pika.SSLOptions(ssl.create_default_context()) if use_tls else None
-                ),
-            ),
-        )
-
-    else:
-        # Fallback plan for local dev env
-        parameters = pika.ConnectionParameters(
-            host=app.config.get("RABBITMQ_HOST", "localhost"),
-            port=app.config.get("RABBITMQ_PORT", 5672),
-            virtual_host=app.config.get("RABBITMQ_VHOST", "/"),
-            credentials=pika.PlainCredentials(
-                username=app.config.get("RABBITMQ_USER", "guest"),
-                password=app.config.get("RABBITMQ_PASSWORD", "guest"),
-            ),
-        )
-
-    app.extensions["rabbitmq_connection"] = pika.BlockingConnection(parameters)
-
     # celery.conf.update(app.config)
     # celery_ext.flask_app = app
 
@@ -129,8 +98,6 @@ def create_app():
     celery.Task = ContextTask  # must be before mails.py is imported!
 
     app.teardown_appcontext(DB.close_db)
-    app.teardown_appcontext(Cache.close_redis)
-    app.teardown_appcontext(RabbitMQ.close_rabbitmq)
 
     from .routes import register_routes
 
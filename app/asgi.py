@@ -0,0 +1,224 @@
+"""
+Asyncio serving mode for the Server-Sent Event routes.
+
+Under gunicorn's sync workers every open stream pins one of the
+``workers x threads`` request slots for as long as the browser tab stays
+open. ``StreamApp`` serves the two stream routes as plain ASGI instead: a
+stream is a coroutine waiting on an ``AsyncEventHub`` queue, so thousands of
+them share one event loop and none of them holds a Flask request slot.
+
+Snapshot queries still go through the regular (blocking) repositories, run
+in a worker thread inside a Flask app context and only when a stream needs
+to rebuild its payload.
+
+Every other path is handed to ``fallback`` (the Flask app wrapped for ASGI,
+see ``asgi.py``), or answered 404 when the stream server runs on its own
+behind a proxy that routes ``*/stream`` to it.
+"""
+
+import asyncio
+import json
+from contextlib import aclosing
+from urllib.parse import parse_qs
+
+from .db.redis import Cache
+from .extensions.event_hub import AsyncEventHub
+from .services.application_stream_service import (
+    ERROR_EVENT,
+    EXPIRED_EVENT,
+    KEEP_ALIVE,
+    ApplicationStreamService,
+    StreamSpec,
+    token_expired,
+)
+from .utils.logger import Logger
+from .utils.metrics import Metrics
+
+SSE_HEADERS = [
+    (b"content-type", b"text/event-stream"),
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no"),
+    (b"access-control-allow-origin", b"*"),
+]
+
+
+async def send_json(send, status: int, payload: dict) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"access-control-allow-origin", b"*"),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class StreamApp:
+    def __init__(self, flask_app, fallback=None, hub: AsyncEventHub | None = None):
+        self.flask_app = flask_app
+        self.fallback = fallback
+
+        config = flask_app.config
+        base = config.get("API_BASE", "/v1/api")
+        self.routes = {
+            f"{base}/applications/user/stream": self.user_stream,
+            f"{base}/applications/admin/stream": self.admin_stream,
+        }
+        self.heartbeat = float(config.get("SSE_HEARTBEAT_SECONDS", 15))
+        self.queue_size = int(config.get("SSE_CLIENT_QUEUE_SIZE", 100))
+        # A client that cannot take one message in this long is dropped
+        self.send_timeout = self.heartbeat * 2
+
+        settings = dict(config)
+        self.hub = hub or AsyncEventHub(lambda: Cache.create_async_client(settings))
+        Metrics.register_gauge("async_event_hub", self.hub.stats)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+
+        handler = (
+            self.routes.get(scope.get("path")) if scope["type"] == "http" else None
+        )
+        if handler is None:
+            if self.fallback is not None:
+                await self.fallback(scope, receive, send)
+            else:
+                await send_json(send, 404, {"error": "Not found"})
+            return
+
+        if scope["method"] != "GET":
+            await send_json(send, 405, {"error": "Method not allowed"})
+            return
+
+        raw_query = scope.get("query_string", b"").decode("latin-1")
+        query = {key: values[0] for key, values in parse_qs(raw_query).items()}
+        await handler(query, receive, send)
+
+    async def lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.hub.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _in_app_context(self, func, *args):
+        with self.flask_app.app_context():
+            return func(*args)
+
+    async def run_sync(self, func, *args):
+        """Run blocking repository code off the event loop."""
+        return await asyncio.to_thread(self._in_app_context, func, *args)
+
+    async def user_stream(self, query: dict, receive, send) -> None:
+        token = query.get("token")
+        if not token:
+            await send_json(send, 401, {"error": "Unauthorized"})
+            return
+
+        try:
+            spec = await self.run_sync(ApplicationStreamService.user_stream_spec, token)
+        except Exception as e:
+            await send_json(send, 401, {"error": str(e)})
+            return
+
+        await self.stream(spec, receive, send)
+
+    async def admin_stream(self, query: dict, receive, send) -> None:
+        token = query.get("token")
+        try:
+            job_id = int(query.get("job_id", 0))
+        except ValueError:
+            job_id = 0
+        if not token:
+            await send_json(send, 401, {"error": "Unauthorized"})
+            return
+        if job_id < 1:
+            await send_json(send, 400, {"error": "job_id is required"})
+            return
+
+        try:
+            spec = await self.run_sync(
+                ApplicationStreamService.admin_stream_spec, token, job_id
+            )
+        except Exception as e:
+            await send_json(send, 401, {"error": str(e)})
+            return
+
+        await self.stream(spec, receive, send)
+
+    async def stream(self, spec: StreamSpec, receive, send) -> None:
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": SSE_HEADERS}
+        )
+        disconnected = asyncio.create_task(self._wait_for_disconnect(receive))
+        # Subscribe before the snapshot so nothing committed in between is lost
+        subscription = self.hub.subscribe(spec.channel, self.queue_size)
+        Metrics.incr("async_streams.opened")
+        try:
+            async with aclosing(self._messages(spec, subscription)) as messages:
+                async for message in messages:
+                    if disconnected.done():
+                        return
+                    await asyncio.wait_for(
+                        send(
+                            {
+                                "type": "http.response.body",
+                                "body": message.encode("utf-8"),
+                                "more_body": True,
+                            }
+                        ),
+                        self.send_timeout,
+                    )
+            await send({"type": "http.response.body", "body": b""})
+        except asyncio.TimeoutError:
+            Metrics.incr("async_streams.slow_clients")
+            Logger.warn(f"Dropping slow stream client on {spec.channel}")
+        finally:
+            subscription.close()
+            disconnected.cancel()
+            Metrics.incr("async_streams.closed")
+
+    async def _wait_for_disconnect(self, receive) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    async def _messages(self, spec: StreamSpec, subscription):
+        """The loop of ``ApplicationStreamService._run``, awaiting instead."""
+        try:
+            state, message = await self.run_sync(spec.refresh)
+            yield message
+        except Exception as e:
+            Logger.warn(f"Stream snapshot for {spec.channel} failed: {str(e)}")
+            yield ERROR_EVENT
+            return
+
+        while True:
+            if token_expired(spec.decoded):
+                yield EXPIRED_EVENT
+                return
+
+            event = await subscription.get(timeout=self.heartbeat)
+            if event is None:
+                yield KEEP_ALIVE
+                continue
+
+            try:
+                messages, stale = ApplicationStreamService.step(spec, state, event)
+                for message in messages:
+                    yield message
+                if stale:
+                    state, message = await self.run_sync(spec.refresh)
+                    yield message
+            except Exception as e:
+                Logger.warn(f"Stream update for {spec.channel} failed: {str(e)}")
+                yield ERROR_EVENT
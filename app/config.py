@@ -61,6 +61,14 @@ class BaseConfig:
     JWT_SECRET = os.getenv("JWT_SECRET", "mysupersecret")
     JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_TOKEN_EXPIRY_HOURS = os.getenv("JWT_TOKEN_EXPIRY_HOURS", 48)
+    # Verified tokens kept in memory per worker (0 disables the cache)
+    JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", 1024))
+
+    # Password hashing (BCRYPT_POOL_SIZE=0 hashes on the request thread)
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+    BCRYPT_POOL_SIZE = int(os.getenv("BCRYPT_POOL_SIZE", 2))
+    BCRYPT_QUEUE_SIZE = int(os.getenv("BCRYPT_QUEUE_SIZE", 8))
+    BCRYPT_TIMEOUT_SECONDS = float(os.getenv("BCRYPT_TIMEOUT_SECONDS", 5))
 
     # Database
     DB_HOST = os.getenv("DB_HOST", "localhost")
@@ -68,6 +76,13 @@ class BaseConfig:
     DB_PASSWORD = os.getenv("DB_PASSWORD", "root")
     DB_NAME = os.getenv("DB_NAME", "job-board-api")
     DB_PORT = int(os.getenv("DB_PORT", 3306))
+    DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 1))
+    DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))
+    DB_POOL_IDLE_TIMEOUT = float(os.getenv("DB_POOL_IDLE_TIMEOUT", 300))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+    DB_POOL_HEALTH_CHECK_INTERVAL = float(
+        os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", 30)
+    )
 
     # Redis
     REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
@@ -77,6 +92,27 @@ class BaseConfig:
     REDIS_DB = int(os.getenv("REDIS_DB", 0))
     REDIS_TLS = os.getenv("REDIS_TLS", "false").lower() == "true"
     REDIS_URL = os.getenv("REDIS_URL")  # prioritized over individual vars
+    # One pool per worker process, shared by caches, events and the limiter
+    REDIS_POOL_MAX_SIZE = int(os.getenv("REDIS_POOL_MAX_SIZE", 20))
+    REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 5))
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 5))
+    REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", 5))
+    REDIS_SOCKET_KEEPALIVE = (
+        os.getenv("REDIS_SOCKET_KEEPALIVE", "true").lower() == "true"
+    )
+    REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
+
+    # Public job listing cache (seconds)
+    JOBS_CACHE_LIST_TTL = int(os.getenv("JOBS_CACHE_LIST_TTL", 60))
+    JOBS_CACHE_DETAIL_TTL = int(os.getenv("JOBS_CACHE_DETAIL_TTL", 300))
+
+    # Bulk job import: rows per INSERT and rows per request
+    JOBS_IMPORT_CHUNK_SIZE = int(os.getenv("JOBS_IMPORT_CHUNK_SIZE", 200))
+    JOBS_IMPORT_MAX_ROWS = int(os.getenv("JOBS_IMPORT_MAX_ROWS", 5000))
+
+    # Application SSE streams
+    SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", 15))
+    SSE_CLIENT_QUEUE_SIZE = int(os.getenv("SSE_CLIENT_QUEUE_SIZE", 100))
 
     # RabbitMQ
     RABBITMQ_USER = os.getenv("RABBITMQ_USER", "guest")
@@ -106,10 +142,39 @@ class BaseConfig:
     MAILGUN_DOMAIN = os.getenv("MAILGUN_DOMAIN")
     MAILGUN_API_KEY = os.getenv("MAILGUN_API_KEY")
     MAILGUN_BASE_URL = os.getenv("MAILGUN_BASE_URL")
+    # Application emails to one recipient within the window become one digest;
+    # 0 sends every notification on its own
+    NOTIFICATION_DIGEST_WINDOW_SECONDS = float(
+        os.getenv("NOTIFICATION_DIGEST_WINDOW_SECONDS", 300)
+    )
+    MAILGUN_BATCH_SIZE = int(os.getenv("MAILGUN_BATCH_SIZE", 1000))
+    # Outbox relay: application notifications committed with the write
+    OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+    OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", 1))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 5))
+    # A claimed row is hidden from other relays this long; a failed one
+    # waits OUTBOX_RETRY_SECONDS, doubled on every further failure
+    OUTBOX_LEASE_SECONDS = int(os.getenv("OUTBOX_LEASE_SECONDS", 60))
+    OUTBOX_RETRY_SECONDS = int(os.getenv("OUTBOX_RETRY_SECONDS", 30))
+    # Keep-alive session shared by the mail providers in each worker
+    MAIL_HTTP_POOL_SIZE = int(os.getenv("MAIL_HTTP_POOL_SIZE", 20))
+    MAIL_HTTP_RETRIES = int(os.getenv("MAIL_HTTP_RETRIES", 3))
+    MAIL_HTTP_BACKOFF = float(os.getenv("MAIL_HTTP_BACKOFF", 0.5))
+    MAIL_HTTP_TIMEOUT = float(os.getenv("MAIL_HTTP_TIMEOUT", 10))
 
     # Sendgrid Configs
     SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY", "somestring")
 
+    # Mail provider routing: tried in order, skipped while their circuit is
+    # open or they are over their per-worker sends/second budget
+    MAIL_PROVIDERS = os.getenv("MAIL_PROVIDERS", "mailgun,sendgrid")
+    MAIL_PROVIDER_RATE_LIMITS = os.getenv("MAIL_PROVIDER_RATE_LIMITS", "")
+    MAIL_CIRCUIT_FAILURE_RATE = float(os.getenv("MAIL_CIRCUIT_FAILURE_RATE", 0.5))
+    MAIL_CIRCUIT_MIN_CALLS = int(os.getenv("MAIL_CIRCUIT_MIN_CALLS", 5))
+    MAIL_CIRCUIT_WINDOW = int(os.getenv("MAIL_CIRCUIT_WINDOW", 20))
+    MAIL_CIRCUIT_RESET_SECONDS = float(os.getenv("MAIL_CIRCUIT_RESET_SECONDS", 30))
+    MAIL_FILE_DIR = os.getenv("MAIL_FILE_DIR", "outbox")
+
     # ===== Celery Urls
 
     # Celery — read directly from env, fall back to building from individual vars
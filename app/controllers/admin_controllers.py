@@ -13,6 +13,7 @@ from ..utils.exceptions import (
     GenericDatabaseError,
     InvalidCredentialsError,
     InvalidLoginAttemptError,
+    PasswordHasherBusyError,
     UserDoesNotExistError,
     UserExistError,
 )
@@ -56,6 +57,8 @@ class RegisterAdminController(Resource):
             return {"error": str(e.messages)}, 400
         except UserExistError as e:
             return {"error": f"{str(e)}"}, 409
+        except PasswordHasherBusyError as e:
+            return {"error": str(e)}, 503, {"Retry-After": "1"}
         except GenericDatabaseError as e:
             return {"error": f"{str(e)}"}, 500
 
@@ -90,6 +93,8 @@ class LoginAdminController(Resource):
             return {"error": str(e)}, 401
         except UserDoesNotExistError as e:
             return {"error": str(e)}, 404
+        except PasswordHasherBusyError as e:
+            return {"error": str(e)}, 503, {"Retry-After": "1"}
         except GenericDatabaseError as e:
             return {"db_error": str(e)}, 500
 
@@ -1,6 +1,3 @@
-import json
-import time
-
 from flasgger import swag_from
 from flask import Response, stream_with_context
 from flask_restful import Resource, request
@@ -8,32 +5,25 @@ from marshmallow import ValidationError
 
 from ..schemas.application import (
     ApplicationIdSchema,
+    BulkApplicationUpdateSchema,
     JobApplicationSchema,
+    JobApplicationsExportSchema,
+    JobIdSchema,
     JobPaginaNationSchema,
     JobUpdateSchema,
+    UserApplicationsQuerySchema,
 )
 from ..services.application_service import ApplicationService
-from ..utils.exceptions import GenericDatabaseError
+from ..services.application_stream_service import ApplicationStreamService
+from ..utils.exceptions import GenericDatabaseError, InvalidCredentialsError
+from ..utils.auth import current_email, current_profile_id, require_auth
+from ..utils.exports import export_response
 from ..utils.logger import Logger
 
 
-# Helpers
-def get_auth_token():
-    """Extract and validate the Bearer token from Authrization header"""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        Logger.warn("No authorizatio token in the header")
-        return {"validation_err": "Unauthorized"}, 401
-
-    parts = auth_header.split()
-    if len(parts) == 2 and parts[0].lower() == "bearer":
-        return parts[1]
-    else:
-        return {"error": "Invalid auth header format"}, 401
-
-
 class ApplicationsListController(Resource):
     @swag_from("../docs/get_jobs_applications.yml")
+    @require_auth
     def get(self):
         schema = JobPaginaNationSchema()
         try:
@@ -55,21 +45,59 @@ class ApplicationsListController(Resource):
             if job_id < 1:
                 job_id = 1
 
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                return token_or_error
-            token = token_or_error
-
             result = ApplicationService.get_all_job_applications(
-                token, job_id, limit, page_number
+                current_profile_id(), job_id, limit, page_number, args.get("cursor")
             )
             return {"info": result}, 200
         except Exception as e:
             return {"error": str(e)}, 400
 
 
+class ApplicationCountsController(Resource):
+    @swag_from("../docs/count_job_applications.yml")
+    @require_auth
+    def get(self):
+        schema = JobIdSchema()
+        try:
+            args = schema.load(request.args)
+            result = ApplicationService.count_job_applications(
+                current_profile_id(), args["job_id"]
+            )
+            return result, 200
+        except ValidationError as e:
+            Logger.warn(f"{str(e.messages)}")
+            return {"error": str(e.messages)}, 400
+        except InvalidCredentialsError as e:
+            return {"error": str(e)}, 403
+        except GenericDatabaseError as e:
+            Logger.warn(f"{str(e)}")
+            return {"error": str(e)}, 500
+
+
+class ApplicationsExportController(Resource):
+    @swag_from("../docs/export_job_applications.yml")
+    @require_auth
+    def get(self):
+        try:
+            args = JobApplicationsExportSchema().load(request.args)
+            rows = ApplicationService.export_job_applications(
+                current_profile_id(), args["job_id"]
+            )
+        except ValidationError as e:
+            return {"error": e.messages}, 400
+        except InvalidCredentialsError as e:
+            return {"error": str(e)}, 403
+        except GenericDatabaseError as e:
+            Logger.warn(f"{str(e)}")
+            return {"error": str(e)}, 500
+        return export_response(
+            rows, args["format"], f"job-{args['job_id']}-applications"
+        )
+
+
 class ApplicationsCreateController(Resource):
     @swag_from("../docs/create_application.yml")
+    @require_auth
     def post(self):
         schema = JobApplicationSchema()
         try:
@@ -78,17 +106,13 @@ class ApplicationsCreateController(Resource):
                 Logger.warn(f"Error with the payload {data}")
                 return {"error": "Bad request"}, 400
 
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                Logger.warn(f"Error {token_or_error} getting token from header")
-                return token_or_error
-
-            token = token_or_error
-
-            result = ApplicationService.make_application(token, data)
+            user_id = current_profile_id()
+            result = ApplicationService.make_application(
+                user_id, current_email(), data
+            )
             Logger.info(f"Affected rows {result}")
             if not result:
-                Logger.warn(f"application of {token} - {data} was not successful")
+                Logger.warn(f"application of {user_id} - {data} was not successful")
                 return {"error": "application was not successfull"}, 500
             return {"msg": "success"}, 201
         except ValidationError as e:
@@ -104,17 +128,22 @@ class ApplicationsCreateController(Resource):
 
 class UsersJobApplicationsController(Resource):
     @swag_from("../docs/get_user_applications.yml")
+    @require_auth
     def get(self):
+        schema = UserApplicationsQuerySchema()
         try:
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                Logger.warn(f"Error {token_or_error} getting token from header")
-                return token_or_error
-
-            token = token_or_error
-
-            result = ApplicationService.list_users_applications(token)
-            return {"applications": result}, 200
+            args = schema.load(request.args)
+            result = ApplicationService.list_users_applications(
+                current_profile_id(),
+                args["limit"],
+                args["cursor"],
+                args["status"],
+                args["include_cover_letter"],
+            )
+            return result, 200
+        except ValidationError as e:
+            Logger.warn(f"{str(e.messages)}")
+            return {"error": str(e.messages)}, 400
         except GenericDatabaseError as e:
             Logger.warn(f"{str(e)}")
             return {"error": str(e)}
@@ -131,27 +160,11 @@ class UserApplicationsStreamController(Resource):
 
         try:
             # Validate the token before opening the stream
-            ApplicationService.list_users_applications(token)
+            stream = ApplicationStreamService.open_user_stream(token)
         except Exception as e:
             return {"error": str(e)}, 401
 
-        def event_stream():
-            previous_data = None
-            while True:
-                try:
-                    applications = ApplicationService.list_users_applications(token)
-                    payload = {"applications": applications}
-                    data = json.dumps(payload)
-                    if data != previous_data:
-                        yield f"data: {data}\n\n"
-                        previous_data = data
-                except Exception:
-                    yield 'event: error\ndata: {"message":"Unable to fetch updates"}\n\n'
-                time.sleep(5)
-
-        return Response(
-            stream_with_context(event_stream()), mimetype="text/event-stream"
-        )
+        return Response(stream_with_context(stream), mimetype="text/event-stream")
 
 
 class AdminApplicationsStreamController(Resource):
@@ -165,34 +178,16 @@ class AdminApplicationsStreamController(Resource):
 
         try:
             # Validate access before opening the stream
-            ApplicationService.get_all_job_applications(token, job_id, 10, 1)
+            stream = ApplicationStreamService.open_admin_stream(token, job_id)
         except Exception as e:
             return {"error": str(e)}, 401
 
-        def event_stream():
-            previous_data = None
-            page = 1
-            limit = 10
-            while True:
-                try:
-                    payload = ApplicationService.get_all_job_applications(
-                        token, job_id, limit, page
-                    )
-                    data = json.dumps(payload)
-                    if data != previous_data:
-                        yield f"data: {data}\n\n"
-                        previous_data = data
-                except Exception:
-                    yield 'event: error\ndata: {"message":"Unable to fetch updates"}\n\n'
-                time.sleep(5)
-
-        return Response(
-            stream_with_context(event_stream()), mimetype="text/event-stream"
-        )
+        return Response(stream_with_context(stream), mimetype="text/event-stream")
 
 
 class UsersJobApplicationController(Resource):
     @swag_from("../docs/get_user_application.yml")
+    @require_auth
     def get(self, application_id):
         schema = ApplicationIdSchema()
         try:
@@ -201,15 +196,8 @@ class UsersJobApplicationController(Resource):
             if not isinstance(validated, dict):
                 return {"errors": f"error with {application_id}"}, 400
 
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                Logger.warn(f"Error {token_or_error} getting token from header")
-                return token_or_error
-
-            token = token_or_error
-
             result = ApplicationService.get_job_application(
-                token, validated["application_id"]
+                current_profile_id(), validated["application_id"]
             )
             if not result:
                 return {"msg": "No application found"}, 404
@@ -224,6 +212,7 @@ class UsersJobApplicationController(Resource):
 
 class ApplicationUpdateController(Resource):
     @swag_from("../docs/update_application.yml")
+    @require_auth
     def put(self, application_id):
         id_schema = ApplicationIdSchema()
         schema = JobUpdateSchema()
@@ -237,14 +226,8 @@ class ApplicationUpdateController(Resource):
             if not isinstance(payload, dict):
                 return {"errors": f"error validating payload {payload}"}, 400
 
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                Logger.warn(f"Error {token_or_error} getting token from header")
-                return token_or_error
-            token = token_or_error
-
             result = ApplicationService.update_an_application(
-                token, validated["application_id"], payload["status"]
+                current_profile_id(), validated["application_id"], payload["status"]
             )
             if not result:
                 return {"msg": f"Application {application_id} was not updated"}, 404
@@ -255,3 +238,27 @@ class ApplicationUpdateController(Resource):
         except Exception as e:
             Logger.warn(f"{str(e)}")
             return {"error": str(e)}, 400
+
+
+class ApplicationBulkUpdateController(Resource):
+    @swag_from("../docs/bulk_update_applications.yml")
+    @require_auth
+    def put(self):
+        schema = BulkApplicationUpdateSchema()
+        try:
+            payload = schema.load(request.get_json())
+            if not isinstance(payload, dict):
+                return {"errors": f"error validating payload {payload}"}, 400
+
+            result = ApplicationService.bulk_update_applications(
+                current_profile_id(), payload["application_ids"], payload["status"]
+            )
+            return result, 200
+        except ValidationError as e:
+            return {"errors": e.messages}, 400
+        except GenericDatabaseError as e:
+            Logger.warn(f"{str(e)}")
+            return {"error": str(e)}, 500
+        except Exception as e:
+            Logger.warn(f"{str(e)}")
+            return {"error": str(e)}, 400
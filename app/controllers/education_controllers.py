@@ -4,29 +4,15 @@ from marshmallow import ValidationError
 
 from ..schemas.education import EducationSchema
 from ..services.education_service import EducationService
+from ..utils.auth import current_profile_id, require_auth
 from ..utils.exceptions import GenericDatabaseError, GenericGenerateAuthTokenError
 from ..utils.logger import Logger
 
-# Helpers
-
-
-def get_auth_token():
-    """Extract and validate the Bearer token from Authrization header"""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        Logger.warn("No authorizatio token in the header")
-        return {"validation_err": "Unauthorized"}, 401
-
-    parts = auth_header.split()
-    if len(parts) == 2 and parts[0].lower() == "bearer":
-        return parts[1]
-    else:
-        return {"error": "Invalid auth header format"}, 401
-
 
 class EducationController(Resource):
 
     @swag_from("../docs/create_education.yml")
+    @require_auth
     def post(self):
         try:
             schema = EducationSchema()
@@ -36,13 +22,9 @@ class EducationController(Resource):
                 Logger.warn(f"Payload error: expected object got {payload}")
                 return {"msg": "Payload error: expected object got list or None"}, 400
 
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                return {"error": f"{token_or_error}"}, 400
-
-            token = token_or_error
-
-            row_count = EducationService.create_education(token, payload)
+            row_count = EducationService.create_education(
+                current_profile_id(), payload
+            )
             if row_count < 1:
                 return {"error": f"Failed to create education for {payload}"}, 500
 
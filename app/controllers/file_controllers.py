@@ -2,35 +2,13 @@ from flask import current_app, request
 from flask_restful import Resource
 
 from ..services.file_service import FileService
-from ..utils.exceptions import InvalidCredentialsError
+from ..utils.auth import require_auth
 from ..utils.logger import Logger
-from ..utils.security import Security
-
-
-# Helpers
-def get_auth_token():
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        Logger.warn("No authorization token in the header")
-        return {"validation_err": "Unauthorized"}, 401
-
-    parts = auth_header.split()
-    if len(parts) == 2 and parts[0].lower() == "bearer":
-        return parts[1]
-    return {"error": "Invalid auth header format"}, 401
 
 
 class FileUploadController(Resource):
+    @require_auth
     def post(self):
-        token_or_error = get_auth_token()
-        if isinstance(token_or_error, tuple):
-            return token_or_error
-
-        token = token_or_error
-        decoded = Security.decode_jwt_token(token)
-        if not decoded or not decoded.get("profile_id"):
-            raise InvalidCredentialsError("Invalid upload credentials")
-
         if "file" not in request.files:
             return {"error": "Missing file upload"}, 400
 
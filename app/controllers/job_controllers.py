@@ -1,42 +1,30 @@
 from flasgger import swag_from
+from flask import current_app
 from flask_restful import Resource, request
 from marshmallow import ValidationError
 
-from ..schemas.job import JobIdSchema, JobSchema, JobUpdateSchema, PaginationSchema
+from ..schemas.job import (
+    ExportSchema,
+    JobIdSchema,
+    JobSchema,
+    JobSearchSchema,
+    JobUpdateSchema,
+    PaginationSchema,
+)
 from ..services.job_service import JobService
+from ..utils.auth import current_profile_id, require_auth
+from ..utils.exceptions import InvalidLoginAttemptError
+from ..utils.exports import export_response
+from ..utils.job_import import READERS
 from ..utils.logger import Logger
 
 
-# Helpers
-def get_auth_token():
-    """Extract and validate the Bearer token from Authrization header"""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        Logger.warn("No authorizatio token in the header")
-        return {"validation_err": "Unauthorized"}, 401
-
-    parts = auth_header.split()
-    if len(parts) == 2 and parts[0].lower() == "bearer":
-        return parts[1]
-    else:
-        return {"error": "Invalid auth header format"}, 401
-
-
 class PostJobController(Resource):
 
     @swag_from("../docs/create_job.yml")
+    @require_auth
     def post(self):
         try:
-            token_or_error = get_auth_token()
-
-            # Check if flask returns a tuple or dict
-            # this is how flask return errors
-            if isinstance(token_or_error, tuple):
-                return token_or_error
-
-            # if it is a string assign token_or_error to token
-            token = token_or_error
-
             job_schema = JobSchema()
             payload = job_schema.load(request.get_json())
 
@@ -48,7 +36,7 @@ class PostJobController(Resource):
             data = {
                 "title": payload["title"],
                 "description": details["description"],
-                "token": token,
+                "admin_id": current_profile_id(),
                 **payload["details"],
             }
 
@@ -63,6 +51,35 @@ class PostJobController(Resource):
             return {"validation_err": str(e)}, 400
 
 
+class ImportJobsController(Resource):
+
+    @swag_from("../docs/import_jobs.yml")
+    @require_auth
+    def post(self):
+        reader = READERS.get(request.mimetype)
+        if reader is None:
+            return {
+                "error": f"Unsupported content type {request.mimetype!r}, "
+                f"send one of {', '.join(READERS)}"
+            }, 415
+
+        try:
+            result = JobService.import_jobs(
+                current_profile_id(),
+                reader(request.stream),
+                chunk_size=int(current_app.config.get("JOBS_IMPORT_CHUNK_SIZE", 200)),
+                max_rows=int(current_app.config.get("JOBS_IMPORT_MAX_ROWS", 5000)),
+            )
+            return result, 200
+        except InvalidLoginAttemptError as e:
+            return {"error": str(e)}, 401
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        except Exception as e:
+            Logger.warn(f"Job import failed: {str(e)}")
+            return {"error": str(e)}, 500
+
+
 class JobsListController(Resource):
 
     @swag_from("../docs/get_jobs.yml")
@@ -84,12 +101,34 @@ class JobsListController(Resource):
             if page_number < 1:
                 page_number = 1
 
-            result = JobService.fetch_jobs(page_number, limit)
+            result = JobService.fetch_jobs(page_number, limit, args["cursor"])
             return {"result": result}, 200
         except Exception as e:
             return {"error": str(e)}, 400
 
 
+class JobsSearchController(Resource):
+
+    @swag_from("../docs/search_jobs.yml")
+    def get(self):
+        try:
+            schema = JobSearchSchema()
+            args = schema.load(request.args)
+            if not isinstance(args, dict):
+                Logger.warn(f"Error with the args dict {args}")
+                return {"error": "Bad request"}, 400
+
+            page_number = args.pop("page")
+            limit = args.pop("limit")
+
+            result = JobService.search_jobs(args, page_number, limit)
+            return {"result": result}, 200
+        except ValidationError as e:
+            return {"error": str(e.messages)}, 400
+        except Exception as e:
+            return {"error": str(e)}, 400
+
+
 class JobObjectController(Resource):
     @swag_from("../docs/get_job.yml")
     def get(self, job_id):
@@ -110,6 +149,7 @@ class JobObjectController(Resource):
 
 class AdminJobsListController(Resource):
     @swag_from("../docs/get_jobs.yml")
+    @require_auth
     def get(self):
         try:
             schema = PaginationSchema()
@@ -126,12 +166,9 @@ class AdminJobsListController(Resource):
             if page_number < 1:
                 page_number = 1
 
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                return token_or_error
-            token = token_or_error
-
-            result = JobService.fetch_admin_jobs(token, page_number, limit)
+            result = JobService.fetch_admin_jobs(
+                current_profile_id(), page_number, limit, args["cursor"]
+            )
             return {"result": result}, 200
         except ValidationError as e:
             return {"error": str(e)}, 400
@@ -139,8 +176,23 @@ class AdminJobsListController(Resource):
             return {"error": str(e)}, 400
 
 
+class AdminJobsExportController(Resource):
+    @swag_from("../docs/export_jobs.yml")
+    @require_auth
+    def get(self):
+        try:
+            args = ExportSchema().load(request.args)
+            rows = JobService.export_admin_jobs(current_profile_id())
+        except ValidationError as e:
+            return {"error": e.messages}, 400
+        except InvalidLoginAttemptError as e:
+            return {"error": str(e)}, 401
+        return export_response(rows, args["format"], "jobs")
+
+
 class ModifyJobObjectController(Resource):
     @swag_from("../docs/update_job.yml")
+    @require_auth
     def put(self, job_id):
         update_schema = JobUpdateSchema()
         id_schema = JobIdSchema()
@@ -153,16 +205,10 @@ class ModifyJobObjectController(Resource):
             if not isinstance(validated, dict):
                 return {"error": "invalid payload"}, 400
 
-            token_or_error = get_auth_token()
-            if isinstance(token_or_error, tuple):
-                return token_or_error
-
             id = int(validated["job_id"])
-            token = token_or_error
-
             data = {**payload}
 
-            job = JobService.update_job(id, token, data)
+            job = JobService.update_job(id, current_profile_id(), data)
             if not job:
                 return {"msg": "error job not found"}, 401
             return job, 200
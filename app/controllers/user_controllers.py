@@ -20,10 +20,12 @@ from ..services.user_service import UserService
 from ..utils.exceptions import (
     GenericDatabaseError,
     InvalidCredentialsError,
+    PasswordHasherBusyError,
     UserExistError,
 )
 from ..utils.helpers import Helpers
 from ..utils.logger import Logger
+from ..utils.metrics import Metrics
 from ..utils.security import Security
 
 
@@ -46,6 +48,16 @@ class CheckAppHealthController(Resource):
         }, 200
 
 
+class AppMetricsController(Resource):
+    """Get the runtime metrics of the worker serving the request"""
+
+    @swag_from("../docs/get_metrics.yml")
+    def get(self):
+        """Get pool sizes, counters and timers"""
+
+        return {"data": Metrics.snapshot()}, 200
+
+
 class RegisterUserController(Resource):
     register_schema = RegisterSchema()
 
@@ -102,6 +114,10 @@ class RegisterUserController(Resource):
             Logger.warn(f"User already exists: {email}-{e}")
             return {"user_error": str(e)}, 400
 
+        except PasswordHasherBusyError as e:
+            Logger.warn(f"Registration for {email} shed, bcrypt pool busy: {e}")
+            return {"error": str(e)}, 503, {"Retry-After": "1"}
+
         except GenericDatabaseError as e:
             Logger.error(f"Database error during registration for {email}-{str(e)}")
             return {"db_error": str(e)}, 500
@@ -156,6 +172,9 @@ class LoginUserController(Resource):
         except InvalidCredentialsError as e:
             Logger.warn(f"Invalid credentials error {str(e)}")
             return {"credentials_error": str(e)}, 401
+        except PasswordHasherBusyError as e:
+            Logger.warn(f"Login shed, bcrypt pool busy: {str(e)}")
+            return {"error": str(e)}, 503, {"Retry-After": "1"}
         except Exception as e:
             Logger.exception(f"Unexpected error during login {str(e)}")
             return {"generic_error": str(e)}, 500
@@ -321,6 +340,9 @@ class ResetUserPasswordController(Resource):
                 Logger.error(f"Failed to reset password for {email}")
                 return {"error": f"Failed to reset password for {email}"}, 500
             return {"msg": "Password changed successfully"}, 200
+        except PasswordHasherBusyError as e:
+            Logger.warn(f"Password reset shed, bcrypt pool busy: {str(e)}")
+            return {"error": str(e)}, 503, {"Retry-After": "1"}
         except Exception as e:
             Logger.exception(f"Unexpected error {str(e)} occurred")
             return {"generic_error": str(e)}, 500
@@ -1,42 +1,85 @@
+import os
+import threading
+
 import pymysql
 from flask import current_app, g
 
+from app.db.pool import ConnectionPool
 from app.utils.exceptions import GenericDatabaseError
 from app.utils.logger import Logger
+from app.utils.metrics import Metrics
 
 
 class DB:
+    _pool: ConnectionPool | None = None
+    _pool_lock = threading.Lock()
+
+    @staticmethod
+    def connect(config):
+        """Open a single MySQL connection from the app config."""
+        return pymysql.connect(
+            host=config["DB_HOST"],
+            port=int(config["DB_PORT"]),
+            user=config["DB_USER"],
+            password=config["DB_PASSWORD"],
+            database=config["DB_NAME"],
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=False,
+            ssl={},
+            connect_timeout=10,
+        )
+
+    @staticmethod
+    def get_pool() -> ConnectionPool:
+        """
+        Return the connection pool of the current worker process.
+        The pool is created lazily and rebuilt after fork() so gunicorn
+        workers never share sockets with the master process.
+        """
+        pool = DB._pool
+        if pool is not None and pool.pid == os.getpid():
+            return pool
+
+        with DB._pool_lock:
+            pool = DB._pool
+            if pool is None or pool.pid != os.getpid():
+                config = dict(current_app.config)
+                pool = ConnectionPool(
+                    connect=lambda: DB.connect(config),
+                    min_size=int(config.get("DB_POOL_MIN_SIZE", 1)),
+                    max_size=int(config.get("DB_POOL_MAX_SIZE", 10)),
+                    idle_timeout=float(config.get("DB_POOL_IDLE_TIMEOUT", 300)),
+                    checkout_timeout=float(config.get("DB_POOL_TIMEOUT", 10)),
+                    health_check_interval=float(
+                        config.get("DB_POOL_HEALTH_CHECK_INTERVAL", 30)
+                    ),
+                )
+                pool.warm()
+                DB._pool = pool
+                Metrics.register_gauge("db_pool", DB.pool_stats)
+        return pool
+
+    @staticmethod
+    def pool_stats() -> dict:
+        pool = DB._pool
+        if pool is None or pool.pid != os.getpid():
+            return {}
+        return pool.stats()
+
     @staticmethod
     def get_db():
         if "db" not in g:
             try:
-                g.db = pymysql.connect(
-                    host=current_app.config["DB_HOST"],
-                    port=int(current_app.config["DB_PORT"]),
-                    user=current_app.config["DB_USER"],
-                    password=current_app.config["DB_PASSWORD"],
-                    database=current_app.config["DB_NAME"],
-                    cursorclass=pymysql.cursors.DictCursor,
-                    autocommit=False,
-                    ssl={},
-                    connect_timeout=10,
-                )
+                g.db = DB.get_pool().acquire()
             except pymysql.MySQLError as e:
                 Logger.error(f"MySQL connection error: {str(e)}")
                 raise GenericDatabaseError(
                     f"Database connection error because of {str(e)}"
                 )
-        else:
-            try:
-                g.db.ping(reconnect=True)
-            except Exception:
-                Logger.warn("Reconnecting to MySQL ...")
-                g.pop("db")
-                return DB.get_db()
         return g.db
 
     @staticmethod
     def close_db(e=None):
         db = g.pop("db", None)
         if db is not None:
-            db.close()
+            DB.get_pool().release(db)
@@ -0,0 +1,209 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from pymysql.constants import SERVER_STATUS
+
+from ..utils.exceptions import DatabasePoolExhaustedError
+from ..utils.logger import Logger
+from ..utils.metrics import Metrics
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of pymysql connections.
+
+    One pool lives in each worker process. Connections are handed out LIFO so
+    the warmest socket is reused first, idle connections above ``min_size``
+    are closed after ``idle_timeout`` seconds and a connection that has been
+    idle longer than ``health_check_interval`` is pinged before checkout.
+    A pool created in a parent process is never reused after ``fork()``;
+    ``DB.get_pool`` compares ``pid`` and builds a fresh pool instead.
+    """
+
+    def __init__(
+        self,
+        connect: Callable,
+        min_size: int = 1,
+        max_size: int = 10,
+        idle_timeout: float = 300,
+        checkout_timeout: float = 10,
+        health_check_interval: float = 30,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._connect = connect
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.pid = os.getpid()
+
+        # (connection, last_used_monotonic) - right end is the most recent
+        self._idle: deque = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+
+    # ---------- public api ----------
+    def acquire(self):
+        """Check a connection out, creating one if the pool is not full."""
+        deadline = time.monotonic() + self.checkout_timeout
+        Metrics.incr("db_pool.checkouts")
+
+        while True:
+            conn, last_used = self._checkout(deadline)
+            if conn is None:
+                return self._create()
+
+            idle_for = time.monotonic() - last_used
+            if idle_for < self.health_check_interval or self._is_healthy(conn):
+                return conn
+
+            Metrics.incr("db_pool.health_check_failures")
+            Logger.warn("Discarding dead MySQL connection from pool")
+            self._discard(conn)
+
+    def release(self, conn, discard: bool = False) -> None:
+        """Return a connection to the pool, rolling back any open transaction."""
+        if conn is None:
+            return
+
+        if os.getpid() != self.pid:
+            # Connection was inherited over fork(), it belongs to the parent.
+            return
+
+        if not discard and conn.open:
+            try:
+                if conn.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                    conn.rollback()
+            except Exception as e:
+                Logger.warn(f"Rollback on pool release failed: {str(e)}")
+                discard = True
+        else:
+            discard = True
+
+        if discard:
+            self._discard(conn)
+            return
+
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def warm(self) -> None:
+        """Open connections up to ``min_size``. Failures are logged, not raised."""
+        while True:
+            with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._create()
+            except Exception as e:
+                Logger.warn(f"Could not pre-fill MySQL pool: {str(e)}")
+                return
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close every idle connection. Checked-out ones are closed on release."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            idle = len(self._idle)
+            size = self._size
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "pid": self.pid,
+        }
+
+    # ---------- internals ----------
+    def _checkout(self, deadline: float):
+        """
+        Returns ``(conn, last_used)`` for an idle connection or ``(None, None)``
+        when the caller reserved a slot and must create the connection itself.
+        """
+        waited = False
+        with self._cond:
+            while True:
+                self._reap_idle()
+                if self._idle:
+                    return self._idle.pop()
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None, None
+
+                if not waited:
+                    waited = True
+                    Metrics.incr("db_pool.waits")
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    Metrics.incr("db_pool.timeouts")
+                    raise DatabasePoolExhaustedError(
+                        f"No MySQL connection available after {self.checkout_timeout}s"
+                    )
+                self._cond.wait(remaining)
+
+    def _create(self):
+        """Open a connection for a slot the caller already reserved in ``_size``."""
+        try:
+            with Metrics.timer("db_pool.connect"):
+                conn = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        Metrics.incr("db_pool.creates")
+        return conn
+
+    def _reap_idle(self) -> None:
+        """Close idle connections past ``idle_timeout``. Caller holds the lock."""
+        now = time.monotonic()
+        while (
+            self._idle
+            and self._size > self.min_size
+            and now - self._idle[0][1] > self.idle_timeout
+        ):
+            conn, _ = self._idle.popleft()
+            self._size -= 1
+            Metrics.incr("db_pool.idle_closed")
+            self._close_quietly(conn)
+
+    def _discard(self, conn) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+        Metrics.incr("db_pool.discards")
+        self._close_quietly(conn)
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
@@ -1,46 +1,173 @@
+import socket
+import threading
+
 import redis
-from flask import current_app, g
+import redis.asyncio
+from flask import current_app
+
+from app.utils.metrics import Metrics
+
+
+class MeteredConnectionPool(redis.BlockingConnectionPool):
+    """
+    Blocking pool that records checkout waits and exhaustion.
+    Callers wait up to ``timeout`` seconds for a free connection
+    instead of failing as soon as ``max_connections`` are in use.
+    """
+
+    def get_connection(self, *args, **kwargs):
+        try:
+            with Metrics.timer("redis.pool.checkout"):
+                return super().get_connection(*args, **kwargs)
+        except redis.ConnectionError as e:
+            if "No connection available" in str(e):
+                Metrics.incr("redis.pool.exhausted")
+            raise
+
+    def stats(self) -> dict:
+        with self._lock:
+            created = len(self._connections)
+            idle = sum(1 for conn in list(self.pool.queue) if conn is not None)
+        return {
+            "max_size": self.max_connections,
+            "created": created,
+            "idle": idle,
+            "in_use": created - idle,
+        }
 
 
 class Cache:
+    _pool: MeteredConnectionPool | None = None
+    _client: redis.Redis | None = None
+    _pool_lock = threading.Lock()
 
     @staticmethod
-    def connect_redis():
+    def connection_options(config) -> dict:
+        """Socket settings shared by the sync pool and the asyncio client."""
+        options = {
+            "decode_responses": True,
+            "socket_timeout": float(config.get("REDIS_SOCKET_TIMEOUT", 5)),
+            "socket_connect_timeout": float(
+                config.get("REDIS_SOCKET_CONNECT_TIMEOUT", 5)
+            ),
+            "health_check_interval": int(config.get("REDIS_HEALTH_CHECK_INTERVAL", 30)),
+        }
+        if config.get("REDIS_SOCKET_KEEPALIVE", True):
+            options["socket_keepalive"] = True
+            # Linux only; other platforms keep the kernel defaults
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                options["socket_keepalive_options"] = {
+                    socket.TCP_KEEPIDLE: 60,
+                    socket.TCP_KEEPINTVL: 10,
+                    socket.TCP_KEEPCNT: 3,
+                }
+        return options
+
+    @staticmethod
+    def create_pool(config) -> MeteredConnectionPool:
+        """Build a connection pool from an app config mapping."""
+        options = Cache.connection_options(config)
+        options["max_connections"] = int(config.get("REDIS_POOL_MAX_SIZE", 20))
+        options["timeout"] = float(config.get("REDIS_POOL_TIMEOUT", 5))
+
+        # Supports full URL if provided (Upstash, Railway, Render etc)
+        # Check if the ENV is not dev
+        if config.get("ENV") != "dev":
+            redis_url = config.get("REDIS_URL")
+            if not redis_url:
+                raise ValueError("REDIS_URL string not provided!")
+            return MeteredConnectionPool.from_url(redis_url, **options)
+
+        # Fallback to individul config values (local dev)
+        password = config.get("REDIS_PASSWORD")
+        username = config.get("REDIS_USERNAME", "default")
+        if config.get("REDIS_TLS", False):
+            options["connection_class"] = redis.SSLConnection
+        return MeteredConnectionPool(
+            host=config.get("REDIS_HOST", "localhost"),
+            port=config.get("REDIS_PORT", 6379),
+            db=config.get("REDIS_DB", 0),
+            username=username if username else None,
+            password=password if password else None,
+            **options,
+        )
+
+    @staticmethod
+    def get_pool(config=None) -> MeteredConnectionPool:
         """
-        Return a Redis client bound to the current context
-        Reuse it if already exists in global request context (g)
-        (g) only exists for a lifetime of a request.
+        Return the process-wide connection pool, created on first use.
+        redis-py pools check their pid on every checkout and drop the
+        parent's sockets after fork(), so the same pool object (and the
+        rate limiter holding a reference to it) stays valid in every
+        gunicorn worker.
         """
-        if "redis" not in g:
-            # Supports full URL if provided (Upstash, Railway, Render etc)
-            # Check if the ENV is not dev
-            if current_app.config.get("ENV") != "dev":
-                redis_url = current_app.config.get("REDIS_URL")
-                if not redis_url:
-                    raise ValueError("REDIS_URL string not provided!")
-                g.redis = redis.from_url(redis_url, decode_response=True)
-            else:
-                # Fallback to individul config values (local dev)
-                password = current_app.config.get("REDIS_PASSWORD")
-                username = current_app.config.get("REDIS_USERNAME", "default")
-                host = current_app.config.get("REDIS_HOST", "localhost")
-                port = current_app.config.get("REDIS_PORT", 6379)
-                db = current_app.config.get("REDIS_DB", 0)
-                ssl = current_app.config.get("REDIS_TLS", False)
-                g.redis = redis.Redis(
-                    host=host,
-                    port=port,
-                    db=db,
-                    username=username if username else None,
-                    password=password if password else None,
-                    ssl=ssl,
-                    decode_responses=True,
+        pool = Cache._pool
+        if pool is not None:
+            return pool
+
+        with Cache._pool_lock:
+            if Cache._pool is None:
+                Cache._pool = Cache.create_pool(
+                    current_app.config if config is None else config
                 )
-        return g.redis
+                Metrics.register_gauge("redis_pool", Cache.pool_stats)
+        return Cache._pool
+
+    @staticmethod
+    def pool_stats() -> dict:
+        pool = Cache._pool
+        return pool.stats() if pool is not None else {}
+
+    @staticmethod
+    def create_client(config):
+        """
+        Redis client on the shared pool for an app config mapping.
+        Used directly by long lived consumers that live outside
+        a request context (e.g. the pub/sub event hub).
+        """
+        return redis.Redis(connection_pool=Cache.get_pool(config))
+
+    @staticmethod
+    def create_async_client(config):
+        """Same settings as ``create_client`` for the asyncio stream server."""
+        options = Cache.connection_options(config)
+        options["max_connections"] = int(config.get("REDIS_POOL_MAX_SIZE", 20))
+        # ``pubsub.listen()`` blocks on a read between events
+        options.pop("socket_timeout")
+        if config.get("ENV") != "dev":
+            redis_url = config.get("REDIS_URL")
+            if not redis_url:
+                raise ValueError("REDIS_URL string not provided!")
+            return redis.asyncio.from_url(redis_url, **options)
+
+        password = config.get("REDIS_PASSWORD")
+        username = config.get("REDIS_USERNAME", "default")
+        return redis.asyncio.Redis(
+            host=config.get("REDIS_HOST", "localhost"),
+            port=config.get("REDIS_PORT", 6379),
+            db=config.get("REDIS_DB", 0),
+            username=username if username else None,
+            password=password if password else None,
+            ssl=config.get("REDIS_TLS", False),
+            **options,
+        )
+
+    @staticmethod
+    def connect_redis():
+        """
+        Return the process-wide Redis client.
+        Commands borrow a pooled connection and hand it back as soon
+        as they complete, so nothing needs closing per request.
+        """
+        client = Cache._client
+        if client is None:
+            client = Cache._client = Cache.create_client(current_app.config)
+        return client
 
     @staticmethod
-    def close_redis(e=None):
-        """Close Redis connection at the end of request"""
-        client = g.pop("redis", None)
-        if client is not None:
-            client.close()
+    def reset():
+        """Disconnect and forget the pool (tests, shutdown)."""
+        with Cache._pool_lock:
+            pool, Cache._pool, Cache._client = Cache._pool, None, None
+        if pool is not None:
+            pool.disconnect()
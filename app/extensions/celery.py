@@ -3,6 +3,7 @@ import ssl
 
 from celery import Celery
 from dotenv import load_dotenv
+from kombu import Exchange, Queue
 
 load_dotenv()
 
@@ -43,10 +44,100 @@ celery = Celery(
     backend=result_backend,
 )
 
+# Enqueueing a task reuses a pooled, heartbeat-kept broker connection and
+# waits for the publisher confirm instead of handshaking per message
+celery.conf.broker_pool_limit = int(os.getenv("CELERY_BROKER_POOL_LIMIT", "10"))
+celery.conf.broker_heartbeat = int(os.getenv("RABBITMQ_HEARTBEAT", "60"))
+celery.conf.broker_connection_retry_on_startup = True
+celery.conf.broker_transport_options = {"confirm_publish": True}
+celery.conf.task_publish_retry = True
+celery.conf.task_publish_retry_policy = {
+    "max_retries": 3,
+    "interval_start": 0,
+    "interval_step": 0.2,
+    "interval_max": 1,
+}
+
+# ===== Queues, routing and delivery guarantees =====
+# Mail is split by urgency so a verification code never waits behind a
+# backlog of status-change notifications. Each queue can get its own
+# worker pool (see celery_worker.py); priorities order messages within
+# a queue when one worker consumes several.
+QUEUE_AUTH = "mail.auth"
+QUEUE_RESET = "mail.reset"
+QUEUE_NOTIFICATIONS = "mail.notifications"
+QUEUE_DEFAULT = "default"
+
+PRIORITY_AUTH = 9
+PRIORITY_RESET = 6
+PRIORITY_NOTIFICATIONS = 3
+MAX_PRIORITY = 10
+
+_exchange = Exchange("tasks", type="direct")
+celery.conf.task_queues = [
+    Queue(
+        name,
+        _exchange,
+        routing_key=name,
+        queue_arguments={"x-max-priority": MAX_PRIORITY},
+    )
+    for name in (QUEUE_AUTH, QUEUE_RESET, QUEUE_NOTIFICATIONS, QUEUE_DEFAULT)
+]
+celery.conf.task_default_queue = QUEUE_DEFAULT
+celery.conf.task_default_exchange = "tasks"
+celery.conf.task_default_routing_key = QUEUE_DEFAULT
+celery.conf.task_default_priority = PRIORITY_NOTIFICATIONS
+celery.conf.task_queue_max_priority = MAX_PRIORITY
+# Bulk mail unless the caller routes it elsewhere (NotificationService does)
+celery.conf.task_routes = {
+    "app.utils.mails.*": {"queue": QUEUE_NOTIFICATIONS},
+    "app.services.notification_service.*": {"queue": QUEUE_NOTIFICATIONS},
+}
+
+# A task is acknowledged after it ran, so a worker killed mid-send hands
+# the message back instead of losing it; mail tasks must tolerate a rerun
+celery.conf.task_acks_late = True
+celery.conf.task_reject_on_worker_lost = True
+# Reserve one message per process: long sends do not strand a prefetched
+# verification code behind them, and priorities stay meaningful
+celery.conf.worker_prefetch_multiplier = int(
+    os.getenv("CELERY_PREFETCH_MULTIPLIER", "1")
+)
+# Per worker process cap on provider calls (e.g. "100/s"); unset = no cap.
+# MAIL_PROVIDER_RATE_LIMITS splits traffic between providers on top of it
+mail_rate_limit = os.getenv("CELERY_MAIL_RATE_LIMIT")
+if mail_rate_limit:
+    celery.conf.task_annotations = {
+        "app.utils.mails.send_mail_task": {"rate_limit": mail_rate_limit},
+        "app.utils.mails.send_batch_task": {"rate_limit": mail_rate_limit},
+    }
+
+# ===== Results =====
+# Nothing reads the outcome of a mail or digest task, so by default no
+# result is written to Redis at all. A task whose result is needed opts
+# in with ``@celery.task(ignore_result=False)`` (or a single call with
+# ``apply_async(..., ignore_result=False)``); those results expire after
+# CELERY_RESULT_EXPIRES seconds. Keys left from before this policy are
+# removed with ``make celery-purge-results``.
+RESULT_KEY_PREFIX = "celery-task-meta-"
+celery.conf.task_ignore_result = True
+celery.conf.task_store_errors_even_if_ignored = False
+celery.conf.result_expires = int(os.getenv("CELERY_RESULT_EXPIRES", "3600"))
+
 if broker_url.startswith("amqps://"):
     # SSL settings for
     celery.conf.broker_use_ssl = {"cert_reqs": ssl.CERT_NONE}
 
+# The result backend keeps its own pool (celery builds the client);
+# size it and keep idle sockets alive like the app's Redis pool
+celery.conf.redis_max_connections = int(os.getenv("REDIS_POOL_MAX_SIZE", "20"))
+celery.conf.redis_socket_keepalive = (
+    os.getenv("REDIS_SOCKET_KEEPALIVE", "true").lower() == "true"
+)
+celery.conf.redis_backend_health_check_interval = int(
+    os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30")
+)
+
 if result_backend.startswith("rediss://"):
     celery.conf.redis_backend_use_ssl = {"ssl_cert_reqs": ssl.CERT_NONE}
 
@@ -0,0 +1,74 @@
+import argparse
+
+from .celery import RESULT_KEY_PREFIX, celery
+
+
+def purge_results(
+    client, keep_expiring: bool = False, batch_size: int = 500, dry_run: bool = False
+) -> dict:
+    """
+    Delete stored Celery task results from the result backend.
+
+    Every ``celery-task-meta-*`` key is removed by default. Results left
+    over from before results were disabled were written with SETEX and
+    Celery's one-day expiry, so they carry a TTL too and can't be told
+    apart from the results of tasks that opted in. Pass ``keep_expiring``
+    while such a task has results in flight to keep every key with a TTL
+    and delete only those without one. Keys are scanned and unlinked in
+    batches so the server is never blocked.
+    """
+    scanned = deleted = 0
+    for batch in _batches(
+        client.scan_iter(match=f"{RESULT_KEY_PREFIX}*", count=batch_size), batch_size
+    ):
+        scanned += len(batch)
+        if keep_expiring:
+            pipe = client.pipeline(transaction=False)
+            for key in batch:
+                pipe.ttl(key)
+            batch = [key for key, ttl in zip(batch, pipe.execute()) if ttl == -1]
+        if batch and not dry_run:
+            client.unlink(*batch)
+        deleted += len(batch)
+    return {"scanned": scanned, "deleted": deleted}
+
+
+def _batches(keys, size: int):
+    batch = []
+    for key in keys:
+        batch.append(key)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.extensions.celery_results",
+        description="Remove stored Celery task results from the result backend.",
+    )
+    parser.add_argument(
+        "--keep-expiring",
+        action="store_true",
+        help="keep results that have an expiry, e.g. from tasks that opted in",
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="count the keys, delete nothing"
+    )
+    args = parser.parse_args(argv)
+
+    counts = purge_results(
+        celery.backend.client,
+        keep_expiring=args.keep_expiring,
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+    )
+    verb = "would delete" if args.dry_run else "deleted"
+    print(f"Scanned {counts['scanned']} result keys, {verb} {counts['deleted']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+Process-wide Redis pub/sub fan-out for the Server-Sent Event streams.
+
+Instead of every open stream polling MySQL, each worker process runs a
+single background thread subscribed to ``applications:*``. Incoming events
+are copied into the bounded queue of every stream listening on that
+channel, so an idle stream costs no database queries and no Redis
+round trips.
+
+Backpressure: a stream that cannot keep up overflows its queue; pending
+events are then dropped and the stream gets one ``resync`` marker instead,
+which tells it to reload its snapshot. The same marker is broadcast after
+the subscriber reconnects to Redis, because events published while it was
+disconnected are lost.
+
+``AsyncEventHub`` is the same fan-out for the asyncio stream server
+(``app.asgi``): one pub/sub task per event loop and ``asyncio.Queue``
+buffers, so open streams hold no threads at all.
+"""
+
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Callable
+
+from flask import current_app
+
+from ..db.redis import Cache
+from ..repositories.application_events import CHANNEL_PATTERN
+from ..utils.logger import Logger
+from ..utils.metrics import Metrics
+
+RESYNC = {"type": "resync"}
+
+
+def decode_message(message: dict | None) -> dict | None:
+    if message is None or message.get("type") != "pmessage":
+        return None
+    try:
+        return json.loads(message["data"])
+    except (TypeError, ValueError):
+        Logger.warn(f"Dropping malformed event on {message['channel']}")
+        return None
+
+
+class Subscription:
+    """One stream's view of a channel. Only the stream thread calls ``get``."""
+
+    def __init__(self, hub: "EventHub", channel: str, maxsize: int):
+        self.hub = hub
+        self.channel = channel
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._overflowed = threading.Event()
+
+    def put(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self._overflowed.set()
+            Metrics.incr("event_hub.overflows")
+
+    def get(self, timeout: float) -> dict | None:
+        """Next event, ``RESYNC`` after an overflow, or None on timeout."""
+        if self._overflowed.is_set():
+            self._overflowed.clear()
+            self._drain()
+            return RESYNC
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+
+class EventHub:
+    _instance: "EventHub | None" = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, client_factory: Callable, pattern: str = CHANNEL_PATTERN):
+        self._client_factory = client_factory
+        self.pattern = pattern
+        self.pid = os.getpid()
+        self._subs: dict[str, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    @staticmethod
+    def instance() -> "EventHub":
+        """The hub of the current worker process, rebuilt after fork()."""
+        hub = EventHub._instance
+        if hub is not None and hub.pid == os.getpid():
+            return hub
+
+        with EventHub._instance_lock:
+            hub = EventHub._instance
+            if hub is None or hub.pid != os.getpid():
+                config = dict(current_app.config)
+                hub = EventHub(lambda: Cache.create_client(config))
+                EventHub._instance = hub
+                Metrics.register_gauge("event_hub", EventHub.stats)
+        return hub
+
+    @staticmethod
+    def stats() -> dict:
+        hub = EventHub._instance
+        if hub is None or hub.pid != os.getpid():
+            return {}
+        with hub._lock:
+            streams = sum(len(subs) for subs in hub._subs.values())
+            channels = len(hub._subs)
+        return {"streams": streams, "channels": channels}
+
+    def subscribe(self, channel: str, maxsize: int = 100) -> Subscription:
+        sub = Subscription(self, channel, maxsize)
+        with self._lock:
+            self._subs[channel].add(sub)
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="event-hub", daemon=True
+                )
+                self._thread.start()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.channel)
+            if subs is None:
+                return
+            subs.discard(sub)
+            if not subs:
+                del self._subs[sub.channel]
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def dispatch(self, channel: str, event: dict) -> None:
+        with self._lock:
+            subs = list(self._subs.get(channel, ()))
+        for sub in subs:
+            sub.put(event)
+        Metrics.incr("event_hub.delivered", len(subs))
+
+    def _broadcast(self, event: dict) -> None:
+        with self._lock:
+            subs = [sub for subs in self._subs.values() for sub in subs]
+        for sub in subs:
+            sub.put(event)
+
+    def _run(self) -> None:
+        backoff = 1
+        connected_before = False
+        while not self._stopped.is_set():
+            pubsub = None
+            try:
+                pubsub = self._client_factory().pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(self.pattern)
+                if connected_before:
+                    self._broadcast(RESYNC)
+                connected_before = True
+                backoff = 1
+
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    event = decode_message(message)
+                    if event is not None:
+                        self.dispatch(message["channel"], event)
+            except Exception as e:
+                Metrics.incr("event_hub.reconnects")
+                Logger.warn(f"Event hub lost Redis, retrying in {backoff}s: {str(e)}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+class AsyncSubscription:
+    """``Subscription`` for a stream served on the event loop."""
+
+    def __init__(self, hub: "AsyncEventHub", channel: str, maxsize: int):
+        self.hub = hub
+        self.channel = channel
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._overflowed = False
+
+    def put(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._overflowed = True
+            Metrics.incr("event_hub.overflows")
+
+    async def get(self, timeout: float) -> dict | None:
+        if self._overflowed:
+            self._overflowed = False
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            return RESYNC
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class AsyncEventHub:
+    """
+    ``EventHub`` for one event loop. Everything runs on the loop, so the
+    subscriber table needs no lock.
+    """
+
+    def __init__(self, client_factory: Callable, pattern: str = CHANNEL_PATTERN):
+        self._client_factory = client_factory
+        self.pattern = pattern
+        self._subs: dict[str, set[AsyncSubscription]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    def stats(self) -> dict:
+        streams = sum(len(subs) for subs in self._subs.values())
+        return {"streams": streams, "channels": len(self._subs)}
+
+    def subscribe(self, channel: str, maxsize: int = 100) -> AsyncSubscription:
+        sub = AsyncSubscription(self, channel, maxsize)
+        self._subs[channel].add(sub)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return sub
+
+    def unsubscribe(self, sub: AsyncSubscription) -> None:
+        subs = self._subs.get(sub.channel)
+        if subs is None:
+            return
+        subs.discard(sub)
+        if not subs:
+            del self._subs[sub.channel]
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def dispatch(self, channel: str, event: dict) -> None:
+        subs = list(self._subs.get(channel, ()))
+        for sub in subs:
+            sub.put(event)
+        Metrics.incr("event_hub.delivered", len(subs))
+
+    def _broadcast(self, event: dict) -> None:
+        for subs in list(self._subs.values()):
+            for sub in list(subs):
+                sub.put(event)
+
+    async def _run(self) -> None:
+        backoff = 1
+        connected_before = False
+        while True:
+            client = pubsub = None
+            try:
+                client = self._client_factory()
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(self.pattern)
+                if connected_before:
+                    self._broadcast(RESYNC)
+                connected_before = True
+                backoff = 1
+
+                async for message in pubsub.listen():
+                    event = decode_message(message)
+                    if event is not None:
+                        self.dispatch(message["channel"], event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Metrics.incr("event_hub.reconnects")
+                Logger.warn(f"Event hub lost Redis, retrying in {backoff}s: {str(e)}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                for resource in (pubsub, client):
+                    if resource is not None:
+                        try:
+                            await resource.aclose()
+                        except Exception:
+                            pass
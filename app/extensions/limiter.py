@@ -37,6 +37,8 @@ from flask import current_app, request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
+from ..db.redis import Cache
+
 # Sensible defaults applied to every sensitive auth endpoint. These are
 # overridable per-deployment through configuration / environment variables.
 DEFAULT_AUTH_LIMITS = [
@@ -109,7 +111,8 @@ def init_limiter(app) -> Limiter:
 
     Reads:
       * RATELIMIT_ENABLED      -> master on/off switch
-      * RATELIMIT_STORAGE_URI  -> redis:// uri (falls back to memory://)
+      * RATELIMIT_STORAGE_URI  -> redis:// uri (falls back to memory://);
+                                  redis counters use the shared Cache pool
       * RATELIMIT_FAIL_OPEN    -> when True, errors talking to the store are
                                   swallowed so auth stays available.
     """
@@ -125,6 +128,12 @@ def init_limiter(app) -> Limiter:
     # Fail open: if the storage backend errors, allow the request through.
     app.config["RATELIMIT_IN_MEMORY_FALLBACK_ENABLED"] = fail_open
     app.config["RATELIMIT_SWALLOW_ERRORS"] = fail_open
+    if storage_uri.startswith(("redis://", "rediss://")):
+        # Share the worker's Redis pool instead of a second one per limiter
+        app.config["RATELIMIT_STORAGE_OPTIONS"] = {
+            **app.config.get("RATELIMIT_STORAGE_OPTIONS", {}),
+            "connection_pool": Cache.get_pool(app.config),
+        }
 
     limiter.init_app(app)
     return limiter
@@ -0,0 +1,85 @@
+import pymysql
+from pymysql.cursors import DictCursor
+
+from ..db.db import DB
+from ..utils.exceptions import GenericDatabaseError
+from ..utils.logger import Logger
+
+APPLICATION_STATUSES = (1, 2, 3, 4)
+
+
+def summarize_counts(counts: dict) -> dict:
+    """``{status: n}`` -> total and a count for every status"""
+    return {
+        "total": sum(counts.values()),
+        "by_status": {
+            str(status): counts.get(status, 0)
+            for status in sorted(set(APPLICATION_STATUSES) | set(counts))
+        },
+    }
+
+
+class ApplicationCountsRepository:
+    """
+    Applications per job and status in ``job_application_counts``.
+
+    Writers call ``adjust`` with the cursor of the transaction that
+    inserts or re-statuses the application, so the counters commit or
+    roll back with it and never drift from ``job_applications``.
+    """
+
+    @staticmethod
+    def adjust(cursor, job_id: int, deltas: dict[int, int]) -> None:
+        """Add ``deltas`` (status -> change) to the job's counters"""
+        ApplicationCountsRepository.adjust_many(
+            cursor, {(job_id, status): delta for status, delta in deltas.items()}
+        )
+
+    @staticmethod
+    def adjust_many(cursor, deltas: dict[tuple[int, int], int]) -> None:
+        """Add ``deltas`` ((job_id, status) -> change) in one upsert"""
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        values = ", ".join(["(%s, %s, %s)"] * len(deltas))
+        params = []
+        for (job_id, status), delta in deltas.items():
+            params.extend((job_id, status, delta))
+        cursor.execute(
+            f"""
+            INSERT INTO job_application_counts(job_id, status, applications)
+            VALUES {values}
+            ON DUPLICATE KEY UPDATE applications = applications + VALUES(applications)
+            """.strip(),
+            params,
+        )
+
+    @staticmethod
+    def get_counts(job_ids: list[int]) -> dict[int, dict[int, int]]:
+        """``{job_id: {status: n}}`` for the given jobs, in one primary key read"""
+        if not job_ids:
+            return {}
+        try:
+            conn = DB.get_db()
+            with conn.cursor(DictCursor) as cursor:
+                placeholders = ", ".join(["%s"] * len(job_ids))
+                cursor.execute(
+                    f"""
+                    SELECT job_id, status, applications
+                    FROM job_application_counts
+                    WHERE job_id IN ({placeholders})
+                    """.strip(),
+                    list(job_ids),
+                )
+                counts: dict[int, dict[int, int]] = {}
+                for row in cursor.fetchall() or []:
+                    if row["applications"] > 0:
+                        job_counts = counts.setdefault(int(row["job_id"]), {})
+                        job_counts[int(row["status"])] = int(row["applications"])
+                return counts
+        except pymysql.MySQLError as e:
+            Logger.warn(f"PYMYSQL: {str(e)}")
+            raise GenericDatabaseError(str(e))
+        except Exception as e:
+            Logger.warn(f"EXCEPTION: {str(e)}")
+            raise GenericDatabaseError(str(e))
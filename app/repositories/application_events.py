@@ -0,0 +1,57 @@
+import json
+from datetime import date, datetime
+
+from ..db.redis import Cache
+from ..utils.logger import Logger
+from ..utils.metrics import Metrics
+
+CHANNEL_PREFIX = "applications"
+CHANNEL_PATTERN = f"{CHANNEL_PREFIX}:*"
+
+
+def user_channel(user_id: int) -> str:
+    return f"{CHANNEL_PREFIX}:user:{user_id}"
+
+
+def job_channel(job_id: int) -> str:
+    return f"{CHANNEL_PREFIX}:job:{job_id}"
+
+
+def _default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class ApplicationEvents:
+    """
+    Publishes job application changes to Redis pub/sub.
+
+    Each change goes to the applicant's channel and to the job's channel so
+    the candidate stream and the employer stream of that job both see it.
+    Publishing happens after commit and never fails the write: a lost
+    event only delays the stream until its next resync.
+    """
+
+    @staticmethod
+    def publish(event_type: str, application: dict) -> None:
+        ApplicationEvents.publish_many(event_type, [application])
+
+    @staticmethod
+    def publish_many(event_type: str, applications: list[dict]) -> None:
+        """Publish one event per application, all in a single pipeline"""
+        if not applications:
+            return
+        try:
+            pipe = Cache.connect_redis().pipeline(transaction=False)
+            for application in applications:
+                payload = json.dumps(
+                    {"type": event_type, "application": application}, default=_default
+                )
+                pipe.publish(user_channel(application["user_id"]), payload)
+                pipe.publish(job_channel(application["job_id"]), payload)
+            pipe.execute()
+            Metrics.incr("application_events.published", len(applications))
+        except Exception as e:
+            Logger.warn(f"Publishing application {event_type} event failed: {str(e)}")
+            Metrics.incr("application_events.errors")
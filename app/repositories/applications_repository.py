@@ -1,12 +1,25 @@
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Iterator
 
 import pymysql
-from pymysql.cursors import DictCursor
+from pymysql.cursors import DictCursor, SSDictCursor
 
 from ..db.db import DB
 from ..utils.exceptions import GenericDatabaseError
 from ..utils.logger import Logger
+from .application_counts_repository import ApplicationCountsRepository
+from .application_events import ApplicationEvents
+from .jobs_cache import JobCache
+from .outbox_repository import (
+    APPLICATION_CREATED,
+    APPLICATION_STATUS_CHANGED,
+    OutboxRepository,
+)
+
+# Everything but the TEXT cover letter, for list views
+USER_LIST_COLUMNS = (
+    "application_id, user_id, job_id, status, resume_url, created_at, modified_at"
+)
 
 
 def serialize_application(row: dict) -> dict:
@@ -20,7 +33,14 @@ def serialize_application(row: dict) -> dict:
 class ApplicationRepository:
 
     @staticmethod
-    def create_application(user_id, data: dict[str, Any]) -> int:
+    def create_application(
+        user_id, data: dict[str, Any], applicant_email: str | None = None
+    ) -> int:
+        """
+        Insert the application, count it on its job and, when
+        ``applicant_email`` is given, queue its notification in the outbox,
+        in one transaction.
+        """
         conn = None
         try:
             conn = DB.get_db()
@@ -37,8 +57,28 @@ class ApplicationRepository:
 
                 Logger.info(f"Creating job applicationf or {user_id}")
                 cursor.execute(query, (user_id, job_id, status, c_letter, resume_url))
+                application_id = cursor.lastrowid
+                ApplicationCountsRepository.adjust(cursor, job_id, {status: 1})
+                if applicant_email:
+                    OutboxRepository.add(
+                        cursor,
+                        APPLICATION_CREATED,
+                        {"applicant_email": applicant_email, "job_id": job_id},
+                    )
                 conn.commit()
-                return cursor.lastrowid
+
+                ApplicationEvents.publish(
+                    "created",
+                    {
+                        "application_id": application_id,
+                        "user_id": user_id,
+                        "job_id": job_id,
+                        "status": status,
+                        "cover_letter": c_letter,
+                        "resume_url": resume_url,
+                    },
+                )
+                return application_id
         except pymysql.MySQLError as e:
             Logger.warn(f"Pymysql error {str(e)} occurred")
             raise GenericDatabaseError(str(e))
@@ -50,28 +90,68 @@ class ApplicationRepository:
     def get_jobs_applications(
         job_id: int, limit: int, offset: int, admin_id: int
     ) -> list:
+        return ApplicationRepository._job_applications_page(
+            job_id, admin_id, limit, offset=offset
+        )
+
+    @staticmethod
+    def get_jobs_applications_after(
+        job_id: int, admin_id: int, after_created_at: str, after_id: int, limit: int
+    ) -> list:
+        """Keyset page: applications after (``after_created_at``, ``after_id``)"""
+        return ApplicationRepository._job_applications_page(
+            job_id, admin_id, limit, after=(after_created_at, after_id)
+        )
+
+    @staticmethod
+    def _job_applications_page(
+        job_id: int,
+        admin_id: int,
+        limit: int,
+        offset: int = 0,
+        after: tuple | None = None,
+    ) -> list:
+        """
+        Deferred join: the page of application ids is picked from
+        ``idx_job_app_job_created`` (job_id, created_at, application_id)
+        alone, already in order, and only those rows are joined with
+        ``user`` and ``profile``. The employer's ownership of the job is a
+        primary key lookup on ``jobs``.
+        """
         conn = None
         try:
-            Logger.info(f"Job id -> {job_id}")
-            Logger.info(f"Job limit -> {limit}")
-            Logger.info(f"Job offset -> {offset}")
-            Logger.info(f"Admin id -> {admin_id}")
             conn = DB.get_db()
             with conn.cursor(DictCursor) as cursor:
-                query = """
+                conditions = ["page.job_id = %s", "j.admin_id = %s"]
+                params: list = [job_id, admin_id]
+                if after is not None:
+                    after_created_at, after_id = after
+                    conditions.append(
+                        "(page.created_at > %s OR "
+                        "(page.created_at = %s AND page.application_id > %s))"
+                    )
+                    params.extend([after_created_at, after_created_at, after_id])
+                params.extend([limit, offset])
+
+                query = f"""
                 SELECT ja.*, u.email AS applicant_email, u.user_id AS applicant_user_id,
                        p.first_name AS applicant_first_name, p.last_name AS applicant_last_name,
                        p.cv_url AS applicant_cv_url
-                FROM job_applications ja
-                INNER JOIN jobs j ON ja.job_id = j.job_id
+                FROM (
+                    SELECT page.application_id
+                    FROM job_applications page
+                    INNER JOIN jobs j ON page.job_id = j.job_id
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY page.created_at, page.application_id
+                    LIMIT %s OFFSET %s
+                ) ids
+                INNER JOIN job_applications ja ON ja.application_id = ids.application_id
                 INNER JOIN `user` u ON ja.user_id = u.user_id
                 LEFT JOIN profile p ON u.user_id = p.user_id
-                WHERE ja.job_id = %s AND j.admin_id = %s
-                ORDER BY ja.created_at
-                LIMIT %s OFFSET %s
+                ORDER BY ja.created_at, ja.application_id
                 """.strip()
 
-                cursor.execute(query, (job_id, admin_id, limit, offset))
+                cursor.execute(query, params)
                 res = cursor.fetchall()
 
                 job_apps = [serialize_application(row) for row in res or []]
@@ -83,6 +163,43 @@ class ApplicationRepository:
             Logger.warn(f"PYMYSQL: an error {str(e)} occurred")
             raise GenericDatabaseError(str(e))
 
+    @staticmethod
+    def stream_job_applications(job_id: int, admin_id: int) -> Iterator[dict]:
+        """
+        Every application of an admin's job with its applicant, in list
+        order, read with an unbuffered cursor so rows are pulled from MySQL
+        as they are consumed. The connection is busy until the generator is
+        exhausted or closed.
+        """
+        conn = DB.get_db()
+        try:
+            with conn.cursor(SSDictCursor) as cursor:
+                cursor.execute(
+                    """
+                    SELECT ja.*, u.email AS applicant_email,
+                           p.first_name AS applicant_first_name,
+                           p.last_name AS applicant_last_name,
+                           p.cv_url AS applicant_cv_url
+                    FROM job_applications ja
+                    INNER JOIN jobs j ON ja.job_id = j.job_id
+                    INNER JOIN `user` u ON ja.user_id = u.user_id
+                    LEFT JOIN profile p ON u.user_id = p.user_id
+                    WHERE ja.job_id = %s AND j.admin_id = %s
+                    ORDER BY ja.created_at, ja.application_id
+                    """.strip(),
+                    (job_id, admin_id),
+                )
+                for row in cursor:
+                    yield serialize_application(row)
+        except pymysql.MySQLError as e:
+            Logger.warn(f"PYMYSQL: {str(e)}")
+            raise GenericDatabaseError(str(e))
+
+    @staticmethod
+    def count_job_applications(job_id: int) -> dict:
+        """Applications per status of a job, from ``job_application_counts``"""
+        return ApplicationCountsRepository.get_counts([job_id]).get(job_id, {})
+
     @staticmethod
     def get_user_application(user_id: int, job_id: int) -> dict:
         conn = None
@@ -110,17 +227,48 @@ class ApplicationRepository:
             raise GenericDatabaseError(f"{str(e)}")
 
     @staticmethod
-    def get_user_applications(user_id: int) -> list:
+    def get_user_applications(
+        user_id: int,
+        limit: int,
+        before_id: int | None = None,
+        status: int | None = None,
+        include_cover_letter: bool = False,
+    ) -> list:
+        """
+        Newest-first keyset page of a user's applications.
+
+        With a status the scan is a range of ``idx_job_app_user_status``
+        (user_id, status, application_id); without one it is a range of
+        ``idx_job_app_user_id`` (user_id, application_id). Either way no
+        rows are sorted and the page stops after ``limit``. The TEXT
+        ``cover_letter`` is only read when asked for.
+        """
         conn = None
         try:
             conn = DB.get_db()
             with conn.cursor(DictCursor) as cursor:
-                query = """
-                SELECT * FROM job_applications
-                WHERE user_id = %s
+                columns = USER_LIST_COLUMNS
+                if include_cover_letter:
+                    columns += ", cover_letter"
+                conditions = ["user_id = %s"]
+                params: list = [user_id]
+                if status is not None:
+                    conditions.append("status = %s")
+                    params.append(status)
+                if before_id is not None:
+                    conditions.append("application_id < %s")
+                    params.append(before_id)
+                params.append(limit)
+
+                query = f"""
+                SELECT {columns}
+                FROM job_applications
+                WHERE {" AND ".join(conditions)}
+                ORDER BY application_id DESC
+                LIMIT %s
                 """.strip()
 
-                cursor.execute(query, (user_id,))
+                cursor.execute(query, params)
                 res = cursor.fetchall()
 
                 applications = [serialize_application(row) for row in res or []]
@@ -132,33 +280,18 @@ class ApplicationRepository:
             Logger.warn(f"EXCEPTION: {str(e)}")
             raise GenericDatabaseError(str(e))
 
-    @staticmethod
-    def get_application_details(application_id: int) -> dict:
-        conn = None
-        try:
-            conn = DB.get_db()
-            with conn.cursor(DictCursor) as cursor:
-                query = """
-                SELECT ja.*, u.email AS applicant_email, j.title AS job_title,
-                       j.company_name AS company_name, a.email AS employer_email
-                FROM job_applications ja
-                INNER JOIN `user` u ON ja.user_id = u.user_id
-                INNER JOIN jobs j ON ja.job_id = j.job_id
-                INNER JOIN admins a ON j.admin_id = a.admin_id
-                WHERE ja.application_id = %s
-                LIMIT 1
-                """.strip()
-                cursor.execute(query, (application_id,))
-                row = cursor.fetchone()
-                if not row:
-                    return {}
-                return serialize_application(row)
-        except Exception as e:
-            Logger.warn(f"EXCEPTION: {str(e)}")
-            raise GenericDatabaseError(str(e))
-
     @staticmethod
     def get_job_info_for_notification(job_id: int) -> dict:
+        """
+        Job title, company and employer address for notification emails,
+        read through the job cache so a batch of notifications about the
+        same job costs one query per cache lifetime.
+        """
+        version = JobCache.version()
+        cached = JobCache.get_notification_info(version, job_id)
+        if cached is not None:
+            return cached
+
         conn = None
         try:
             conn = DB.get_db()
@@ -172,7 +305,10 @@ class ApplicationRepository:
                 """.strip()
                 cursor.execute(query, (job_id,))
                 row = cursor.fetchone()
-                return row or {}
+                if not row:
+                    return {}
+                JobCache.set_notification_info(version, job_id, row)
+                return row
         except pymysql.MySQLError as e:
             Logger.warn(f"PYMYSQL: {str(e)}")
             raise GenericDatabaseError(str(e))
@@ -182,29 +318,100 @@ class ApplicationRepository:
 
     @staticmethod
     def update_application(application_id: int, admin_id: int, status: int) -> bool:
+        return bool(
+            ApplicationRepository.update_applications(
+                [application_id], admin_id, status
+            )
+        )
+
+    @staticmethod
+    def update_applications(
+        application_ids: list[int], admin_id: int, status: int
+    ) -> list[int]:
+        """
+        Set ``status`` on those of ``application_ids`` that belong to the
+        admin's jobs, in one transaction and a fixed number of statements
+        however many there are. Returns the ids that were updated.
+        """
+        if not application_ids:
+            return []
         conn = None
         try:
             conn = DB.get_db()
             with conn.cursor(DictCursor) as cursor:
-                query = """
-                UPDATE job_applications ja
-                INNER JOIN jobs j ON ja.job_id = j.job_id
-                SET ja.status = %s, ja.modified_at = CURRENT_TIMESTAMP
-                WHERE ja.application_id = %s AND j.admin_id = %s
-                """.strip()
+                # Lock the rows, in id order so concurrent bulk updates do not
+                # deadlock, to move job counters from the old statuses; the
+                # applicant emails are for the outbox, the relay adds the job.
+                # OF ja leaves the joined jobs and user rows unlocked, so new
+                # applications to these jobs are not held up meanwhile
+                placeholders = ", ".join(["%s"] * len(application_ids))
+                cursor.execute(
+                    f"""
+                    SELECT ja.application_id, ja.user_id, ja.job_id, ja.status,
+                           CURRENT_TIMESTAMP AS modified_at,
+                           u.email AS applicant_email
+                    FROM job_applications ja
+                    INNER JOIN jobs j ON ja.job_id = j.job_id
+                    INNER JOIN `user` u ON ja.user_id = u.user_id
+                    WHERE ja.application_id IN ({placeholders}) AND j.admin_id = %s
+                    ORDER BY ja.application_id
+                    FOR UPDATE OF ja
+                    """.strip(),
+                    [*application_ids, admin_id],
+                )
+                changed = cursor.fetchall() or []
+                updated_ids = [row["application_id"] for row in changed]
+
+                if changed:
+                    placeholders = ", ".join(["%s"] * len(updated_ids))
+                    query = f"""
+                    UPDATE job_applications
+                    SET status = %s, modified_at = %s
+                    WHERE application_id IN ({placeholders})
+                    """.strip()
+
+                    Logger.info(
+                        f"Updating {len(updated_ids)} applications by user {admin_id}"
+                    )
+                    cursor.execute(
+                        query, [status, changed[0]["modified_at"], *updated_ids]
+                    )
 
-                Logger.info(f"Updating job {application_id} by user {admin_id}")
-                cursor.execute(query, (status, application_id, admin_id))
+                    deltas: dict[tuple[int, int], int] = {}
+                    notifications = []
+                    for row in changed:
+                        if row["status"] != status:
+                            moved_from = (row["job_id"], row["status"])
+                            moved_to = (row["job_id"], status)
+                            deltas[moved_from] = deltas.get(moved_from, 0) - 1
+                            deltas[moved_to] = deltas.get(moved_to, 0) + 1
+                        row["status"] = status
+                        applicant_email = row.pop("applicant_email", None)
+                        if applicant_email:
+                            notifications.append(
+                                {
+                                    "applicant_email": applicant_email,
+                                    "job_id": row["job_id"],
+                                    "status": status,
+                                }
+                            )
+                    ApplicationCountsRepository.adjust_many(cursor, deltas)
+                    OutboxRepository.add_many(
+                        cursor, APPLICATION_STATUS_CHANGED, notifications
+                    )
 
                 conn.commit()
                 Logger.info(
-                    f"Update by {admin_id} for application {application_id} success"
+                    f"Update by {admin_id} for applications {updated_ids} success"
                 )
-                return cursor.rowcount > 0
+                if changed:
+                    ApplicationEvents.publish_many(
+                        "updated", [serialize_application(row) for row in changed]
+                    )
+                return updated_ids
         except pymysql.MySQLError as e:
             Logger.warn(f"Pymysql error {str(e)} occurred")
             raise GenericDatabaseError(str(e))
         except Exception as e:
             Logger.warn(f"Generic error {str(e)} occurred")
             raise GenericDatabaseError(str(e))
-        return 0
@@ -0,0 +1,109 @@
+import json
+
+from flask import current_app
+
+from ..db.redis import Cache
+from ..utils.logger import Logger
+from ..utils.metrics import Metrics
+
+# Bump when the cached job shape changes so old entries are never read back.
+SCHEMA_VERSION = 1
+
+VERSION_KEY = f"jobs:s{SCHEMA_VERSION}:version"
+
+DEFAULT_TTLS = {"JOBS_CACHE_LIST_TTL": 60, "JOBS_CACHE_DETAIL_TTL": 300}
+
+
+def _key(version: int, kind: str, *parts) -> str:
+    suffix = ":".join(str(part) for part in parts)
+    return f"jobs:s{SCHEMA_VERSION}:v{version}:{kind}:{suffix}"
+
+
+class JobCache:
+    """
+    Read-through cache for public job listings and job details.
+
+    Every key embeds a version number held in Redis. Any write to ``jobs``
+    bumps the version, orphaning all cached pages and details at once;
+    they are left to expire by TTL instead of being deleted key by key.
+    Callers read the version once with ``version()`` and pass it to both the
+    lookup and the fill, so a page read from MySQL before a concurrent write
+    is stored under the old version and can never be served after it.
+
+    Redis problems never fail a request: ``version()`` returns ``None``,
+    lookups miss and fills are skipped.
+    """
+
+    @staticmethod
+    def version() -> int | None:
+        try:
+            raw = Cache.connect_redis().get(VERSION_KEY)
+            return int(raw) if raw else 0
+        except Exception as e:
+            Logger.warn(f"Job cache unavailable: {str(e)}")
+            Metrics.incr("jobs_cache.errors")
+            return None
+
+    @staticmethod
+    def _get(version: int | None, kind: str, *parts):
+        if version is None:
+            return None
+        try:
+            raw = Cache.connect_redis().get(_key(version, kind, *parts))
+        except Exception as e:
+            Logger.warn(f"Job cache read failed: {str(e)}")
+            Metrics.incr("jobs_cache.errors")
+            return None
+
+        if raw is None:
+            Metrics.incr(f"jobs_cache.{kind}_misses")
+            return None
+        Metrics.incr(f"jobs_cache.{kind}_hits")
+        return json.loads(raw)
+
+    @staticmethod
+    def _set(version: int | None, value, ttl_key: str, kind: str, *parts) -> None:
+        if version is None:
+            return
+        try:
+            ttl = int(current_app.config.get(ttl_key, DEFAULT_TTLS[ttl_key]))
+            Cache.connect_redis().setex(
+                _key(version, kind, *parts), ttl, json.dumps(value)
+            )
+        except Exception as e:
+            Logger.warn(f"Job cache write failed: {str(e)}")
+            Metrics.incr("jobs_cache.errors")
+
+    @staticmethod
+    def get_jobs(version: int | None, *page_key) -> list | None:
+        return JobCache._get(version, "list", *page_key)
+
+    @staticmethod
+    def set_jobs(version: int | None, jobs: list, *page_key) -> None:
+        JobCache._set(version, jobs, "JOBS_CACHE_LIST_TTL", "list", *page_key)
+
+    @staticmethod
+    def get_job(version: int | None, job_id: int) -> dict | None:
+        return JobCache._get(version, "detail", job_id)
+
+    @staticmethod
+    def set_job(version: int | None, job_id: int, job: dict) -> None:
+        JobCache._set(version, job, "JOBS_CACHE_DETAIL_TTL", "detail", job_id)
+
+    @staticmethod
+    def get_notification_info(version: int | None, job_id: int) -> dict | None:
+        return JobCache._get(version, "notify", job_id)
+
+    @staticmethod
+    def set_notification_info(version: int | None, job_id: int, info: dict) -> None:
+        JobCache._set(version, info, "JOBS_CACHE_DETAIL_TTL", "notify", job_id)
+
+    @staticmethod
+    def invalidate() -> None:
+        """Orphan every cached list page and job detail."""
+        try:
+            Cache.connect_redis().incr(VERSION_KEY)
+            Metrics.incr("jobs_cache.invalidations")
+        except Exception as e:
+            Logger.error(f"Job cache invalidation failed: {str(e)}")
+            Metrics.incr("jobs_cache.errors")
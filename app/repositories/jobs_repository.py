@@ -1,13 +1,17 @@
+import hashlib
+import json
+import re
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Iterator
 
 import pymysql
-from pymysql.cursors import DictCursor
+from pymysql.cursors import DictCursor, SSDictCursor
 
 from ..db.db import DB
 from ..utils.data import ALLOWED_JOB_FIELDS, VALID_EMPLOYMENT_TYPES, VALID_JOB_STATUSES
 from ..utils.exceptions import GenericDatabaseError
 from ..utils.logger import Logger
+from .jobs_cache import JobCache
 
 
 # Helpers
@@ -47,6 +51,44 @@ def convert_job_status(job_status: str) -> str:
     return mapping[key]
 
 
+def to_boolean_query(text: str) -> str:
+    """
+    Turn free text into a MySQL boolean-mode query where every word is
+    required and prefix matched, e.g. "python dev" -> "+python* +dev*".
+    Operator characters are stripped so users cannot break the syntax.
+    """
+    cleaned = re.sub(r"[^\w\s]", " ", text)
+    words = [word for word in cleaned.split() if word]
+    return " ".join(f"+{word}*" for word in words)
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+INSERT_JOB_COLUMNS = (
+    "admin_id,title,description,requirements,location,employment_type,"
+    "salary_range,company_name,application_url,deadline,status"
+)
+
+
+def job_row(data: dict[str, Any]) -> tuple:
+    """Values of a job for ``INSERT_JOB_COLUMNS``, in order"""
+    return (
+        data["admin_id"],
+        data["title"],
+        data["description"],
+        data.get("requirements"),
+        data["location"],
+        convert_employment_type(data["employment_type"]),
+        data.get("salary_range"),
+        data["company_name"],
+        data.get("application_url"),
+        data.get("deadline"),
+        convert_job_status(data["status"]),
+    )
+
+
 class JobRepository:
     @staticmethod
     def insert_job(data: dict[str, str]) -> int | None:
@@ -55,42 +97,16 @@ class JobRepository:
             conn = DB.get_db()
             with conn.cursor(DictCursor) as cursor:
 
-                query = """
-                INSERT INTO jobs(admin_id,title,description,requirements,location, employment_type,salary_range,company_name,application_url,deadline,status)
+                query = f"""
+                INSERT INTO jobs({INSERT_JOB_COLUMNS})
                 VALUES(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
                 """.strip()
 
-                employment_type = None
-                status = None
-
                 admin_id = data["admin_id"]
                 title = data["title"]
-                description = data["description"]
-                requirements = data["requirements"]
-                location = data["location"]
-                employment_type = convert_employment_type(data["employment_type"])
-                salary_range = data["salary_range"]
-                company_name = data["company_name"]
-                application_url = data["application_url"]
-                deadline = data["deadline"]
-                status = convert_job_status(data["status"])
-                cursor.execute(
-                    query,
-                    (
-                        admin_id,
-                        title,
-                        description,
-                        requirements,
-                        location,
-                        employment_type,
-                        salary_range,
-                        company_name,
-                        application_url,
-                        deadline,
-                        status,
-                    ),
-                )
+                cursor.execute(query, job_row(data))
                 conn.commit()
+                JobCache.invalidate()
                 Logger.info(f"Job {title} by {admin_id} created successfully")
                 return cursor.lastrowid
         except pymysql.MySQLError as e:
@@ -100,8 +116,58 @@ class JobRepository:
             Logger.error(f"An error because of {str(e)} occurred")
             raise GenericDatabaseError({str(e)})
 
+    @staticmethod
+    def insert_jobs(jobs: list[dict[str, Any]]) -> list[int]:
+        """
+        Insert ``jobs`` with one multi-row INSERT and commit; returns the new
+        ids. They are not derived from the first id, since they step by
+        ``auto_increment_increment`` and may interleave with concurrent
+        inserts. Instead they are read back inside the transaction, which
+        takes its snapshot before the INSERT: any other row with an id past
+        the first new one was allocated later and is not visible yet.
+        Nothing is kept if the insert fails.
+        """
+        if not jobs:
+            return []
+        conn = None
+        try:
+            conn = DB.get_db()
+            with conn.cursor(DictCursor) as cursor:
+                cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+                values = ", ".join(["(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)"] * len(jobs))
+                params = [value for data in jobs for value in job_row(data)]
+                cursor.execute(
+                    f"INSERT INTO jobs({INSERT_JOB_COLUMNS}) VALUES {values}", params
+                )
+                first_id = cursor.lastrowid
+                cursor.execute(
+                    "SELECT job_id FROM jobs WHERE job_id >= %s "
+                    "ORDER BY job_id LIMIT %s",
+                    (first_id, len(jobs)),
+                )
+                job_ids = [row["job_id"] for row in cursor.fetchall()]
+                conn.commit()
+                JobCache.invalidate()
+                Logger.info(f"{len(jobs)} jobs imported from job {first_id}")
+                return job_ids
+        except pymysql.MySQLError as e:
+            if conn is not None:
+                conn.rollback()
+            Logger.error(f"An error because of {str(e)} occurred")
+            raise GenericDatabaseError(str(e))
+        except Exception as e:
+            if conn is not None:
+                conn.rollback()
+            Logger.error(f"An error because of {str(e)} occurred")
+            raise GenericDatabaseError(str(e))
+
     @staticmethod
     def get_jobs(limit: int, offset: int) -> list:
+        version = JobCache.version()
+        cached = JobCache.get_jobs(version, limit, offset)
+        if cached is not None:
+            return cached
+
         conn = None
         try:
             conn = DB.get_db()
@@ -115,6 +181,111 @@ class JobRepository:
                 result = cursor.fetchall()
 
                 jobs = [serialize_job(row) for row in result or []]
+                JobCache.set_jobs(version, jobs, limit, offset)
+                return jobs
+        except pymysql.MySQLError as e:
+            Logger.error(f"Database error: {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+        except Exception as e:
+            Logger.error(f"Unexpected error: {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+
+    @staticmethod
+    def get_jobs_after(after_id: int, limit: int) -> list:
+        """Keyset page: seeks past ``after_id`` on the primary key"""
+        version = JobCache.version()
+        cached = JobCache.get_jobs(version, "after", after_id, limit)
+        if cached is not None:
+            return cached
+
+        conn = None
+        try:
+            conn = DB.get_db()
+            with conn.cursor(DictCursor) as cursor:
+                query = """
+                SELECT * FROM jobs
+                WHERE job_id > %s
+                ORDER BY job_id
+                LIMIT %s
+                """.strip()
+                cursor.execute(query, (after_id, limit))
+                result = cursor.fetchall()
+
+                jobs = [serialize_job(row) for row in result or []]
+                JobCache.set_jobs(version, jobs, "after", after_id, limit)
+                return jobs
+        except pymysql.MySQLError as e:
+            Logger.error(f"Database error: {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+        except Exception as e:
+            Logger.error(f"Unexpected error: {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+
+    @staticmethod
+    def search_jobs(filters: dict[str, Any], limit: int, offset: int) -> list:
+        """
+        Relevance ranked search over ``ft_jobs_search`` narrowed by status,
+        employment type and location prefix. Without a keyword the results
+        are newest first: status alone is read in order from
+        ``idx_jobs_status_id`` and status with type from
+        ``idx_jobs_status_type_id``. A location prefix is a range, so it goes
+        through ``idx_jobs_status_type_location`` (with a type) or
+        ``idx_jobs_status_location`` and only the matching rows are sorted.
+        """
+        status = convert_job_status(filters.get("status") or "open")
+        clauses = ["status = %s"]
+        params: list[Any] = [status]
+
+        if filters.get("employment_type"):
+            clauses.append("employment_type = %s")
+            params.append(convert_employment_type(filters["employment_type"]))
+
+        if filters.get("location"):
+            clauses.append("location LIKE %s")
+            params.append(f"{escape_like(filters['location'].strip())}%")
+
+        keywords = to_boolean_query(filters.get("q") or "")
+        if keywords:
+            match = (
+                "MATCH(title, description, requirements) "
+                "AGAINST (%s IN BOOLEAN MODE)"
+            )
+            select = f"SELECT *, {match} AS relevance FROM jobs"
+            clauses.append(match)
+            params = [keywords, *params, keywords]
+            order = "relevance DESC, job_id DESC"
+        else:
+            select = "SELECT * FROM jobs"
+            order = "job_id DESC"
+
+        query = f"""
+        {select}
+        WHERE {' AND '.join(clauses)}
+        ORDER BY {order}
+        LIMIT %s OFFSET %s
+        """.strip()
+        params.extend([limit, offset])
+
+        cache_key = hashlib.sha1(json.dumps(params).encode("utf-8")).hexdigest()
+        version = JobCache.version()
+        cached = JobCache.get_jobs(version, "search", cache_key)
+        if cached is not None:
+            return cached
+
+        conn = None
+        try:
+            conn = DB.get_db()
+            with conn.cursor(DictCursor) as cursor:
+                cursor.execute(query, tuple(params))
+                result = cursor.fetchall()
+
+                jobs = []
+                for row in result or []:
+                    job = serialize_job(row)
+                    if "relevance" in job:
+                        job["relevance"] = round(float(job["relevance"]), 4)
+                    jobs.append(job)
+                JobCache.set_jobs(version, jobs, "search", cache_key)
                 return jobs
         except pymysql.MySQLError as e:
             Logger.error(f"Database error: {str(e)}")
@@ -125,6 +296,11 @@ class JobRepository:
 
     @staticmethod
     def get_job(job_id: int) -> dict:
+        version = JobCache.version()
+        cached = JobCache.get_job(version, job_id)
+        if cached is not None:
+            return cached
+
         conn = None
         try:
             conn = DB.get_db()
@@ -134,7 +310,9 @@ class JobRepository:
                 row = cursor.fetchone()
                 if not row:
                     return {}
-                return serialize_job(row)
+                job = serialize_job(row)
+                JobCache.set_job(version, job_id, job)
+                return job
         except pymysql.MySQLError as e:
             Logger.error(f"Database error: {str(e)}")
             raise GenericDatabaseError(f"{str(e)}")
@@ -171,6 +349,50 @@ class JobRepository:
             Logger.error(f"Unexpected error: {str(e)}")
             raise GenericDatabaseError(f"{str(e)}")
 
+    @staticmethod
+    def stream_jobs_by_admin(admin_id: int) -> Iterator[dict]:
+        """
+        Every job of the admin, read with an unbuffered cursor so rows are
+        pulled from MySQL as they are consumed instead of held in a list.
+        The connection is busy until the generator is exhausted or closed.
+        """
+        conn = DB.get_db()
+        try:
+            with conn.cursor(SSDictCursor) as cursor:
+                cursor.execute(
+                    "SELECT * FROM jobs WHERE admin_id = %s ORDER BY job_id",
+                    (admin_id,),
+                )
+                for row in cursor:
+                    yield serialize_job(row)
+        except pymysql.MySQLError as e:
+            Logger.error(f"Database error: {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+
+    @staticmethod
+    def get_jobs_by_admin_after(admin_id: int, after_id: int, limit: int) -> list:
+        """Keyset page over ``job_admin_idx`` (admin_id, job_id)"""
+        conn = None
+        try:
+            conn = DB.get_db()
+            with conn.cursor(DictCursor) as cursor:
+                query = """
+                SELECT * FROM jobs
+                WHERE admin_id = %s AND job_id > %s
+                ORDER BY job_id
+                LIMIT %s
+                """.strip()
+                cursor.execute(query, (admin_id, after_id, limit))
+                result = cursor.fetchall()
+                jobs = [serialize_job(row) for row in result or []]
+                return jobs
+        except pymysql.MySQLError as e:
+            Logger.error(f"Database error: {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+        except Exception as e:
+            Logger.error(f"Unexpected error: {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+
     @staticmethod
     def update_job(job_id: int, admin_id: int, data: dict[str, Any]) -> bool:
         conn = None
@@ -209,6 +431,8 @@ class JobRepository:
                 # 6. Execute the query & commit
                 cursor.execute(query, tuple(values))
                 conn.commit()
+                if cursor.rowcount > 0:
+                    JobCache.invalidate()
 
                 # 7. Log and return bool
                 Logger.info(f"Job {job_id} updated sucessfully with {values}")
@@ -0,0 +1,71 @@
+import json
+import time
+
+from ..db.redis import Cache
+
+PENDING_KEY = "notify:digest:pending"
+FLUSH_LOCK_KEY = "notify:digest:flush_lock"
+
+
+def _items_key(email: str) -> str:
+    return f"notify:digest:items:{email}"
+
+
+class NotificationDigestCache:
+    """
+    Per-recipient notification buffers held in Redis.
+
+    Each recipient has a list of pending items and an entry in a sorted set
+    scored by the time its first item arrived. ``pop_due`` drains every
+    recipient whose window has elapsed; the list read, its deletion and the
+    sorted set removal run in one MULTI so an item pushed concurrently lands
+    either in this digest or in the next window, never in neither. Flushes
+    hold ``FLUSH_LOCK_KEY`` so two of them never drain the same recipient.
+
+    Errors are left to the caller, which decides whether to send directly.
+    """
+
+    @staticmethod
+    def add(email: str, item: dict) -> bool:
+        """Buffer ``item`` for ``email``; True when it opened a new window."""
+        pipe = Cache.connect_redis().pipeline(transaction=True)
+        pipe.rpush(_items_key(email), json.dumps(item))
+        pipe.zadd(PENDING_KEY, {email: time.time()}, nx=True)
+        _, opened = pipe.execute()
+        return bool(opened)
+
+    @staticmethod
+    def pop_due(window: float, limit: int = 1000) -> dict[str, list[dict]]:
+        """Remove and return the items of up to ``limit`` recipients now due."""
+        client = Cache.connect_redis()
+        due = client.zrangebyscore(
+            PENDING_KEY, "-inf", time.time() - window, start=0, num=limit
+        )
+        if not due:
+            return {}
+
+        pipe = client.pipeline(transaction=True)
+        for email in due:
+            pipe.lrange(_items_key(email), 0, -1)
+            pipe.delete(_items_key(email))
+            pipe.zrem(PENDING_KEY, email)
+        replies = pipe.execute()
+
+        digests = {}
+        for index, email in enumerate(due):
+            raw_items = replies[index * 3]
+            if raw_items:
+                digests[email] = [json.loads(raw) for raw in raw_items]
+        return digests
+
+    @staticmethod
+    def pending() -> int:
+        return Cache.connect_redis().zcard(PENDING_KEY)
+
+    @staticmethod
+    def acquire_flush_lock(ttl: int = 60) -> bool:
+        return bool(Cache.connect_redis().set(FLUSH_LOCK_KEY, "1", nx=True, ex=ttl))
+
+    @staticmethod
+    def release_flush_lock() -> None:
+        Cache.connect_redis().delete(FLUSH_LOCK_KEY)
@@ -0,0 +1,122 @@
+import json
+
+import pymysql
+from pymysql.cursors import DictCursor
+
+from ..db.db import DB
+from ..utils.exceptions import GenericDatabaseError
+from ..utils.logger import Logger
+
+APPLICATION_CREATED = "application.created"
+APPLICATION_STATUS_CHANGED = "application.status_changed"
+
+
+class OutboxRepository:
+    """
+    Notifications waiting in ``notification_outbox``.
+
+    Writers add rows with the cursor of the transaction that changes the
+    application, so the notification commits or rolls back with it. Rows
+    carry ids and addresses only; the relay looks up the job and employer
+    details through the job cache, so the write path joins no other
+    tables. ``claim`` locks due rows with SKIP LOCKED, leases them by
+    moving ``next_attempt_at`` forward and commits, so no lock is held
+    while the relay publishes and several relays can drain the table side
+    by side. ``complete`` deletes what was sent and schedules the retry of
+    what was not.
+    """
+
+    @staticmethod
+    def add(cursor, event_type: str, payload: dict) -> None:
+        OutboxRepository.add_many(cursor, event_type, [payload])
+
+    @staticmethod
+    def add_many(cursor, event_type: str, payloads: list[dict]) -> None:
+        """Queue one notification per payload in a single INSERT"""
+        if not payloads:
+            return
+        values = ", ".join(["(%s, %s)"] * len(payloads))
+        params = []
+        for payload in payloads:
+            params.extend((event_type, json.dumps(payload)))
+        cursor.execute(
+            f"INSERT INTO notification_outbox(event_type, payload) VALUES {values}",
+            params,
+        )
+
+    @staticmethod
+    def claim(limit: int, max_attempts: int, lease_seconds: int) -> list[dict]:
+        """
+        Lease the oldest due rows for ``lease_seconds`` and commit. A row
+        whose relay dies before ``complete`` is claimed again once its
+        lease runs out.
+        """
+        conn = None
+        try:
+            conn = DB.get_db()
+            with conn.cursor(DictCursor) as cursor:
+                cursor.execute(
+                    """
+                    SELECT outbox_id, event_type, payload, attempts
+                    FROM notification_outbox
+                    WHERE next_attempt_at <= NOW() AND attempts < %s
+                    ORDER BY next_attempt_at, outbox_id
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                    """.strip(),
+                    (max_attempts, limit),
+                )
+                rows = cursor.fetchall() or []
+                if rows:
+                    placeholders = ",".join(["%s"] * len(rows))
+                    cursor.execute(
+                        f"UPDATE notification_outbox "
+                        f"SET next_attempt_at = NOW() + INTERVAL %s SECOND "
+                        f"WHERE outbox_id IN ({placeholders})",
+                        [lease_seconds] + [row["outbox_id"] for row in rows],
+                    )
+            conn.commit()
+            for row in rows:
+                if isinstance(row["payload"], (str, bytes)):
+                    row["payload"] = json.loads(row["payload"])
+            return rows
+        except pymysql.MySQLError as e:
+            if conn is not None:
+                conn.rollback()
+            Logger.warn(f"PYMYSQL: {str(e)}")
+            raise GenericDatabaseError(str(e))
+
+    @staticmethod
+    def complete(sent_ids: list[int], retry_after: dict[int, int]) -> None:
+        """
+        Delete what was relayed; count an attempt for each row in
+        ``retry_after`` and hold it back for the given number of seconds.
+        """
+        conn = None
+        try:
+            conn = DB.get_db()
+            with conn.cursor(DictCursor) as cursor:
+                if sent_ids:
+                    placeholders = ",".join(["%s"] * len(sent_ids))
+                    cursor.execute(
+                        f"DELETE FROM notification_outbox "
+                        f"WHERE outbox_id IN ({placeholders})",
+                        sent_ids,
+                    )
+                delays = {}
+                for outbox_id, delay in retry_after.items():
+                    delays.setdefault(delay, []).append(outbox_id)
+                for delay, ids in delays.items():
+                    placeholders = ",".join(["%s"] * len(ids))
+                    cursor.execute(
+                        f"UPDATE notification_outbox SET attempts = attempts + 1, "
+                        f"next_attempt_at = NOW() + INTERVAL %s SECOND "
+                        f"WHERE outbox_id IN ({placeholders})",
+                        [delay] + ids,
+                    )
+            conn.commit()
+        except pymysql.MySQLError as e:
+            if conn is not None:
+                conn.rollback()
+            Logger.warn(f"PYMYSQL: {str(e)}")
+            raise GenericDatabaseError(str(e))
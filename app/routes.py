@@ -7,7 +7,10 @@ from .controllers.admin_controllers import (
 )
 from .controllers.application_controllers import (
     AdminApplicationsStreamController,
+    ApplicationBulkUpdateController,
+    ApplicationCountsController,
     ApplicationsCreateController,
+    ApplicationsExportController,
     ApplicationsListController,
     ApplicationUpdateController,
     UserApplicationsStreamController,
@@ -17,9 +20,12 @@ from .controllers.application_controllers import (
 from .controllers.education_controllers import EducationController
 from .controllers.file_controllers import FileUploadController
 from .controllers.job_controllers import (
+    AdminJobsExportController,
     AdminJobsListController,
+    ImportJobsController,
     JobObjectController,
     JobsListController,
+    JobsSearchController,
     ModifyJobObjectController,
     PostJobController,
 )
@@ -28,6 +34,7 @@ from .controllers.profile_controllers import (
     ProfileGetController,
 )
 from .controllers.user_controllers import (
+    AppMetricsController,
     CheckAppHealthController,
     LoginUserController,
     RegisterUserController,
@@ -45,6 +52,7 @@ def register_routes(app):
 
     # App Status Check
     api.add_resource(CheckAppHealthController, f"{base}/health/check")
+    api.add_resource(AppMetricsController, f"{base}/health/metrics")
 
     # User Routes
     api.add_resource(RegisterUserController, f"{base}/user/register")
@@ -70,13 +78,18 @@ def register_routes(app):
 
     # Jobs Routes
     api.add_resource(JobsListController, f"{base}/public/jobs")
+    api.add_resource(JobsSearchController, f"{base}/public/jobs/search")
     api.add_resource(JobObjectController, f"{base}/public/jobs/<int:job_id>")
     api.add_resource(PostJobController, f"{base}/admin/jobs/create")
+    api.add_resource(ImportJobsController, f"{base}/admin/jobs/import")
     api.add_resource(AdminJobsListController, f"{base}/admin/jobs/list")
+    api.add_resource(AdminJobsExportController, f"{base}/admin/jobs/export")
 
     # Job Application Routes
     api.add_resource(ApplicationsCreateController, f"{base}/applications/job/create")
     api.add_resource(ApplicationsListController, f"{base}/applications/job/list")
+    api.add_resource(ApplicationCountsController, f"{base}/applications/job/counts")
+    api.add_resource(ApplicationsExportController, f"{base}/applications/job/export")
     api.add_resource(
         UserApplicationsStreamController, f"{base}/applications/user/stream"
     )
@@ -91,6 +104,7 @@ def register_routes(app):
         ApplicationUpdateController,
         f"{base}/applications/job/update/<int:application_id>",
     )
+    api.add_resource(ApplicationBulkUpdateController, f"{base}/applications/job/update")
     api.add_resource(FileUploadController, f"{base}/files/upload")
 
     @app.route("/uploads/<path:filename>")
@@ -1,5 +1,10 @@
 from marshmallow import Schema, fields, validate
 
+# Default page of /applications/user/list and the size of the user stream's
+# snapshot, so the dashboard's first page and its live updates cover the
+# same applications
+USER_APPLICATIONS_PAGE_SIZE = 50
+
 
 class JobPaginaNationSchema(Schema):
     job_id = fields.Int(
@@ -22,6 +27,49 @@ class JobPaginaNationSchema(Schema):
         validate=validate.Range(min=1, max=100),
         error_messages={'required': 'Limit must be between 1 and 100'}
     )
+    cursor = fields.String(
+        load_default=None,
+        validate=validate.Length(max=200),
+        error_messages={'invalid': 'Cursor must be the next_cursor of a page'}
+    )
+
+
+class JobIdSchema(Schema):
+    job_id = fields.Int(
+        required=True,
+        validate=[validate.Range(min=1)],
+        error_messages={
+            'required': 'This field is required',
+            'invalid': 'Must be an integer',
+            'min': 'Must be 1 or above'
+        }
+    )
+
+
+class JobApplicationsExportSchema(JobIdSchema):
+    format = fields.String(
+        load_default='ndjson',
+        validate=validate.OneOf(['ndjson', 'csv'])
+    )
+
+
+class UserApplicationsQuerySchema(Schema):
+    limit = fields.Int(
+        load_default=USER_APPLICATIONS_PAGE_SIZE,
+        validate=validate.Range(min=1, max=100),
+        error_messages={'invalid': 'Limit must be between 1 and 100'}
+    )
+    cursor = fields.String(
+        load_default=None,
+        validate=validate.Length(max=200),
+        error_messages={'invalid': 'Cursor must be the next_cursor of a page'}
+    )
+    status = fields.Int(
+        load_default=None,
+        validate=validate.OneOf([1, 2, 3, 4]),
+        error_messages={'invalid': 'Must be an integer between 1 and 4'}
+    )
+    include_cover_letter = fields.Bool(load_default=False)
 
 
 class JobApplicationSchema(Schema):
@@ -70,3 +118,24 @@ class ApplicationIdSchema(Schema):
             'min': 'Must be 1 or above'
         }
     )
+
+
+class BulkApplicationUpdateSchema(Schema):
+    application_ids = fields.List(
+        fields.Int(validate=validate.Range(min=1)),
+        required=True,
+        validate=validate.Length(min=1, max=500),
+        error_messages={
+            'required': 'This field is required',
+            'invalid': 'Must be a list of application ids'
+        }
+    )
+    status = fields.Int(
+        required=True,
+        validate=validate.OneOf([1, 2, 3, 4]),
+        error_messages={
+            'required': 'This field is required',
+            'invalid': 'Must be an integer',
+            'range': 'Must be between 1 and 4'
+        }
+    )
@@ -47,6 +47,17 @@ class JobSchema(Schema):
     updated_at = fields.DateTime(dump_only=True)
 
 
+class JobImportSchema(JobSchema):
+    details = fields.Nested(JobDetailsSchema, required=True)
+
+
+class ExportSchema(Schema):
+    format = fields.String(
+        load_default='ndjson',
+        validate=validate.OneOf(['ndjson', 'csv'])
+    )
+
+
 class PaginationSchema(Schema):
     page = fields.Int(
         load_default=1,
@@ -58,6 +69,43 @@ class PaginationSchema(Schema):
         validate=validate.Range(min=1, max=100),
         error_messages={'invalid': 'Limit must be between 1 and 100'}
     )
+    cursor = fields.String(
+        load_default=None,
+        validate=validate.Length(max=200),
+        error_messages={'invalid': 'Cursor must be the next_cursor of a page'}
+    )
+
+
+class JobSearchSchema(Schema):
+    q = fields.String(
+        load_default=None,
+        validate=[validate.Length(min=2, max=100)],
+        error_messages={"length_error": "Must be between 2 and 100 characters"}
+    )
+    location = fields.String(
+        load_default=None,
+        validate=[validate.Length(min=2, max=100)],
+        error_messages={"length_error": "Must be between 2 and 100 characters"}
+    )
+    employment_type = fields.String(
+        load_default=None,
+        validate=validate.OneOf(
+            ['Full time', 'Part time', 'Contract', 'Internship'])
+    )
+    status = fields.String(
+        load_default='Open',
+        validate=validate.OneOf(['Open', 'Closed', 'Draft'])
+    )
+    page = fields.Int(
+        load_default=1,
+        validate=validate.Range(min=1, max=100),
+        error_messages={'invalid': 'Page must be between 1 and 100'}
+    )
+    limit = fields.Int(
+        load_default=10,
+        validate=validate.Range(min=1, max=50),
+        error_messages={'invalid': 'Limit must be between 1 and 50'}
+    )
 
 
 class JobIdSchema(Schema):
@@ -1,24 +1,51 @@
+from datetime import datetime
+from typing import Iterator
+
+from ..repositories.application_counts_repository import summarize_counts
 from ..repositories.applications_repository import ApplicationRepository
-from ..services.notification_service import NotificationService
+from ..repositories.jobs_repository import JobRepository
+from ..schemas.application import USER_APPLICATIONS_PAGE_SIZE
 from ..utils.exceptions import GenericDatabaseError, InvalidCredentialsError
+from ..utils.helpers import Helpers
 from ..utils.logger import Logger
-from ..utils.security import Security
+
+
+def cursor_to_position(cursor: str) -> tuple[str, int]:
+    """(created_at, application_id) of the last applicant on the previous page"""
+    position = Helpers.decode_cursor(cursor)
+    try:
+        created_at = datetime.fromisoformat(position["created_at"])
+        return created_at.isoformat(sep=" "), int(position["application_id"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def applicants_cursor(applications: list, limit: int) -> str | None:
+    """Cursor after the last applicant of a full page, None otherwise"""
+    if len(applications) < limit or not applications:
+        return None
+    last = applications[limit - 1]
+    return Helpers.encode_cursor(
+        {"created_at": last["created_at"], "application_id": last["application_id"]}
+    )
+
+
+def cursor_to_application_id(cursor: str) -> int:
+    position = Helpers.decode_cursor(cursor)
+    try:
+        return int(position["application_id"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
 
 
 class ApplicationService:
 
     @staticmethod
-    def make_application(token: str, data: dict) -> bool:
+    def make_application(user_id: int, email: str, data: dict) -> bool:
         try:
-            decoded = Security.decode_jwt_token(token)
-            if not decoded:
-                Logger.warn(f"Could not decode token {token}")
-                raise InvalidCredentialsError(f"Could not decode token {token}")
-
-            user_id = decoded["profile_id"]
             if not user_id:
-                Logger.warn(f"Failed to get user_id from {decoded}")
-                raise ValueError(f"Failed to get user_id from {decoded}")
+                Logger.warn("make_application called without a user_id")
+                raise InvalidCredentialsError("Missing applicant")
 
             if not isinstance(data, dict):
                 Logger.warn(
@@ -28,40 +55,38 @@ class ApplicationService:
                     f"Invalid payload {data}. Wants object received list or None"
                 )
 
-            result = ApplicationRepository.create_application(user_id, data)
-            if result < 1:
-                return False
-
-            info = ApplicationRepository.get_job_info_for_notification(data["job_id"])
-            if isinstance(info, dict) and info.get("job_title"):
-                NotificationService.notify_applicant_of_submission(
-                    decoded["email"],
-                    info.get("job_title", "your role"),
-                    info.get("company_name", "the hiring team"),
-                )
-                if info.get("employer_email"):
-                    NotificationService.notify_employer_of_new_application(
-                        info.get("employer_email"),
-                        info.get("job_title", "a role"),
-                        decoded["email"],
-                    )
-            return True
+            # The notifications go into the outbox with the insert; the
+            # outbox relay sends them, so no broker I/O happens here
+            result = ApplicationRepository.create_application(user_id, data, email)
+            return result >= 1
         except Exception as e:
             raise GenericDatabaseError(f"Error occurred {str(e)}")
 
     @staticmethod
     def get_all_job_applications(
-        token: str, job_id: int, limit: int, page: int
+        admin_id: int, job_id: int, limit: int, page: int, cursor: str | None = None
     ) -> dict:
         try:
-            decoded = Security.decode_jwt_token(token)
-            if not decoded:
-                Logger.warn(f"Could not decode token {token}")
-                raise InvalidCredentialsError(f"Could not decode token {token}")
-
-            admin_id = decoded["profile_id"]
             if not admin_id:
-                raise ValueError("Admin id missing from token")
+                raise ValueError("Admin id missing")
+
+            if cursor:
+                after_created_at, after_id = cursor_to_position(cursor)
+                # One extra row tells whether another page exists
+                rows = ApplicationRepository.get_jobs_applications_after(
+                    job_id, admin_id, after_created_at, after_id, limit + 1
+                )
+                applications = rows[:limit]
+                return {
+                    "limit": limit,
+                    "count": len(applications),
+                    "applications": applications,
+                    "next_cursor": (
+                        applicants_cursor(applications, limit)
+                        if len(rows) > limit
+                        else None
+                    ),
+                }
 
             offset = (page - 1) * limit
             applications = ApplicationRepository.get_jobs_applications(
@@ -73,23 +98,48 @@ class ApplicationService:
                 "limit": limit,
                 "count": len(applications),
                 "applications": applications,
+                "next_cursor": applicants_cursor(applications, limit),
             }
         except Exception as e:
             Logger.warn(f"Error occurred {str(e)}")
             raise GenericDatabaseError(f"Error occurred {str(e)}")
 
     @staticmethod
-    def get_job_application(token: str, job_id: int) -> dict:
+    def count_job_applications(admin_id: int, job_id: int) -> dict:
+        """Total and per-status applicant numbers for an employer's job."""
+        try:
+            job = JobRepository.get_job(job_id)
+            if not admin_id or not job or job.get("admin_id") != admin_id:
+                raise InvalidCredentialsError(f"Job {job_id} is not yours")
+
+            counts = ApplicationRepository.count_job_applications(job_id)
+            return {"job_id": job_id, **summarize_counts(counts)}
+        except InvalidCredentialsError:
+            raise
+        except Exception as e:
+            Logger.warn(f"Error occurred {str(e)}")
+            raise GenericDatabaseError(f"Error occurred {str(e)}")
+
+    @staticmethod
+    def export_job_applications(admin_id: int, job_id: int) -> Iterator[dict]:
+        """
+        Every application of an employer's job, streamed from the database.
+        Ownership is checked here, before the response starts.
+        """
         try:
-            decoded = Security.decode_jwt_token(token)
-            if not decoded:
-                Logger.warn(f"Could not decode token {token}")
-                raise InvalidCredentialsError(f"Could not decode token {token}")
+            job = JobRepository.get_job(job_id)
+        except Exception as e:
+            Logger.warn(f"Error occurred {str(e)}")
+            raise GenericDatabaseError(f"Error occurred {str(e)}")
+        if not admin_id or not job or job.get("admin_id") != admin_id:
+            raise InvalidCredentialsError(f"Job {job_id} is not yours")
+        return ApplicationRepository.stream_job_applications(job_id, admin_id)
 
-            user_id = decoded["profile_id"]
+    @staticmethod
+    def get_job_application(user_id: int, job_id: int) -> dict:
+        try:
             if not user_id:
-                Logger.warn(f"Failed to get user_id from {decoded}")
-                raise ValueError(f"Failed to get user_id from {decoded}")
+                raise InvalidCredentialsError("Missing applicant")
 
             return ApplicationRepository.get_user_application(user_id, job_id)
         except Exception as e:
@@ -97,51 +147,74 @@ class ApplicationService:
             raise GenericDatabaseError(f"Error occurred {str(e)}")
 
     @staticmethod
-    def list_users_applications(token: str) -> list:
+    def list_users_applications(
+        user_id: int,
+        limit: int = USER_APPLICATIONS_PAGE_SIZE,
+        cursor: str | None = None,
+        status: int | None = None,
+        include_cover_letter: bool = False,
+    ) -> dict:
         try:
-            decoded = Security.decode_jwt_token(token)
-            if not decoded:
-                Logger.warn(f"Could not decode token {token}")
-                raise InvalidCredentialsError(f"Could not decode token {token}")
-
-            user_id = decoded["profile_id"]
             if not user_id:
-                Logger.warn(f"Failed to get user_id from {decoded}")
-                raise ValueError(f"Failed to get user_id from {decoded}")
+                raise InvalidCredentialsError("Missing applicant")
 
-            return ApplicationRepository.get_user_applications(user_id)
+            before_id = cursor_to_application_id(cursor) if cursor else None
+            # One extra row tells whether another page exists
+            rows = ApplicationRepository.get_user_applications(
+                user_id, limit + 1, before_id, status, include_cover_letter
+            )
+            applications = rows[:limit]
+            next_cursor = None
+            if len(rows) > limit:
+                next_cursor = Helpers.encode_cursor(
+                    {"application_id": applications[-1]["application_id"]}
+                )
+            return {
+                "limit": limit,
+                "count": len(applications),
+                "applications": applications,
+                "next_cursor": next_cursor,
+            }
         except Exception as e:
             Logger.warn(f"Error occurred {str(e)}")
             raise GenericDatabaseError(f"Error occurred {str(e)}")
 
     @staticmethod
-    def update_an_application(token: str, app_id: int, status: int) -> bool:
+    def update_an_application(admin_id: int, app_id: int, status: int) -> bool:
         try:
-            decoded = Security.decode_jwt_token(token)
-            if not decoded:
-                Logger.warn(f"Could not decode token {token}")
-                raise InvalidCredentialsError(f"Could not decode token {token}")
-
-            admin_id = decoded["profile_id"]
             if not admin_id:
-                Logger.warn(f"Failed to get user_id from {decoded}")
-                raise ValueError(f"Failed to get user_id from {decoded}")
+                raise InvalidCredentialsError("Missing admin")
 
-            updated = (
+            # The status email is queued in the outbox by the same update
+            return (
                 ApplicationRepository.update_application(app_id, admin_id, status) > 0
             )
-            if not updated:
-                return False
-
-            details = ApplicationRepository.get_application_details(app_id)
-            if details and details.get("applicant_email"):
-                NotificationService.notify_applicant_status_change(
-                    details["applicant_email"],
-                    details.get("job_title", "your application"),
-                    status,
-                    details.get("company_name"),
-                )
-            return True
+        except Exception as e:
+            Logger.warn(f"Error occurred {str(e)}")
+            raise GenericDatabaseError(f"Error occurred {str(e)}")
+
+    @staticmethod
+    def bulk_update_applications(
+        admin_id: int, application_ids: list[int], status: int
+    ) -> dict:
+        """
+        Move many applications to ``status`` at once. Ids that are unknown
+        or on another employer's jobs are reported in ``not_updated``.
+        """
+        try:
+            if not admin_id:
+                raise InvalidCredentialsError("Missing admin")
+
+            requested = list(dict.fromkeys(application_ids))
+            updated = ApplicationRepository.update_applications(
+                requested, admin_id, status
+            )
+            done = set(updated)
+            return {
+                "status": status,
+                "updated": updated,
+                "not_updated": [i for i in requested if i not in done],
+            }
         except Exception as e:
             Logger.warn(f"Error occurred {str(e)}")
             raise GenericDatabaseError(f"Error occurred {str(e)}")
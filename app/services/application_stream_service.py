@@ -0,0 +1,216 @@
+import json
+import time
+from typing import Any, Callable, Iterator, NamedTuple
+
+from flask import current_app
+
+from ..db.db import DB
+from ..extensions.event_hub import RESYNC, EventHub
+from ..repositories.application_events import job_channel, user_channel
+from ..repositories.applications_repository import ApplicationRepository
+from ..repositories.jobs_repository import JobRepository
+from ..schemas.application import USER_APPLICATIONS_PAGE_SIZE
+from ..utils.exceptions import InvalidCredentialsError
+from ..utils.logger import Logger
+from ..utils.security import Security
+
+ADMIN_PAGE_LIMIT = 10
+
+ERROR_EVENT = 'event: error\ndata: {"message":"Unable to fetch updates"}\n\n'
+EXPIRED_EVENT = 'event: error\ndata: {"message":"Token expired"}\n\n'
+KEEP_ALIVE = ": keep-alive\n\n"
+
+
+def sse(payload: dict, event: str | None = None) -> str:
+    data = json.dumps(payload, default=str)
+    if event:
+        return f"event: {event}\ndata: {data}\n\n"
+    return f"data: {data}\n\n"
+
+
+def release_connections() -> None:
+    """
+    Hand the request's MySQL connection back between snapshots.
+    A stream can stay open for hours; it must not pin a pooled connection
+    while it waits for events. Redis commands return theirs on completion.
+    """
+    DB.close_db()
+
+
+def decode_token(token: str) -> dict:
+    decoded = Security.decode_jwt_token(token)
+    if not decoded or not decoded.get("profile_id"):
+        Logger.warn(f"Could not decode token {token}")
+        raise InvalidCredentialsError(f"Could not decode token {token}")
+    return decoded
+
+
+class StreamSpec(NamedTuple):
+    """What a stream listens to and how it rebuilds and patches its payload."""
+
+    decoded: dict
+    channel: str
+    refresh: Callable[[], tuple]
+    apply: Callable[[Any, dict], str | None]
+
+
+def token_expired(decoded: dict) -> bool:
+    expires_at = decoded.get("exp")
+    return bool(expires_at) and time.time() >= expires_at
+
+
+class ApplicationStreamService:
+    """
+    Server-Sent Event streams of job applications.
+
+    A stream sends one snapshot, then waits on the worker's ``EventHub``
+    subscription instead of polling MySQL. Each change is sent twice: as an
+    ``application`` event carrying only the delta, and as a default
+    ``data:`` message with the full payload patched in memory, so existing
+    ``onmessage`` clients keep working unchanged. The snapshot is only
+    re-queried when an event cannot be applied locally (a new application,
+    a dropped event after overflow or a Redis reconnect).
+
+    The ``*_spec`` builders are shared with the asyncio serving path in
+    ``app.asgi``; only the waiting loop differs between the two.
+    """
+
+    @staticmethod
+    def user_stream_spec(token: str) -> StreamSpec:
+        decoded = decode_token(token)
+        user_id = decoded["profile_id"]
+
+        def refresh():
+            applications = ApplicationStreamService._user_snapshot(user_id)
+            return applications, sse({"applications": list(applications.values())})
+
+        def apply(applications, event):
+            changed = event["application"]
+            if event["type"] != "updated":
+                return None
+            current = applications.get(changed["application_id"])
+            if current is None:
+                # Not on the streamed page, nothing visible changed
+                return ""
+            current.update(changed)
+            return sse({"applications": list(applications.values())})
+
+        return StreamSpec(decoded, user_channel(user_id), refresh, apply)
+
+    @staticmethod
+    def admin_stream_spec(token: str, job_id: int) -> StreamSpec:
+        decoded = decode_token(token)
+        admin_id = decoded["profile_id"]
+        job = JobRepository.get_job(job_id)
+        if not job or job.get("admin_id") != admin_id:
+            raise InvalidCredentialsError(f"Job {job_id} is not yours")
+
+        def refresh():
+            page = ApplicationStreamService._admin_snapshot(job_id, admin_id)
+            return page, sse(page)
+
+        def apply(page, event):
+            changed = event["application"]
+            if event["type"] != "updated":
+                return None
+            for row in page["applications"]:
+                if row["application_id"] == changed["application_id"]:
+                    row["status"] = changed["status"]
+                    row["modified_at"] = changed.get("modified_at")
+                    return sse(page)
+            # Not on the streamed page, nothing visible changed
+            return ""
+
+        return StreamSpec(decoded, job_channel(job_id), refresh, apply)
+
+    @staticmethod
+    def open_user_stream(token: str) -> Iterator[str]:
+        """Validate the token now so the controller can still answer 401."""
+        spec = ApplicationStreamService.user_stream_spec(token)
+        return ApplicationStreamService._run(spec)
+
+    @staticmethod
+    def open_admin_stream(token: str, job_id: int) -> Iterator[str]:
+        spec = ApplicationStreamService.admin_stream_spec(token, job_id)
+        return ApplicationStreamService._run(spec)
+
+    @staticmethod
+    def _user_snapshot(user_id: int) -> dict:
+        try:
+            # The newest page; older applications come from the list API
+            rows = ApplicationRepository.get_user_applications(
+                user_id, USER_APPLICATIONS_PAGE_SIZE
+            )
+        finally:
+            release_connections()
+        return {row["application_id"]: row for row in rows}
+
+    @staticmethod
+    def _admin_snapshot(job_id: int, admin_id: int) -> dict:
+        try:
+            rows = ApplicationRepository.get_jobs_applications(
+                job_id, ADMIN_PAGE_LIMIT, 0, admin_id
+            )
+        finally:
+            release_connections()
+        return {
+            "page": 1,
+            "limit": ADMIN_PAGE_LIMIT,
+            "count": len(rows),
+            "applications": rows,
+        }
+
+    @staticmethod
+    def step(spec: StreamSpec, state, event: dict) -> tuple[list[str], bool]:
+        """
+        Messages to send for one hub event, and whether the snapshot must be
+        reloaded with ``spec.refresh()`` afterwards.
+        """
+        if event is RESYNC:
+            return [], True
+        messages = [sse(event, "application")]
+        message = spec.apply(state, event)
+        if message is None:
+            return messages, True
+        if message:
+            messages.append(message)
+        return messages, False
+
+    @staticmethod
+    def _run(spec: StreamSpec) -> Iterator[str]:
+        config = current_app.config
+        heartbeat = float(config.get("SSE_HEARTBEAT_SECONDS", 15))
+        queue_size = int(config.get("SSE_CLIENT_QUEUE_SIZE", 100))
+
+        # Subscribe before the snapshot so nothing committed in between is lost
+        subscription = EventHub.instance().subscribe(spec.channel, queue_size)
+        try:
+            try:
+                state, message = spec.refresh()
+                yield message
+            except Exception as e:
+                Logger.warn(f"Stream snapshot for {spec.channel} failed: {str(e)}")
+                yield ERROR_EVENT
+                return
+
+            while True:
+                if token_expired(spec.decoded):
+                    yield EXPIRED_EVENT
+                    return
+
+                event = subscription.get(timeout=heartbeat)
+                if event is None:
+                    yield KEEP_ALIVE
+                    continue
+
+                try:
+                    messages, stale = ApplicationStreamService.step(spec, state, event)
+                    yield from messages
+                    if stale:
+                        state, message = spec.refresh()
+                        yield message
+                except Exception as e:
+                    Logger.warn(f"Stream update for {spec.channel} failed: {str(e)}")
+                    yield ERROR_EVENT
+        finally:
+            subscription.close()
@@ -1,9 +1,51 @@
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+from marshmallow import ValidationError
+
+from ..repositories.application_counts_repository import (
+    ApplicationCountsRepository,
+    summarize_counts,
+)
 from ..repositories.jobs_repository import JobRepository
-from ..utils.exceptions import GenericDatabaseError, InvalidLoginAttemptError
+from ..schemas.job import JobImportSchema
+from ..utils.exceptions import (
+    GenericDatabaseError,
+    ImportRowError,
+    InvalidLoginAttemptError,
+)
+from ..utils.helpers import Helpers
 from ..utils.logger import Logger
-from ..utils.security import Security
+
+
+# Helpers
+def cursor_to_job_id(cursor: str) -> int:
+    position = Helpers.decode_cursor(cursor)
+    try:
+        return int(position["job_id"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def next_cursor(jobs: list, limit: int) -> str | None:
+    """Cursor after the last job of a full page, None on the last page"""
+    if len(jobs) < limit or not jobs:
+        return None
+    return Helpers.encode_cursor({"job_id": jobs[limit - 1]["job_id"]})
+
+
+def keyset_page(rows: list, limit: int) -> dict:
+    """Build a page from ``limit + 1`` rows, the extra row only signals more"""
+    jobs = rows[:limit]
+    cursor = next_cursor(jobs, limit) if len(rows) > limit else None
+    return {"limit": limit, "count": len(jobs), "jobs": jobs, "next_cursor": cursor}
+
+
+def with_application_counts(jobs: list) -> list:
+    """Attach each job's applicant numbers, read for the whole page at once"""
+    counts = ApplicationCountsRepository.get_counts([job["job_id"] for job in jobs])
+    for job in jobs:
+        job["applications"] = summarize_counts(counts.get(job["job_id"], {}))
+    return jobs
 
 
 class JobService:
@@ -14,21 +56,12 @@ class JobService:
             if not isinstance(data, dict):
                 return None
 
-            # 1. Get the token and check if it is valid
-            token = data["token"]
-            decoded = Security.decode_jwt_token(token)
-
-            # 2. Compare the decoded tokens id with the provided id
-            token_admin_id = decoded["profile_id"]
-            if not token_admin_id:
-                Logger.warn(f"Provided token {token} is not related to {
-                        decoded['email']}")
+            # 1. The controller resolves the admin from the bearer token
+            if not data.get("admin_id"):
+                Logger.warn(f"Job {data} has no admin_id")
                 raise InvalidLoginAttemptError("Unauthorized job creation attempt")
 
-            # 3. Add admin_id into the data
-            data["admin_id"] = token_admin_id
-
-            # 4. Attempt to insert the job into the jobs table
+            # 2. Attempt to insert the job into the jobs table
             row_id = JobRepository.insert_job(data)
             if row_id is None:
                 Logger.warn(f"Errr while creating {data} job")
@@ -43,26 +76,150 @@ class JobService:
             raise GenericDatabaseError(f"Error because of {str(e)}")
 
     @staticmethod
-    def fetch_jobs(page: int, limit: int) -> dict:
+    def import_jobs(
+        admin_id: int, items: Iterable, chunk_size: int = 200, max_rows: int = 5000
+    ) -> dict:
+        """
+        Validate and insert jobs ``chunk_size`` at a time, each chunk with
+        one multi-row INSERT in its own transaction. Every row gets a
+        result, numbered from 1, so the caller can resend only the failed
+        ones. Rows past ``max_rows`` are not read and ``truncated`` is set.
+        """
+        if not admin_id:
+            raise InvalidLoginAttemptError("Unauthorized job import attempt")
+
+        schema = JobImportSchema(many=True)
+        results: list[dict] = []
+        created = 0
+        truncated = False
+        chunk: list[tuple[int, Any]] = []
+        for row, item in enumerate(items, start=1):
+            if row > max_rows:
+                truncated = True
+                break
+            chunk.append((row, item))
+            if len(chunk) == chunk_size:
+                created += JobService._import_chunk(admin_id, chunk, schema, results)
+                chunk = []
+        if chunk:
+            created += JobService._import_chunk(admin_id, chunk, schema, results)
+
+        Logger.info(f"Admin {admin_id} imported {created} of {len(results)} jobs")
+        return {
+            "created": created,
+            "failed": len(results) - created,
+            "truncated": truncated,
+            "results": results,
+        }
+
+    @staticmethod
+    def _import_chunk(
+        admin_id: int, chunk: list, schema: JobImportSchema, results: list
+    ) -> int:
+        items = [item for _, item in chunk]
+        try:
+            loaded = schema.load(
+                [None if isinstance(item, ImportRowError) else item for item in items]
+            )
+            errors = {}
+        except ValidationError as e:
+            loaded, errors = e.valid_data, e.messages
+        for index, item in enumerate(items):
+            if isinstance(item, ImportRowError):
+                errors[index] = {"_schema": [str(item)]}
+
+        valid = [index for index in range(len(items)) if index not in errors]
+        jobs = [
+            {
+                "title": loaded[index]["title"],
+                "admin_id": admin_id,
+                **loaded[index]["details"],
+            }
+            for index in valid
+        ]
         try:
+            job_ids = JobRepository.insert_jobs(jobs)
+        except GenericDatabaseError as e:
+            Logger.warn(f"Import chunk of {len(jobs)} jobs failed: {str(e)}")
+            job_ids = []
+            for index in valid:
+                errors[index] = {"_schema": ["Job could not be saved"]}
+
+        saved = dict(zip(valid, job_ids))
+        for index, (row, _) in enumerate(chunk):
+            if index in saved:
+                results.append({"row": row, "job_id": saved[index]})
+            else:
+                results.append({"row": row, "errors": errors[index]})
+        return len(job_ids)
+
+    @staticmethod
+    def fetch_jobs(page: int, limit: int, cursor: str | None = None) -> dict:
+        try:
+            if cursor:
+                after_id = cursor_to_job_id(cursor)
+                rows = JobRepository.get_jobs_after(after_id, limit + 1)
+                return keyset_page(rows, limit)
+
             offset = (page - 1) * limit
             jobs = JobRepository.get_jobs(limit, offset)
 
-            return {"page": page, "limit": limit, "count": len(jobs), "jobs": jobs}
+            return {
+                "page": page,
+                "limit": limit,
+                "count": len(jobs),
+                "jobs": jobs,
+                "next_cursor": next_cursor(jobs, limit),
+            }
         except Exception as e:
             Logger.warn(f"Error occurred {str(e)}")
             raise GenericDatabaseError(f"{str(e)}")
 
     @staticmethod
-    def fetch_admin_jobs(token: str, page: int, limit: int) -> dict:
+    def fetch_admin_jobs(
+        admin_id: int, page: int, limit: int, cursor: str | None = None
+    ) -> dict:
         try:
-            decoded = Security.decode_jwt_token(token)
-            admin_id = decoded["profile_id"]
             if not admin_id:
                 raise InvalidLoginAttemptError("Unauthorized admin access")
 
+            if cursor:
+                after_id = cursor_to_job_id(cursor)
+                rows = JobRepository.get_jobs_by_admin_after(
+                    admin_id, after_id, limit + 1
+                )
+                page_result = keyset_page(rows, limit)
+                with_application_counts(page_result["jobs"])
+                return page_result
+
+            offset = (page - 1) * limit
+            jobs = with_application_counts(
+                JobRepository.get_jobs_by_admin(admin_id, limit, offset)
+            )
+
+            return {
+                "page": page,
+                "limit": limit,
+                "count": len(jobs),
+                "jobs": jobs,
+                "next_cursor": next_cursor(jobs, limit),
+            }
+        except Exception as e:
+            Logger.warn(f"Error occurred {str(e)}")
+            raise GenericDatabaseError(f"{str(e)}")
+
+    @staticmethod
+    def export_admin_jobs(admin_id: int) -> Iterator[dict]:
+        """All of the admin's jobs, streamed from the database"""
+        if not admin_id:
+            raise InvalidLoginAttemptError("Unauthorized admin access")
+        return JobRepository.stream_jobs_by_admin(admin_id)
+
+    @staticmethod
+    def search_jobs(filters: dict[str, Any], page: int, limit: int) -> dict:
+        try:
             offset = (page - 1) * limit
-            jobs = JobRepository.get_jobs_by_admin(admin_id, limit, offset)
+            jobs = JobRepository.search_jobs(filters, limit, offset)
 
             return {"page": page, "limit": limit, "count": len(jobs), "jobs": jobs}
         except Exception as e:
@@ -78,13 +235,9 @@ class JobService:
             raise GenericDatabaseError(f"{str(e)}")
 
     @staticmethod
-    def update_job(job_id: int, token: str, data: dict[str, Any]) -> dict:
+    def update_job(job_id: int, admin_id: int, data: dict[str, Any]) -> dict:
         try:
-            decoded = Security.decode_jwt_token(token)
-            admin_id = decoded["profile_id"]
             if not admin_id:
-                Logger.warn(f"Provided token {token} is not related to {
-                        decoded['email']}")
                 raise InvalidLoginAttemptError("Unauthorized job update attempt")
 
             affected_row = JobRepository.update_job(job_id, admin_id, data)
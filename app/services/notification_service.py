@@ -1,9 +1,20 @@
 import os
+from collections import defaultdict
 from typing import Optional
 
 from flask import current_app
 
+from ..extensions.celery import (
+    PRIORITY_AUTH,
+    PRIORITY_RESET,
+    QUEUE_AUTH,
+    QUEUE_RESET,
+    celery,
+)
+from ..repositories.notification_digest_cache import NotificationDigestCache
+from ..utils.logger import Logger
 from ..utils.mails import Mails
+from ..utils.metrics import Metrics
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
 
@@ -23,6 +34,115 @@ def _friendly_status(status: int) -> str:
     return APPLICATION_STATUS_LABELS.get(status, str(status))
 
 
+# Seconds a flush waits past the window so a worker whose clock runs a
+# little behind the web nodes still finds the recipient due
+DIGEST_GRACE_SECONDS = 5
+
+# Mailgun accepts at most 1000 recipients per batch message
+MAILGUN_MAX_BATCH = 1000
+
+
+def _submission_message(item: dict) -> tuple[str, str]:
+    subject = _subject("Candidate", "Your application is received")
+    body = (
+        f"Hi,\n\nYour application for '{item['job_title']}' "
+        f"at {item['company_name']} has been received."
+        "\nWe will notify you when your hiring status changes.\n\n"
+        "Track progress from your dashboard.\n\nBest,\nRecruiting team"
+    )
+    return subject, body
+
+
+def _new_application_message(item: dict) -> tuple[str, str]:
+    subject = _subject("Employer", "New candidate application")
+    body = (
+        f"Hi,\n\nA new application has been submitted for '{item['job_title']}' "
+        f"by {item['applicant_email']}."
+        "\nReview the application and update the status from your employer "
+        "dashboard.\n\nBest,\nRecruiting platform"
+    )
+    return subject, body
+
+
+def _status_message(item: dict) -> tuple[str, str]:
+    status_label = _friendly_status(item["status"])
+    company_label = f" at {item['company_name']}" if item.get("company_name") else ""
+    subject = _subject("Candidate", "Application status updated")
+    body = (
+        f"Hi,\n\nThe status of your application for "
+        f"'{item['job_title']}'{company_label}"
+        f"has changed to '{status_label}'.\n\n"
+        "You can view the latest updates in your dashboard.\n\nBest,\nRecruiting team"
+    )
+    return subject, body
+
+
+MESSAGES = {
+    "submission": _submission_message,
+    "new_application": _new_application_message,
+    "status": _status_message,
+}
+
+
+def _digest_message(items: list[dict]) -> tuple[str, str]:
+    """
+    One email for everything a recipient was sent during a window.
+    New applications are grouped per job, and only the latest status
+    of each application is kept.
+    """
+    applicants = defaultdict(list)
+    statuses = {}
+    lines = []
+    for item in items:
+        if item["type"] == "new_application":
+            applicants[item["job_title"]].append(item["applicant_email"])
+        elif item["type"] == "status":
+            statuses[(item["job_title"], item.get("company_name"))] = item
+        else:
+            lines.append(
+                f"- Your application for '{item['job_title']}' at "
+                f"{item['company_name']} has been received."
+            )
+    for (job_title, company_name), item in statuses.items():
+        company_label = f" at {company_name}" if company_name else ""
+        lines.append(
+            f"- Your application for '{job_title}'{company_label} is now "
+            f"'{_friendly_status(item['status'])}'."
+        )
+
+    if applicants and not lines:
+        count = sum(len(emails) for emails in applicants.values())
+        subject = _subject("Employer", f"{count} new candidate applications")
+        sections = [
+            f"'{job_title}' ({len(emails)}):\n"
+            + "\n".join(f"  - {email}" for email in emails)
+            for job_title, emails in applicants.items()
+        ]
+        return subject, (
+            "Hi,\n\nNew applications were submitted for your jobs:\n\n"
+            + "\n\n".join(sections)
+            + "\n\nReview them and update their status from your employer "
+            "dashboard.\n\nBest,\nRecruiting platform"
+        )
+
+    for job_title, emails in applicants.items():
+        lines.append(f"- {len(emails)} new application(s) for '{job_title}'.")
+    subject = _subject("Candidate", f"{len(lines)} application updates")
+    return subject, (
+        "Hi,\n\nHere is what changed since our last email:\n\n"
+        + "\n".join(lines)
+        + "\n\nYou can view the latest updates in your dashboard."
+        "\n\nBest,\nRecruiting team"
+    )
+
+
+def render(items: list[dict]) -> tuple[str, str]:
+    """Subject and body for a recipient's buffered items."""
+    if len(items) == 1:
+        return MESSAGES[items[0]["type"]](items[0])
+    return _digest_message(items)
+
+
 class NotificationService:
     @staticmethod
     def send_verification_code(email: str, code: str, is_admin: bool = False) -> bool:
@@ -35,11 +155,10 @@ class NotificationService:
             f"Thank you,\n{role} team"
         )
 
-        Mails.send_mail_task.delay(
-            current_app.config["EMAIL_FROM"],
-            email,
-            subject,
-            body,
+        Mails.send_mail_task.apply_async(
+            args=(current_app.config["EMAIL_FROM"], email, subject, body),
+            queue=QUEUE_AUTH,
+            priority=PRIORITY_AUTH,
         )
 
         return True
@@ -55,11 +174,10 @@ class NotificationService:
             "Thanks,\nCandidate support"
         )
 
-        Mails.send_mail_task.delay(
-            current_app.config["EMAIL_FROM"],
-            email,
-            subject,
-            body,
+        Mails.send_mail_task.apply_async(
+            args=(current_app.config["EMAIL_FROM"], email, subject, body),
+            queue=QUEUE_RESET,
+            priority=PRIORITY_RESET,
         )
 
         return True
@@ -68,54 +186,65 @@ class NotificationService:
     def notify_applicant_of_submission(
         email: str, job_title: str, company_name: str
     ) -> bool:
-        subject = _subject("Candidate", "Your application is received")
-        body = (
-            f"Hi,\n\nYour application for '{job_title}' at {company_name} has been received."
-            "\nWe will notify you when your hiring status changes.\n\n"
-            "Track progress from your dashboard.\n\nBest,\nRecruiting team"
-        )
-
-        Mails.send_mail_task.delay(
-            current_app.config["EMAIL_FROM"],
+        return NotificationService._notify(
             email,
-            subject,
-            body,
+            {
+                "type": "submission",
+                "job_title": job_title,
+                "company_name": company_name,
+            },
         )
 
-        return True
-
     @staticmethod
     def notify_employer_of_new_application(
         email: str, job_title: str, applicant_email: str
     ) -> bool:
-        subject = _subject("Employer", "New candidate application")
-        body = (
-            f"Hi,\n\nA new application has been submitted for '{job_title}' by {applicant_email}."
-            "\nReview the application and update the status from your employer dashboard.\n\nBest,\nRecruiting platform"
-        )
-
-        Mails.send_mail_task.delay(
-            current_app.config["EMAIL_FROM"],
+        return NotificationService._notify(
             email,
-            subject,
-            body,
+            {
+                "type": "new_application",
+                "job_title": job_title,
+                "applicant_email": applicant_email,
+            },
         )
 
-        return True
-
     @staticmethod
     def notify_applicant_status_change(
         email: str, job_title: str, status: int, company_name: Optional[str] = None
     ) -> bool:
-        status_label = _friendly_status(status)
-        company_label = f" at {company_name}" if company_name else ""
-        subject = _subject("Candidate", "Application status updated")
-        body = (
-            f"Hi,\n\nThe status of your application for '{job_title}'{company_label}"
-            f"has changed to '{status_label}'.\n\n"
-            "You can view the latest updates in your dashboard.\n\nBest,\nRecruiting team"
+        return NotificationService._notify(
+            email,
+            {
+                "type": "status",
+                "job_title": job_title,
+                "status": status,
+                "company_name": company_name,
+            },
         )
 
+    @staticmethod
+    def _notify(email: str, item: dict) -> bool:
+        """
+        Buffer an application notification for the recipient's digest.
+        With no digest window configured, or when Redis is unreachable,
+        the email is sent on its own right away.
+        """
+        window = float(current_app.config.get("NOTIFICATION_DIGEST_WINDOW_SECONDS", 0))
+        if window > 0:
+            try:
+                opened = NotificationDigestCache.add(email, item)
+                Metrics.incr("notifications.buffered")
+            except Exception as e:
+                Logger.warn(f"Digest buffer unavailable, sending directly: {str(e)}")
+                Metrics.incr("notifications.buffer_errors")
+            else:
+                if opened:
+                    NotificationService.flush_digests_task.apply_async(
+                        countdown=window + DIGEST_GRACE_SECONDS
+                    )
+                return True
+
+        subject, body = render([item])
         Mails.send_mail_task.delay(
             current_app.config["EMAIL_FROM"],
             email,
@@ -124,3 +253,51 @@ class NotificationService:
         )
 
         return True
+
+    @staticmethod
+    def flush_digests() -> int | None:
+        """
+        Render every recipient whose window has elapsed and hand them to
+        Mailgun in batches. Returns the number of digests queued, or
+        ``None`` when another flush is already running.
+        """
+        if not NotificationDigestCache.acquire_flush_lock():
+            return None
+
+        window = float(current_app.config.get("NOTIFICATION_DIGEST_WINDOW_SECONDS", 0))
+        batch_size = min(
+            int(current_app.config.get("MAILGUN_BATCH_SIZE", MAILGUN_MAX_BATCH)),
+            MAILGUN_MAX_BATCH,
+        )
+        queued = 0
+        try:
+            while True:
+                digests = NotificationDigestCache.pop_due(window, batch_size)
+                if not digests:
+                    break
+
+                recipients = {}
+                for email, items in digests.items():
+                    subject, body = render(items)
+                    recipients[email] = {"subject": subject, "body": body}
+                    Metrics.incr("notifications.coalesced", len(items) - 1)
+
+                Mails.send_batch_task.delay(
+                    current_app.config["EMAIL_FROM"], recipients
+                )
+                Metrics.incr("notifications.batches")
+                queued += len(recipients)
+                if len(digests) < batch_size:
+                    break
+        finally:
+            NotificationDigestCache.release_flush_lock()
+
+        Logger.info(f"Queued {queued} notification digests")
+        return queued
+
+    @staticmethod
+    @celery.task(bind=True, max_retries=None)
+    def flush_digests_task(self):
+        if NotificationService.flush_digests() is None:
+            # Another flush holds the lock; try again once it has finished
+            raise self.retry(countdown=DIGEST_GRACE_SECONDS)
@@ -0,0 +1,133 @@
+import time
+
+from ..repositories.applications_repository import ApplicationRepository
+from ..repositories.outbox_repository import (
+    APPLICATION_CREATED,
+    APPLICATION_STATUS_CHANGED,
+    OutboxRepository,
+)
+from ..utils.logger import Logger
+from ..utils.metrics import Metrics
+from .notification_service import NotificationService
+
+
+def _application_created(payload: dict, job: dict) -> None:
+    NotificationService.notify_applicant_of_submission(
+        payload["applicant_email"],
+        job.get("job_title") or "your role",
+        job.get("company_name") or "the hiring team",
+    )
+    if job.get("employer_email"):
+        NotificationService.notify_employer_of_new_application(
+            job["employer_email"],
+            job.get("job_title") or "a role",
+            payload["applicant_email"],
+        )
+
+
+def _status_changed(payload: dict, job: dict) -> None:
+    NotificationService.notify_applicant_status_change(
+        payload["applicant_email"],
+        job.get("job_title") or "your application",
+        payload["status"],
+        job.get("company_name"),
+    )
+
+
+HANDLERS = {
+    APPLICATION_CREATED: _application_created,
+    APPLICATION_STATUS_CHANGED: _status_changed,
+}
+
+# Longest a failed row waits before it is tried again
+OUTBOX_RETRY_MAX_SECONDS = 3600
+
+
+def retry_delay(attempts: int, retry_seconds: int) -> int:
+    """Seconds before the next try of a row that has failed ``attempts`` times"""
+    return min(retry_seconds * 2**attempts, OUTBOX_RETRY_MAX_SECONDS)
+
+
+class OutboxRelay:
+    """
+    Moves notifications from ``notification_outbox`` to the mail queues.
+
+    A batch of rows is leased, the job details they mention are looked up
+    once per job (through the job cache), each row is handed to
+    ``NotificationService`` (digest buffer or Celery), and the rows that
+    went out are deleted. Rows about a job that no longer exists are
+    dropped without an email. A row whose handler fails has its
+    ``attempts`` counted and is tried again after a backoff that doubles
+    with every failure, so a broker outage of a few minutes is ridden
+    out; after ``max_attempts`` it is no longer claimed and stays in the
+    table for inspection. Delivery is at least once: a relay that dies
+    after publishing but before completing re-sends once the lease ends.
+    """
+
+    @staticmethod
+    def drain(
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        lease_seconds: int = 60,
+        retry_seconds: int = 30,
+    ) -> int:
+        """Relay one batch; returns the number of rows claimed."""
+        rows = OutboxRepository.claim(batch_size, max_attempts, lease_seconds)
+        if not rows:
+            return 0
+
+        jobs = {}
+        sent, failed = [], {}
+        for row in rows:
+            try:
+                job_id = row["payload"]["job_id"]
+                if job_id not in jobs:
+                    jobs[job_id] = ApplicationRepository.get_job_info_for_notification(
+                        job_id
+                    )
+                if jobs[job_id]:
+                    HANDLERS[row["event_type"]](row["payload"], jobs[job_id])
+            except Exception as e:
+                Logger.warn(f"Outbox row {row['outbox_id']} not relayed: {str(e)}")
+                failed[row["outbox_id"]] = retry_delay(row["attempts"], retry_seconds)
+                if row["attempts"] + 1 >= max_attempts:
+                    Logger.error(
+                        f"Outbox row {row['outbox_id']} gave up after "
+                        f"{max_attempts} attempts"
+                    )
+                    Metrics.incr("outbox.dead")
+            else:
+                sent.append(row["outbox_id"])
+
+        OutboxRepository.complete(sent, failed)
+        Metrics.incr("outbox.relayed", len(sent))
+        if failed:
+            Metrics.incr("outbox.failed", len(failed))
+        return len(rows)
+
+    @staticmethod
+    def run(app) -> None:
+        """Poll the outbox until interrupted; full batches are drained back to back."""
+        batch_size = int(app.config.get("OUTBOX_BATCH_SIZE", 100))
+        interval = float(app.config.get("OUTBOX_POLL_INTERVAL", 1))
+        max_attempts = int(app.config.get("OUTBOX_MAX_ATTEMPTS", 5))
+        lease_seconds = int(app.config.get("OUTBOX_LEASE_SECONDS", 60))
+        retry_seconds = int(app.config.get("OUTBOX_RETRY_SECONDS", 30))
+        Logger.info(f"Outbox relay polling every {interval}s")
+        while True:
+            try:
+                with app.app_context():
+                    claimed = OutboxRelay.drain(
+                        batch_size, max_attempts, lease_seconds, retry_seconds
+                    )
+            except Exception as e:
+                Logger.error(f"Outbox relay failed: {str(e)}")
+                claimed = 0
+            if claimed < batch_size:
+                time.sleep(interval)
+
+
+if __name__ == "__main__":
+    from .. import create_app
+
+    OutboxRelay.run(create_app())
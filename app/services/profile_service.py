@@ -1,4 +1,3 @@
-from ..utils.security import Security
 from ..utils.logger import Logger
 from ..repositories.profile_repository import ProfileRepository
 from ..utils.exceptions import (
@@ -9,19 +8,13 @@ from ..utils.exceptions import (
 
 class ProfileService:
     @staticmethod
-    def create_profile(token: str, payload: dict[str, str]) -> int:
+    def create_profile(user_id: int, payload: dict[str, str]) -> int:
         try:
             if not isinstance(payload, dict):
                 raise ValueError(f'Provided payload {payload} is not valid')
-            decoded = Security.decode_jwt_token(token)
-            if not decoded:
-                Logger.warn(f'Provided token {token} is invalid')
-                raise InvalidCredentialsError("Provided token is invalid")
-            user_id = decoded['profile_id']
             if not user_id:
-                Logger.warn(f'Error getting user_id from {token}')
-                raise InvalidCredentialsError(
-                    f'Error getting user_id from {token}')
+                Logger.warn('create_profile called without a user_id')
+                raise InvalidCredentialsError('Missing user_id')
 
             row = ProfileRepository.add_profile(user_id, payload)
             if row < 1:
@@ -33,17 +26,11 @@ class ProfileService:
                 f'An error occurred because of {str(e)}')
 
     @staticmethod
-    def get_profile(token: str) -> dict:
+    def get_profile(user_id: int) -> dict:
         try:
-            decoded = Security.decode_jwt_token(token)
-            if not decoded:
-                Logger.warn(f'Provided token {token} is invalid')
-                raise InvalidCredentialsError("Provided token is invalid")
-            user_id = decoded['profile_id']
             if not user_id:
-                Logger.warn(
-                    f'Did not manage to get user_id from token {token}')
-                raise InvalidCredentialsError("Provided token is invalid")
+                Logger.warn('get_profile called without a user_id')
+                raise InvalidCredentialsError('Missing user_id')
 
             profile = ProfileRepository.get_profile(user_id)
             if not profile:
@@ -12,6 +12,7 @@ from ..utils.exceptions import (
     GenericRedisError,
     GenericGenerateResetTokenError,
     GenericPasswordHashError,
+    PasswordHasherBusyError,
     UserDoesNotExistError,
     GenericGenerateAuthTokenError
 )
@@ -148,6 +149,8 @@ class UserService:
     def change_password(email: str, password: str) -> bool:
         try:
             hashed_password = Security.hash_password(password)
+        except PasswordHasherBusyError:
+            raise
         except Exception as e:
             Logger.exception(str(e))
             raise GenericPasswordHashError(
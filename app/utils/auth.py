@@ -0,0 +1,59 @@
+from functools import wraps
+
+from flask import g, request
+
+from .logger import Logger
+from .security import Security
+
+
+def get_auth_token():
+    """Extract and validate the Bearer token from Authorization header"""
+    auth_header = request.headers.get("Authorization")
+    if not auth_header:
+        Logger.warn("No authorization token in the header")
+        return {"validation_err": "Unauthorized"}, 401
+
+    parts = auth_header.split()
+    if len(parts) == 2 and parts[0].lower() == "bearer":
+        return parts[1]
+    return {"error": "Invalid auth header format"}, 401
+
+
+def require_auth(func):
+    """
+    Verify the bearer token once, before the handler runs.
+
+    The decoded payload is stored on ``g.auth`` and handlers pass the
+    resolved ids (``current_profile_id()``) down to the services, which no
+    longer see raw tokens.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        token_or_error = get_auth_token()
+        if isinstance(token_or_error, tuple):
+            return token_or_error
+
+        try:
+            decoded = Security.decode_jwt_token(token_or_error)
+        except Exception as e:
+            Logger.warn(f"Rejected bearer token: {str(e)}")
+            return {"error": str(e)}, 401
+
+        if not decoded or not decoded.get("profile_id"):
+            Logger.warn("Bearer token carries no profile id")
+            return {"error": "Invalid token"}, 401
+
+        g.auth = decoded
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def current_profile_id() -> int:
+    """User or admin id of the authenticated caller."""
+    return g.auth["profile_id"]
+
+
+def current_email() -> str | None:
+    return g.auth.get("email")
@@ -36,3 +36,27 @@ class GenericPasswordHashError(Exception):
 
 class GenericGenerateAuthTokenError(Exception):
     '''Raised when there is a problem generating auth token'''
+
+
+class DatabasePoolExhaustedError(GenericDatabaseError):
+    '''Raised when no pooled MySQL connection frees up in time'''
+
+
+class PasswordHasherBusyError(Exception):
+    '''Raised when the bcrypt pool is saturated or too slow to answer'''
+
+
+class MailDeliveryError(Exception):
+    '''Raised when no mail provider could take a message right now'''
+
+    def __init__(self, message: str, retry_after: float = 60):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MailRejectedError(Exception):
+    '''Raised when a provider refuses the message itself (bad address, payload)'''
+
+
+class ImportRowError(Exception):
+    '''Stands in for an import row that could not be read'''
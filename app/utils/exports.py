@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator
+
+from flask import Response, stream_with_context
+
+# Rows written per chunk of a streamed export; one chunk is one write to
+# the socket, so small exports go out in one piece and large ones in
+# steady pieces without holding more than this many rows
+EXPORT_CHUNK_ROWS = 500
+
+MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def to_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    """One JSON object per line"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str))
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def to_csv(rows: Iterable[dict]) -> Iterator[str]:
+    """A header row taken from the first row's keys, then one line per row"""
+    buffer = io.StringIO()
+    writer = None
+    written = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow(row)
+        written += 1
+        if written == EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            written = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+ENCODERS = {"ndjson": to_ndjson, "csv": to_csv}
+
+
+def export_response(rows: Iterable[dict], export_format: str, name: str) -> Response:
+    """
+    Stream ``rows`` as an attachment. The request context, and with it the
+    MySQL connection the rows are read from, stays open until the last
+    chunk is sent.
+    """
+    return Response(
+        stream_with_context(ENCODERS[export_format](rows)),
+        mimetype=MIMETYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format}"',
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,124 @@
+"""
+Bcrypt off the request threads.
+
+A login or registration spends ~250ms of CPU in bcrypt. ``PasswordHasher``
+runs that work in a small process pool and caps how many operations may be
+running or queued at once; past the cap callers get
+``PasswordHasherBusyError`` straight away (served as a 503) instead of
+piling up behind each other and holding gunicorn threads that job browsing
+needs.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable
+
+import bcrypt
+
+from .exceptions import PasswordHasherBusyError
+from .logger import Logger
+from .metrics import Metrics
+
+DEFAULT_ROUNDS = 12
+
+
+def _hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _check(password: bytes, password_hash: bytes) -> bool:
+    return bcrypt.checkpw(password, password_hash)
+
+
+class PasswordHasher:
+    """
+    ``workers=0`` hashes inline on the calling thread, which is what scripts
+    and unit tests get until ``Security.load_hasher`` runs.
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        queue_size: int = 0,
+        rounds: int = DEFAULT_ROUNDS,
+        timeout: float = 10,
+    ):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.rounds = rounds
+        self.timeout = timeout
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._executor: Executor | None = None
+
+    def hash(self, password: str) -> str:
+        result = self._run("hash", _hash, password.encode("utf-8"), self.rounds)
+        return result.decode("utf-8")
+
+    def check(self, password: str, password_hash: str) -> bool:
+        return self._run(
+            "check", _check, password.encode("utf-8"), password_hash.encode("utf-8")
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "in_flight": in_flight,
+            "rounds": self.rounds,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self.pid == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, name: str, func: Callable, *args):
+        if self.workers <= 0:
+            with Metrics.timer(f"bcrypt.{name}"):
+                return func(*args)
+
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                Metrics.incr("bcrypt.rejected")
+                raise PasswordHasherBusyError("Too many sign-ins in progress")
+            self._in_flight += 1
+
+        with Metrics.timer(f"bcrypt.{name}"):
+            try:
+                future = self._get_executor().submit(func, *args)
+            except Exception:
+                self._release()
+                raise
+            # The slot is held until the worker finishes, not until we stop
+            # waiting, so timed out calls still count against the cap
+            future.add_done_callback(lambda _: self._release())
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                Metrics.incr("bcrypt.timeouts")
+                Logger.warn(f"bcrypt {name} took longer than {self.timeout}s")
+                raise PasswordHasherBusyError("Password check timed out")
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None or self.pid != os.getpid():
+                # Pools do not survive fork(); a preloaded app gets a fresh
+                # one in each gunicorn worker
+                self.pid = os.getpid()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
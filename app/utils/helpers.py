@@ -1,3 +1,6 @@
+import base64
+import binascii
+import json
 import os
 import random
 from datetime import datetime, timedelta
@@ -44,3 +47,21 @@ class Helpers:
         now = datetime.now()
         time_difference = now - stored_time
         return time_difference > timedelta(minutes=5)
+
+    @staticmethod
+    def encode_cursor(position: dict) -> str:
+        """Pack a keyset position into an opaque, URL safe cursor"""
+        raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> dict:
+        """Unpack a cursor made by encode_cursor. Raises ValueError if tampered"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise ValueError("Invalid cursor")
+        if not isinstance(position, dict):
+            raise ValueError("Invalid cursor")
+        return position
@@ -0,0 +1,97 @@
+import os
+import threading
+
+import requests
+from flask import current_app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .metrics import Metrics
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HTTPClient:
+    """
+    Keep-alive HTTP session shared by the outbound providers of a worker.
+
+    One ``requests.Session`` per process keeps a pool of TLS connections
+    per host, so a Celery worker pays the handshake once instead of on
+    every email. 429 and 5xx answers are retried with exponential,
+    jittered backoff (``Retry-After`` is honoured). Every call is timed
+    and counted under ``http.<provider>`` in ``/health/metrics``. The
+    session is rebuilt after ``fork()``, like the MySQL pool.
+    """
+
+    _session: requests.Session | None = None
+    _pid: int | None = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def build_session(
+        pool_size: int = 20, retries: int = 3, backoff: float = 0.5
+    ) -> requests.Session:
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=backoff,
+            backoff_jitter=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def session() -> requests.Session:
+        session = HTTPClient._session
+        if session is not None and HTTPClient._pid == os.getpid():
+            return session
+
+        with HTTPClient._lock:
+            if HTTPClient._session is None or HTTPClient._pid != os.getpid():
+                config = current_app.config
+                HTTPClient._session = HTTPClient.build_session(
+                    pool_size=int(config.get("MAIL_HTTP_POOL_SIZE", 20)),
+                    retries=int(config.get("MAIL_HTTP_RETRIES", 3)),
+                    backoff=float(config.get("MAIL_HTTP_BACKOFF", 0.5)),
+                )
+                HTTPClient._pid = os.getpid()
+        return HTTPClient._session
+
+    @staticmethod
+    def post(provider: str, url: str, **kwargs) -> requests.Response:
+        """POST through the shared session; ``raise_for_status`` is left to callers."""
+        kwargs.setdefault(
+            "timeout", float(current_app.config.get("MAIL_HTTP_TIMEOUT", 10))
+        )
+        try:
+            with Metrics.timer(f"http.{provider}"):
+                response = HTTPClient.session().post(url, **kwargs)
+        except requests.exceptions.RequestException:
+            Metrics.incr(f"http.{provider}.errors")
+            raise
+
+        retries = getattr(getattr(response.raw, "retries", None), "history", ())
+        if retries:
+            Metrics.incr(f"http.{provider}.retries", len(retries))
+        if response.status_code >= 400:
+            Metrics.incr(f"http.{provider}.errors")
+        Metrics.incr(f"http.{provider}.status_{response.status_code}")
+        return response
+
+    @staticmethod
+    def reset() -> None:
+        with HTTPClient._lock:
+            session, HTTPClient._session = HTTPClient._session, None
+        if session is not None:
+            session.close()
@@ -5,8 +5,8 @@ from urllib.parse import urlparse
 
 import pika
 import pymysql
-import redis
 
+from ..db.redis import Cache
 from .logger import Logger
 
 
@@ -58,41 +58,14 @@ def check_db(app):
 
 def check_cache(app):
     def connect_redis():
-        client = None
         try:
-            if app.config.get("ENV").lower() != "dev":
-                redis_url = app.config.get("REDIS_URL")
-                if not redis_url:
-                    raise ValueError("REDIS_URL not provided!")
-
-                client = redis.from_url(
-                    redis_url,
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                )
-
-            else:
-                # Fallback to individual ocnfig values (local dev)
-                # password = app.config.get("REDIS_PASSWORD")
-                client = redis.Redis(
-                    host=app.config.get("REDIS_HOST", "localhost"),
-                    port=app.config.get("REDIS_PORT", 6379),
-                    db=app.config.get("REDIS_DB", 0),
-                    # password=password if password else None,
-                    socket_connect_timeout=5,
-                )
-
-            if client is not None:
-                client.ping()
-                Logger.info("Redis connection success...!")
-            else:
-                Logger.error("Redis connection not success...!")
+            # Goes through the shared pool; redis-py drops the socket
+            # in forked workers and reconnects on first use
+            Cache.create_client(app.config).ping()
+            Logger.info("Redis connection success...!")
         except Exception as e:
             Logger.exception(f"Something went wrong {str(e)}")
             raise
-        finally:
-            if client is not None:
-                client.close()
 
     retry_connection(connect_redis)
 
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+from typing import IO, Iterator
+
+from .exceptions import ImportRowError
+
+# Columns of a CSV import besides ``title``; they make up a job's details
+CSV_DETAIL_FIELDS = (
+    "description",
+    "requirements",
+    "location",
+    "employment_type",
+    "salary_range",
+    "deadline",
+    "status",
+    "company_name",
+    "application_url",
+)
+
+
+def _text(stream: IO[bytes], **kwargs) -> io.TextIOWrapper:
+    """
+    The upload as text. Bytes that are not UTF-8 are kept as lone
+    surrogates instead of raising halfway through an import, so the rows
+    they are in can be reported like any other bad row.
+    """
+    return io.TextIOWrapper(
+        stream, encoding="utf-8", errors="surrogateescape", **kwargs
+    )
+
+
+def _is_utf8(text: str) -> bool:
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def read_json(stream: IO[bytes]) -> Iterator[dict]:
+    """A JSON array of jobs, shaped like the body of ``/admin/jobs/create``"""
+    try:
+        jobs = json.load(stream)
+    except ValueError as e:
+        raise ValueError(f"Body is not valid JSON: {str(e)}")
+    if not isinstance(jobs, list):
+        raise ValueError("Body must be a JSON array of jobs")
+    yield from jobs
+
+
+def read_ndjson(stream: IO[bytes]) -> Iterator[dict]:
+    """One job object per line, read as the upload arrives"""
+    for line in _text(stream):
+        if not line.strip():
+            continue
+        if not _is_utf8(line):
+            yield ImportRowError("Line is not valid UTF-8")
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield ImportRowError("Line is not valid JSON")
+
+
+def read_csv(stream: IO[bytes]) -> Iterator[dict]:
+    """
+    A header row with ``title`` and the ``CSV_DETAIL_FIELDS`` columns, then
+    one job per row, read as the upload arrives. Empty cells are left out so
+    optional fields stay unset.
+    """
+    reader = csv.DictReader(_text(stream, newline=""))
+    for row in reader:
+        cells = [*row, *row.values()]
+        if not all(_is_utf8(cell) for cell in cells if isinstance(cell, str)):
+            yield ImportRowError("Row is not valid UTF-8")
+            continue
+        values = {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and value is not None and value.strip()
+        }
+        yield {
+            "title": values.get("title", ""),
+            "details": {
+                field: values[field] for field in CSV_DETAIL_FIELDS if field in values
+            },
+        }
+
+
+READERS = {
+    "application/json": read_json,
+    "application/x-ndjson": read_ndjson,
+    "text/csv": read_csv,
+}
@@ -0,0 +1,270 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from flask import current_app
+
+from .exceptions import MailDeliveryError, MailRejectedError
+from .logger import Logger
+from .metrics import Metrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one mail provider in one worker.
+
+    The last ``window`` calls are kept; once at least ``min_calls`` of them
+    are in and ``failure_rate`` or more failed, the circuit opens and the
+    provider is skipped for ``reset_timeout`` seconds. After that a single
+    probe call is let through (half-open): success closes the circuit,
+    failure opens it for another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        reset_timeout: float = 30,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._calls: deque = deque(maxlen=window)
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probing = False
+                if success:
+                    self.state = CLOSED
+                    self._calls.clear()
+                else:
+                    self._trip()
+                return
+
+            self._calls.append(success)
+            failures = self._calls.count(False)
+            if (
+                len(self._calls) >= self.min_calls
+                and failures / len(self._calls) >= self.failure_rate
+            ):
+                self._trip()
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a call through again."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "calls": len(self._calls),
+                "failures": self._calls.count(False),
+            }
+
+    def _trip(self) -> None:
+        """Open the circuit. Caller holds the lock."""
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self._calls.clear()
+        Metrics.incr(f"mail.{self.name}.circuit_opened")
+        Logger.warn(f"Mail provider {self.name} circuit opened")
+
+
+class TokenBucket:
+    """Sends-per-second budget of a provider in one worker process."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, count: int = 1) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < count:
+                return False
+            self.tokens -= count
+            return True
+
+
+def _parse_limits(raw: str) -> dict[str, float]:
+    """``"mailgun=100,sendgrid=50"`` -> ``{"mailgun": 100.0, "sendgrid": 50.0}``"""
+    limits = {}
+    for part in (raw or "").split(","):
+        name, _, rate = part.partition("=")
+        if name.strip() and rate.strip():
+            limits[name.strip()] = float(rate)
+    return limits
+
+
+class MailRouter:
+    """
+    Picks the mail provider for each send.
+
+    Providers are tried in ``MAIL_PROVIDERS`` order. One whose circuit is
+    open is skipped, and one that is over its ``MAIL_PROVIDER_RATE_LIMITS``
+    budget hands the message to the next provider with room, so a burst
+    spills over instead of queueing behind a single API's limit. A failed
+    call counts against the provider's circuit and the next one is tried.
+    When no provider can take the message, ``MailDeliveryError`` carries
+    the time until the first circuit half-opens, so the Celery retry waits
+    that long instead of hammering a dead provider.
+    """
+
+    _transports: dict[str, object] = {}
+    _breakers: dict[str, CircuitBreaker] = {}
+    _buckets: dict[str, TokenBucket | None] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def register(transport) -> None:
+        MailRouter._transports[transport.name] = transport
+
+    @staticmethod
+    def providers() -> list[str]:
+        raw = current_app.config.get("MAIL_PROVIDERS", "mailgun")
+        return [name.strip() for name in raw.split(",") if name.strip()]
+
+    @staticmethod
+    def breaker(name: str) -> CircuitBreaker:
+        breaker = MailRouter._breakers.get(name)
+        if breaker is not None:
+            return breaker
+
+        with MailRouter._lock:
+            if name not in MailRouter._breakers:
+                config = current_app.config
+                MailRouter._breakers[name] = CircuitBreaker(
+                    name,
+                    failure_rate=float(config.get("MAIL_CIRCUIT_FAILURE_RATE", 0.5)),
+                    min_calls=int(config.get("MAIL_CIRCUIT_MIN_CALLS", 5)),
+                    window=int(config.get("MAIL_CIRCUIT_WINDOW", 20)),
+                    reset_timeout=float(config.get("MAIL_CIRCUIT_RESET_SECONDS", 30)),
+                )
+                Metrics.register_gauge("mail_circuits", MailRouter.stats)
+        return MailRouter._breakers[name]
+
+    @staticmethod
+    def bucket(name: str) -> TokenBucket | None:
+        if name not in MailRouter._buckets:
+            with MailRouter._lock:
+                if name not in MailRouter._buckets:
+                    limits = _parse_limits(
+                        current_app.config.get("MAIL_PROVIDER_RATE_LIMITS", "")
+                    )
+                    rate = limits.get(name)
+                    MailRouter._buckets[name] = TokenBucket(rate) if rate else None
+        return MailRouter._buckets[name]
+
+    @staticmethod
+    def stats() -> dict:
+        return {name: b.stats() for name, b in list(MailRouter._breakers.items())}
+
+    @staticmethod
+    def reset() -> None:
+        with MailRouter._lock:
+            MailRouter._breakers = {}
+            MailRouter._buckets = {}
+
+    @staticmethod
+    def send(mail_from: str, mail_to: str, subject: str, content: str) -> str:
+        """Send one email; returns the name of the provider that took it."""
+        return MailRouter._deliver(
+            lambda transport: transport.send(mail_from, mail_to, subject, content)
+        )
+
+    @staticmethod
+    def send_batch(mail_from: str, recipients: dict) -> str:
+        """Send rendered digests (address -> ``subject``/``body``) in one go."""
+        return MailRouter._deliver(
+            lambda transport: transport.send_batch(mail_from, recipients),
+            weight=len(recipients),
+        )
+
+    @staticmethod
+    def _deliver(action: Callable, weight: int = 1) -> str:
+        candidates = [
+            name for name in MailRouter.providers() if name in MailRouter._transports
+        ]
+        if not candidates:
+            raise MailDeliveryError("No mail provider configured", retry_after=60)
+
+        # First pass honours the rate budgets, the second only the circuits
+        errors = []
+        tried = set()
+        for respect_budget in (True, False):
+            for name in candidates:
+                if name in tried:
+                    continue
+                bucket = MailRouter.bucket(name)
+                if respect_budget and bucket is not None and not bucket.take(weight):
+                    Metrics.incr(f"mail.{name}.throttled")
+                    continue
+                breaker = MailRouter.breaker(name)
+                if not breaker.allow():
+                    Metrics.incr(f"mail.{name}.skipped")
+                    tried.add(name)
+                    continue
+
+                tried.add(name)
+                try:
+                    with Metrics.timer(f"mail.{name}"):
+                        action(MailRouter._transports[name])
+                except MailRejectedError:
+                    # The provider is healthy, the message itself is bad
+                    breaker.record(True)
+                    Metrics.incr(f"mail.{name}.rejected")
+                    raise
+                except Exception as e:
+                    breaker.record(False)
+                    Metrics.incr(f"mail.{name}.failures")
+                    Logger.warn(f"Mail provider {name} failed: {str(e)}")
+                    errors.append(f"{name}: {str(e)}")
+                    continue
+
+                breaker.record(True)
+                Metrics.incr(f"mail.{name}.sent", weight)
+                if name != candidates[0]:
+                    Metrics.incr("mail.failovers")
+                return name
+
+        waits = [MailRouter.breaker(name).retry_after() for name in candidates]
+        retry_after = min((w for w in waits if w > 0), default=0) or 30
+        raise MailDeliveryError(
+            f"All mail providers failed: {'; '.join(errors) or 'circuits open'}",
+            retry_after=retry_after + random.uniform(0, 5),
+        )
@@ -1,10 +1,25 @@
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from email.message import EmailMessage
+from pathlib import Path
+
 import requests
 from flask import current_app
-from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
 
 from ..extensions.celery import celery
+from .exceptions import MailDeliveryError, MailRejectedError
+from .http import HTTPClient
 from .logger import Logger
+from .mail_router import MailRouter
+
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Answers that say the message is bad, not the provider; another
+# provider would refuse it too, so these neither fail over nor retry
+REJECTED_STATUSES = {400, 404, 413, 422}
 
 
 class Mails:
@@ -24,8 +39,16 @@ class Mails:
         )
 
         try:
-            sg = SendGridAPIClient(current_app.config["SENDGRID_API_KEY"])
-            response = sg.send(message)
+            # Same request SendGridAPIClient.send makes, on the pooled session
+            response = HTTPClient.post(
+                "sendgrid",
+                SENDGRID_SEND_URL,
+                json=message.get(),
+                headers={
+                    "Authorization": f"Bearer {current_app.config['SENDGRID_API_KEY']}"
+                },
+            )
+            response.raise_for_status()
             Logger.info(f"Message sent successfully to {mail_to}")
             return {"status_code": response.status_code, "to": mail_to}
         except Exception as e:
@@ -51,11 +74,11 @@ class Mails:
             data["text"] = content
 
         try:
-            response = requests.post(
+            response = HTTPClient.post(
+                "mailgun",
                 f"{base_url}/{domain}/messages",
                 auth=("api", api_key),
                 data=data,
-                timeout=10,
             )
 
             response.raise_for_status()
@@ -70,20 +93,189 @@ class Mails:
             raise e
 
     @staticmethod
-    @celery.task(max_retries=3, default_retry_delay=60)
+    def send_batch_by_mailgun(mail_from, recipients: dict, subject, content):
+        """
+        Send one message to many recipients through Mailgun batch sending.
+        ``recipients`` maps each address to its recipient variables;
+        ``%recipient.<name>%`` placeholders in ``subject`` and ``content``
+        are filled in per address, and no recipient sees the others.
+        """
+        domain = current_app.config["MAILGUN_DOMAIN"]
+        api_key = current_app.config["MAILGUN_API_KEY"]
+        base_url = current_app.config["MAILGUN_BASE_URL"]
+
+        data = {
+            "from": mail_from,
+            "to": list(recipients),
+            "subject": subject,
+            "text": content,
+            "recipient-variables": json.dumps(recipients),
+        }
+
+        try:
+            response = HTTPClient.post(
+                "mailgun",
+                f"{base_url}/{domain}/messages",
+                auth=("api", api_key),
+                data=data,
+                timeout=30,
+            )
+
+            response.raise_for_status()
+            Logger.info(f"Batch message sent to {len(recipients)} recipients")
+            return {
+                "status_code": response.status_code,
+                "recipients": len(recipients),
+                "body": response.json(),
+            }
+        except requests.exceptions.RequestException as e:
+            Logger.warn(
+                f"Failed to send batch to {len(recipients)} recipients "
+                f"because of {str(e)}"
+            )
+            raise e
+
+    @staticmethod
+    def send_batch_by_sendgrid(mail_from, recipients: dict):
+        """
+        SendGrid equivalent of Mailgun batch sending: one personalization
+        per address with its own subject, and the body substituted in.
+        """
+        message = {
+            "from": {"email": mail_from},
+            "personalizations": [
+                {
+                    "to": [{"email": email}],
+                    "subject": variables["subject"],
+                    "substitutions": {"-body-": variables["body"]},
+                }
+                for email, variables in recipients.items()
+            ],
+            "content": [{"type": "text/plain", "value": "-body-"}],
+        }
+
+        try:
+            response = HTTPClient.post(
+                "sendgrid",
+                SENDGRID_SEND_URL,
+                json=message,
+                headers={
+                    "Authorization": f"Bearer {current_app.config['SENDGRID_API_KEY']}"
+                },
+                timeout=30,
+            )
+            response.raise_for_status()
+            Logger.info(f"Batch message sent to {len(recipients)} recipients")
+            return {"status_code": response.status_code, "recipients": len(recipients)}
+        except requests.exceptions.RequestException as e:
+            Logger.warn(
+                f"Failed to send batch to {len(recipients)} recipients "
+                f"because of {str(e)}"
+            )
+            raise e
+
+    @staticmethod
+    @celery.task(bind=True, max_retries=5)
+    def send_batch_task(self, email_from: str, recipients: dict):
+        """
+        Deliver rendered digests; ``recipients`` maps an address to its
+        ``subject`` and ``body``. A failed batch is retried whole, once a
+        provider's circuit lets traffic through again.
+        """
+        try:
+            MailRouter.send_batch(email_from, recipients)
+        except MailRejectedError as e:
+            Logger.error(f"Digest batch rejected, dropping it: {str(e)}")
+        except MailDeliveryError as exc:
+            raise self.retry(exc=exc, countdown=exc.retry_after)
+
+    @staticmethod
+    @celery.task(bind=True, max_retries=5)
     def send_mail_task(
+        self,
         email_from: str,
         email_to: str,
         subject: str,
         content: str,
     ):
         try:
-            Mails.send_by_mailgun(
-                mail_from=email_from,
-                mail_to=email_to,
-                subject=subject,
-                content=content,
-                content_type="text/html",
+            MailRouter.send(email_from, email_to, subject, content)
+        except MailRejectedError as e:
+            Logger.error(f"Mail to {email_to} rejected, dropping it: {str(e)}")
+        except MailDeliveryError as exc:
+            raise self.retry(exc=exc, countdown=exc.retry_after)
+
+
+@contextmanager
+def _classify(provider: str):
+    """Turn a provider's refusal of the message into ``MailRejectedError``."""
+    try:
+        yield
+    except requests.exceptions.HTTPError as e:
+        response = e.response
+        if response is not None and response.status_code in REJECTED_STATUSES:
+            raise MailRejectedError(f"{provider} rejected message: {str(e)}")
+        raise
+
+
+class MailgunTransport:
+    name = "mailgun"
+
+    @staticmethod
+    def send(mail_from, mail_to, subject, content):
+        with _classify("mailgun"):
+            Mails.send_by_mailgun(mail_from, mail_to, subject, content, "text/html")
+
+    @staticmethod
+    def send_batch(mail_from, recipients: dict):
+        with _classify("mailgun"):
+            Mails.send_batch_by_mailgun(
+                mail_from, recipients, "%recipient.subject%", "%recipient.body%"
             )
-        except Exception as exc:
-            raise exc
+
+
+class SendGridTransport:
+    name = "sendgrid"
+
+    @staticmethod
+    def send(mail_from, mail_to, subject, content):
+        with _classify("sendgrid"):
+            Mails.send_by_sendgrid(mail_from, mail_to, subject, content)
+
+    @staticmethod
+    def send_batch(mail_from, recipients: dict):
+        with _classify("sendgrid"):
+            Mails.send_batch_by_sendgrid(mail_from, recipients)
+
+
+class FileTransport:
+    """
+    Writes every message as an ``.eml`` file under ``MAIL_FILE_DIR``.
+    For local runs and tests; list ``file`` in ``MAIL_PROVIDERS``.
+    """
+
+    name = "file"
+
+    @staticmethod
+    def send(mail_from, mail_to, subject, content):
+        message = EmailMessage()
+        message["From"] = mail_from
+        message["To"] = mail_to
+        message["Subject"] = subject
+        message.set_content(content)
+
+        folder = Path(current_app.config.get("MAIL_FILE_DIR", "outbox"))
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"{time.time_ns()}-{uuid.uuid4().hex[:8]}.eml"
+        path.write_bytes(bytes(message))
+
+    @staticmethod
+    def send_batch(mail_from, recipients: dict):
+        for email, variables in recipients.items():
+            FileTransport.send(
+                mail_from, email, variables["subject"], variables["body"]
+            )
+
+
+for _transport in (MailgunTransport, SendGridTransport, FileTransport):
+    MailRouter.register(_transport)
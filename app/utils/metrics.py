@@ -0,0 +1,86 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+
+class Metrics:
+    """
+    Process-local counters, timers and gauges.
+
+    Every gunicorn worker / celery process keeps its own registry, the
+    ``/health/metrics`` endpoint reports the values of the worker that served
+    the request. Gauges are callbacks evaluated at snapshot time so pools can
+    report their live size without pushing updates on every checkout.
+    """
+
+    _lock = threading.Lock()
+    _counters: dict[str, int] = {}
+    _timers: dict[str, dict[str, float]] = {}
+    _gauges: dict[str, Callable[[], dict]] = {}
+
+    @staticmethod
+    def incr(name: str, value: int = 1) -> None:
+        with Metrics._lock:
+            Metrics._counters[name] = Metrics._counters.get(name, 0) + value
+
+    @staticmethod
+    def observe(name: str, seconds: float) -> None:
+        with Metrics._lock:
+            timer = Metrics._timers.setdefault(
+                name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            elapsed_ms = seconds * 1000
+            timer["count"] += 1
+            timer["total_ms"] += elapsed_ms
+            timer["max_ms"] = max(timer["max_ms"], elapsed_ms)
+
+    @staticmethod
+    @contextmanager
+    def timer(name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            Metrics.observe(name, time.perf_counter() - start)
+
+    @staticmethod
+    def register_gauge(name: str, callback: Callable[[], dict]) -> None:
+        with Metrics._lock:
+            Metrics._gauges[name] = callback
+
+    @staticmethod
+    def get(name: str) -> int:
+        with Metrics._lock:
+            return Metrics._counters.get(name, 0)
+
+    @staticmethod
+    def snapshot() -> dict:
+        with Metrics._lock:
+            counters = dict(Metrics._counters)
+            timers = {
+                name: {
+                    **values,
+                    "avg_ms": (
+                        values["total_ms"] / values["count"] if values["count"] else 0
+                    ),
+                }
+                for name, values in Metrics._timers.items()
+            }
+            gauges = dict(Metrics._gauges)
+
+        gauge_values = {}
+        for name, callback in gauges.items():
+            try:
+                gauge_values[name] = callback()
+            except Exception as e:
+                gauge_values[name] = {"error": str(e)}
+
+        return {"counters": counters, "timers": timers, "gauges": gauge_values}
+
+    @staticmethod
+    def reset() -> None:
+        """Clear counters and timers. Registered gauges are kept."""
+        with Metrics._lock:
+            Metrics._counters.clear()
+            Metrics._timers.clear()
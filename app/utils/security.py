@@ -1,48 +1,134 @@
 import os
 import datetime
-import bcrypt
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 import jwt
 from dotenv import load_dotenv
+from flask import g, has_app_context
+
+from .hashing import PasswordHasher
+from .metrics import Metrics
 
 load_dotenv()
 
 
+class TokenCache:
+    """
+    Bounded LRU of verified JWT payloads keyed by a SHA-256 of the token.
+    Entries are never served past the token's own ``exp``.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str, settings: dict) -> str:
+        # Rotating the secret or algorithm must not serve old verifications
+        raw = f"{settings['algorithm']}:{settings['secret']}:{token}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            if payload["exp"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: dict) -> None:
+        if self.max_size <= 0 or not isinstance(payload.get("exp"), (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class Security:
+    # Filled once by load_settings() at app startup; until then (scripts,
+    # unit tests) the JWT settings are read from the environment per call.
+    _settings: dict | None = None
+    _token_cache = TokenCache()
+    _hasher = PasswordHasher()
+
+    @staticmethod
+    def load_settings(cache_size: int = 1024) -> None:
+        """Read the JWT settings once and reset the verified-token cache."""
+        Security._settings = {
+            "secret": os.getenv('JWT_SECRET'),
+            "algorithm": os.getenv('JWT_ALGORITHM'),
+            "expiry_hours": int(os.getenv('JWT_TOKEN_EXPIRY_HOURS', '24')),
+        }
+        Security._token_cache = TokenCache(cache_size)
+        Metrics.register_gauge(
+            "jwt_cache", lambda: {"size": len(Security._token_cache)}
+        )
+
+    @staticmethod
+    def load_hasher(
+        workers: int, queue_size: int, rounds: int, timeout: float
+    ) -> None:
+        """Move bcrypt into a bounded process pool of ``workers`` processes."""
+        Security._hasher.shutdown()
+        Security._hasher = PasswordHasher(workers, queue_size, rounds, timeout)
+        Metrics.register_gauge("bcrypt_pool", lambda: Security._hasher.stats())
+
+    @staticmethod
+    def _jwt_settings() -> dict:
+        settings = Security._settings
+        if settings is None:
+            settings = {
+                "secret": os.getenv('JWT_SECRET'),
+                "algorithm": os.getenv('JWT_ALGORITHM'),
+                "expiry_hours": int(os.getenv('JWT_TOKEN_EXPIRY_HOURS', '24')),
+            }
+
+        if settings["secret"] is None:
+            raise ValueError("JWT_Secret env var is not set")
+        if settings["algorithm"] is None:
+            raise ValueError("JWT_ALGORITHM env var is not set")
+        return settings
 
     @staticmethod
     def hash_password(password: str) -> str:
         """
         Hash plain text password using bcrypt.
         Returns the hashed password as a UTF-8 string.
+        Raises PasswordHasherBusyError when the bcrypt pool is saturated.
         """
-        salt = bcrypt.gensalt()
-        hash = bcrypt.hashpw(password.encode("utf-8"), salt)
-        return hash.decode("utf-8")
+        return Security._hasher.hash(password)
 
     @staticmethod
     def check_password(password: str, password_hash: str) -> bool:
         """
         Verifies the plain password against the hashed password.
+        The cost factor comes from the stored hash, not BCRYPT_ROUNDS.
         """
-        return bcrypt.checkpw(
-            password.encode("utf-8"),
-            password_hash.encode("utf-8"),
-        )
+        return Security._hasher.check(password, password_hash)
 
     @staticmethod
     def create_jwt_token(profile_id, email) -> str:
         """Generate jwt token with profile_id and email as payload"""
-        secret = os.getenv('JWT_SECRET')
-        if secret is None:
-            raise ValueError("JWT_Secret env var is not set")
+        settings = Security._jwt_settings()
 
-        algorithm = os.getenv('JWT_ALGORITHM')
-        if algorithm is None:
-            raise ValueError("JWT_ALGORITHM env var is not set")
-
-        expiry_hours = int(os.getenv('JWT_TOKEN_EXPIRY_HOURS', '24'))
         now = datetime.datetime.now(datetime.UTC)
-        exp_time = now + datetime.timedelta(hours=expiry_hours)
+        exp_time = now + datetime.timedelta(hours=settings["expiry_hours"])
 
         payload = {
             "profile_id": profile_id,
@@ -51,25 +137,45 @@ class Security:
             "iat": now,
         }
 
-        token = jwt.encode(payload, secret, algorithm=algorithm)
+        token = jwt.encode(payload, settings["secret"], algorithm=settings["algorithm"])
 
         return token
 
     @staticmethod
     def decode_jwt_token(token: str):
-        """Decodes jwt token and returns profile object"""
-        secret = os.getenv('JWT_SECRET')
-        if secret is None:
-            raise ValueError("JWT_Secret env var is not set")
+        """
+        Decodes jwt token and returns profile object.
 
-        algorithm = os.getenv('JWT_ALGORITHM')
-        if algorithm is None:
-            raise ValueError("JWT_ALGORITHM env var is not set")
+        Lookups go through a per-request memo in ``g`` and then the
+        process-wide ``TokenCache``; only tokens seen for the first time
+        pay for the signature check.
+        """
+        settings = Security._jwt_settings()
 
-        try:
-            payload = jwt.decode(token, secret, algorithms=[algorithm])
-            return payload
-        except jwt.ExpiredSignatureError:
-            raise Exception("Token expired")
-        except jwt.InvalidTokenError:
-            raise Exception("Invalid token")
+        memo = None
+        if has_app_context():
+            memo = g.setdefault("jwt_payloads", {})
+            if token in memo:
+                Metrics.incr("jwt_cache.request_hits")
+                return dict(memo[token])
+
+        key = TokenCache.key(token, settings)
+        payload = Security._token_cache.get(key)
+        if payload is not None:
+            Metrics.incr("jwt_cache.hits")
+        else:
+            Metrics.incr("jwt_cache.misses")
+            try:
+                payload = jwt.decode(
+                    token, settings["secret"], algorithms=[settings["algorithm"]]
+                )
+            except jwt.ExpiredSignatureError:
+                raise Exception("Token expired")
+            except jwt.InvalidTokenError:
+                raise Exception("Invalid token")
+            Security._token_cache.set(key, payload)
+
+        if memo is not None:
+            memo[token] = payload
+        # Callers get their own copy; the cached payload stays pristine
+        return dict(payload)
@@ -0,0 +1,16 @@
+"""
+ASGI entry point: the SSE streams run on the event loop, every other
+route is served by the Flask app through uvicorn's WSGI adapter.
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5005
+    gunicorn -k uvicorn.workers.UvicornWorker asgi:app
+"""
+
+from uvicorn.middleware.wsgi import WSGIMiddleware
+
+from app import create_app
+from app.asgi import StreamApp
+
+flask_app = create_app()
+
+app = StreamApp(flask_app, fallback=WSGIMiddleware(flask_app))
@@ -0,0 +1,10 @@
+"""
+Benchmarks for the API hot paths.
+
+    python -m benchmarks --output benchmarks/results/latest.json
+    python -m benchmarks --baseline benchmarks/results/latest.json
+
+By default ``create_app()`` runs against in-process stand-ins (see
+``benchmarks.fakes``) seeded by ``benchmarks.dataset``; ``--backend live``
+uses the MySQL/Redis/RabbitMQ configured in the environment instead.
+"""
@@ -0,0 +1,175 @@
+"""
+Seeded, reproducible dataset for the benchmarks.
+
+The same seed always produces the same admins, users, jobs and
+applications, so two runs (or two branches) measure identical work. Rows
+mirror the columns in ``tables/`` and can be loaded into a disposable
+MySQL database with ``load_mysql`` for ``--backend live`` runs.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import bcrypt
+
+PASSWORD = "Bench-pass-123"
+
+TITLES = [
+    "Backend Engineer",
+    "Frontend Developer",
+    "QA Engineer",
+    "Data Analyst",
+    "DevOps Engineer",
+    "Product Designer",
+    "Mobile Developer",
+    "Site Reliability Engineer",
+]
+LOCATIONS = ["Nairobi", "Mombasa", "Kisumu", "Remote", "Nakuru", "Eldoret"]
+COMPANIES = ["Acme", "Shade Limited", "Globex", "Initech", "Umbrella", "Hooli"]
+SKILLS = ["Python", "Flask", "MySQL", "Redis", "Docker", "React", "AWS", "Celery"]
+
+# Fixed clock so timestamps do not change between runs
+EPOCH = datetime(2026, 1, 1, 9, 0, 0)
+
+# Load order respects the foreign keys
+TABLES = (
+    ("admins", "admins"),
+    ("user", "users"),
+    ("user_setting", "user_settings"),
+    ("jobs", "jobs"),
+    ("job_applications", "applications"),
+)
+
+
+@dataclass
+class Dataset:
+    seed: int
+    admins: list[dict]
+    users: list[dict]
+    user_settings: list[dict]
+    jobs: list[dict]
+    applications: list[dict]
+    password: str = PASSWORD
+
+    def sizes(self) -> dict:
+        return {attr: len(getattr(self, attr)) for _, attr in TABLES}
+
+
+def generate(
+    seed: int = 42,
+    admins: int = 5,
+    users: int = 500,
+    jobs: int = 1000,
+    applications: int = 2000,
+    rounds: int = 12,
+) -> Dataset:
+    rng = random.Random(seed)
+    # One hash shared by every account; hashing each user would dominate
+    # the setup time without making the login benchmark any more realistic
+    password_hash = bcrypt.hashpw(
+        PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds)
+    ).decode("utf-8")
+
+    admin_rows = [
+        {
+            "admin_id": admin_id,
+            "email": f"admin{admin_id}@bench.example.com",
+            "username": f"admin{admin_id}",
+            "hash": password_hash,
+            "created_at": EPOCH,
+        }
+        for admin_id in range(1, admins + 1)
+    ]
+
+    user_rows = []
+    setting_rows = []
+    for user_id in range(1, users + 1):
+        user_rows.append(
+            {
+                "user_id": user_id,
+                "hash": password_hash,
+                "email": f"user{user_id}@bench.example.com",
+                "status": 1,
+                "created_at": EPOCH + timedelta(minutes=user_id),
+            }
+        )
+        setting_rows.append(
+            {"setting_id": user_id, "is_deactivated": 0, "user_id": user_id}
+        )
+
+    job_rows = []
+    for job_id in range(1, jobs + 1):
+        title = rng.choice(TITLES)
+        skills = rng.sample(SKILLS, 3)
+        job_rows.append(
+            {
+                "job_id": job_id,
+                "admin_id": rng.randint(1, admins),
+                "title": title,
+                "description": f"{title} working with {', '.join(skills)}.",
+                "requirements": ", ".join(skills),
+                "location": rng.choice(LOCATIONS),
+                "employment_type": str(rng.randint(1, 4)),
+                "salary_range": f"{rng.randint(1, 5) * 1000}-"
+                f"{rng.randint(6, 10) * 1000} USD",
+                "company_name": rng.choice(COMPANIES),
+                "application_url": f"https://bench.example.com/jobs/{job_id}",
+                "deadline": date(2026, 12, 31) - timedelta(days=job_id % 180),
+                "status": rng.choice(["5", "5", "5", "6", "7"]),
+                "created_at": EPOCH + timedelta(minutes=job_id),
+                "updated_at": EPOCH + timedelta(minutes=job_id),
+            }
+        )
+
+    # job_applications is UNIQUE (user_id, job_id)
+    applications = min(applications, users * jobs)
+    pairs: set[tuple[int, int]] = set()
+    while len(pairs) < applications:
+        pairs.add((rng.randint(1, users), rng.randint(1, jobs)))
+
+    application_rows = []
+    for application_id, (user_id, job_id) in enumerate(sorted(pairs), start=1):
+        created = EPOCH + timedelta(hours=application_id)
+        application_rows.append(
+            {
+                "application_id": application_id,
+                "user_id": user_id,
+                "job_id": job_id,
+                "status": rng.randint(1, 4),
+                "cover_letter": "I would like to apply for this role.",
+                "resume_url": f"https://bench.example.com/cv/{user_id}.pdf",
+                "created_at": created,
+                "modified_at": created,
+            }
+        )
+
+    return Dataset(
+        seed=seed,
+        admins=admin_rows,
+        users=user_rows,
+        user_settings=setting_rows,
+        jobs=job_rows,
+        applications=application_rows,
+    )
+
+
+def load_mysql(conn, dataset: Dataset, batch_size: int = 500) -> None:
+    """Insert the dataset into an empty schema created from ``tables/``."""
+    with conn.cursor() as cursor:
+        for table, attr in TABLES:
+            rows = getattr(dataset, attr)
+            if not rows:
+                continue
+            columns = list(rows[0])
+            query = "INSERT INTO `{}` ({}) VALUES ({})".format(
+                table,
+                ", ".join(f"`{column}`" for column in columns),
+                ", ".join(["%s"] * len(columns)),
+            )
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                cursor.executemany(
+                    query, [tuple(row[column] for column in columns) for row in batch]
+                )
+    conn.commit()
@@ -0,0 +1,340 @@
+"""
+In-process stand-ins for MySQL, Redis and RabbitMQ.
+
+Only the connections are replaced: the real pool, repositories, caches,
+event hub and celery tasks all run. ``FakeMySQL`` answers the statements
+the benchmarked endpoints issue from the seeded dataset. Any other
+statement raises, so a changed query fails the run loudly instead of
+silently benchmarking nothing.
+
+Import this module only after the benchmark environment is set, since it
+imports ``app``.
+"""
+
+import json
+import re
+import threading
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterator
+from unittest.mock import patch
+
+import fakeredis
+import pymysql
+
+from app.config import DevelopmentConfig
+from app.db.db import DB
+from app.db.redis import Cache, MeteredConnectionPool
+from app.extensions.celery import celery
+
+from .dataset import Dataset
+
+
+USER_LIST_KEYS = (
+    "application_id",
+    "user_id",
+    "job_id",
+    "status",
+    "resume_url",
+    "created_at",
+    "modified_at",
+)
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.split()).lower()
+
+
+class FakeMySQL:
+    def __init__(self, dataset: Dataset):
+        self._lock = threading.Lock()
+        self.jobs = {job["job_id"]: job for job in dataset.jobs}
+        self.job_ids = sorted(self.jobs)
+        self.admins = {admin["admin_id"]: admin for admin in dataset.admins}
+        settings = {row["user_id"]: row for row in dataset.user_settings}
+        self.users_by_email = {
+            user["email"]: {
+                **user,
+                "is_deactivated": settings.get(user["user_id"], {}).get(
+                    "is_deactivated"
+                ),
+            }
+            for user in dataset.users
+        }
+        self.applications = {
+            row["application_id"]: dict(row) for row in dataset.applications
+        }
+        self.applied = {(row["user_id"], row["job_id"]) for row in dataset.applications}
+        self.next_application_id = max(self.applications, default=0) + 1
+        self.outbox: list[tuple[str, dict]] = []
+        self.application_counts: dict[tuple[int, int], int] = {}
+        for row in dataset.applications:
+            key = (row["job_id"], row["status"])
+            self.application_counts[key] = self.application_counts.get(key, 0) + 1
+        self.statements = 0
+
+        self.routes: list[tuple[re.Pattern, Callable]] = [
+            (r"^select \* from jobs order by job_id limit %s offset %s$", self._page),
+            (
+                r"^select \* from jobs where job_id > %s order by job_id limit %s$",
+                self._page_after,
+            ),
+            (r"^select \* from jobs where job_id = %s$", self._job),
+            (
+                r"^select u\.user_id,u\.email,u\.hash,.* from user u "
+                r"left join user_setting us .* where u\.email = %s limit 1$",
+                self._user_by_email,
+            ),
+            (r"^insert into job_applications\(", self._insert_application),
+            (
+                r"^insert into job_application_counts\(job_id, status, applications\) "
+                r"values \(%s, %s, %s\)(, \(%s, %s, %s\))* on duplicate key update",
+                self._adjust_counts,
+            ),
+            (
+                r"^insert into notification_outbox\(event_type, payload\) "
+                r"values \(%s, %s\)(, \(%s, %s\))*$",
+                self._outbox_insert,
+            ),
+            (
+                r"^select application_id, user_id, job_id, status, resume_url, "
+                r"created_at, modified_at from job_applications where user_id = %s "
+                r"order by application_id desc limit %s$",
+                self._user_applications,
+            ),
+        ]
+        self.routes = [
+            (re.compile(pattern), handler) for pattern, handler in self.routes
+        ]
+
+    def execute(self, query: str, params: tuple) -> tuple[list[dict], int | None]:
+        statement = _normalize(query)
+        for pattern, handler in self.routes:
+            if pattern.search(statement):
+                with self._lock:
+                    self.statements += 1
+                    return handler(*(params or ()))
+        raise pymysql.err.ProgrammingError(
+            1064, f"benchmark fake has no answer for: {statement[:120]}"
+        )
+
+    def _page(self, limit, offset):
+        ids = self.job_ids[offset : offset + limit]
+        return [dict(self.jobs[job_id]) for job_id in ids], None
+
+    def _page_after(self, after_id, limit):
+        ids = [job_id for job_id in self.job_ids if job_id > after_id][:limit]
+        return [dict(self.jobs[job_id]) for job_id in ids], None
+
+    def _job(self, job_id):
+        job = self.jobs.get(int(job_id))
+        return ([dict(job)] if job else []), None
+
+    def _user_by_email(self, email):
+        user = self.users_by_email.get(email)
+        return ([dict(user)] if user else []), None
+
+    def _insert_application(self, user_id, job_id, status, cover_letter, resume_url):
+        if (user_id, job_id) in self.applied:
+            raise pymysql.err.IntegrityError(
+                1062, f"Duplicate entry '{user_id}-{job_id}'"
+            )
+        application_id = self.next_application_id
+        self.next_application_id += 1
+        now = datetime.now()
+        self.applied.add((user_id, job_id))
+        self.applications[application_id] = {
+            "application_id": application_id,
+            "user_id": user_id,
+            "job_id": job_id,
+            "status": status,
+            "cover_letter": cover_letter,
+            "resume_url": resume_url,
+            "created_at": now,
+            "modified_at": now,
+        }
+        return [], application_id
+
+    def _adjust_counts(self, *params):
+        for i in range(0, len(params), 3):
+            job_id, status, delta = params[i : i + 3]
+            key = (job_id, status)
+            self.application_counts[key] = self.application_counts.get(key, 0) + delta
+        return [], None
+
+    def _outbox_insert(self, *params):
+        for i in range(0, len(params), 2):
+            self.outbox.append((params[i], json.loads(params[i + 1])))
+        return [], None
+
+    def _user_applications(self, user_id, limit):
+        rows = [
+            {key: row[key] for key in USER_LIST_KEYS}
+            for _, row in sorted(self.applications.items(), reverse=True)
+            if row["user_id"] == user_id
+        ]
+        return rows[:limit], None
+
+
+class FakeCursor:
+    def __init__(self, db: FakeMySQL):
+        self._db = db
+        self._rows: list[dict] = []
+        self.lastrowid: int | None = None
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, query: str, args=None) -> int:
+        self._rows, lastrowid = self._db.execute(query, args)
+        if lastrowid is not None:
+            self.lastrowid = lastrowid
+        self.rowcount = len(self._rows) or (1 if lastrowid is not None else 0)
+        return self.rowcount
+
+    def executemany(self, query: str, args) -> int:
+        total = 0
+        for params in args:
+            total += self.execute(query, params)
+        self.rowcount = total
+        return total
+
+    def fetchone(self) -> dict | None:
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self) -> list[dict]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self) -> None:
+        self._rows = []
+
+
+class FakeConnection:
+    """Quacks like the pymysql connection ``ConnectionPool`` manages."""
+
+    server_status = 0
+
+    def __init__(self, db: FakeMySQL):
+        self._db = db
+        self.open = True
+
+    def cursor(self, cursor_class=None) -> FakeCursor:
+        return FakeCursor(self._db)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def ping(self, reconnect: bool = False) -> None:
+        if not self.open:
+            raise pymysql.err.InterfaceError(0, "connection closed")
+
+    def close(self) -> None:
+        self.open = False
+
+
+class InProcessBroker:
+    """
+    RabbitMQ stand-in for the pika connections the app opens itself. Celery
+    tasks go through kombu's in-memory transport instead.
+    """
+
+    def __init__(self):
+        self.published: list[tuple[str, bytes]] = []
+        self._lock = threading.Lock()
+
+    def connect(self, parameters=None, *args, **kwargs) -> "FakeBlockingConnection":
+        return FakeBlockingConnection(self)
+
+
+class FakeChannel:
+    def __init__(self, broker: InProcessBroker):
+        self._broker = broker
+        self.is_open = True
+
+    def queue_declare(self, queue: str = "", **kwargs) -> None:
+        pass
+
+    def confirm_delivery(self) -> None:
+        pass
+
+    def basic_publish(self, exchange: str, routing_key: str, body, **kwargs) -> None:
+        with self._broker._lock:
+            self._broker.published.append((routing_key, body))
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class FakeBlockingConnection:
+    def __init__(self, broker: InProcessBroker):
+        self._broker = broker
+        self.is_open = True
+
+    def channel(self) -> FakeChannel:
+        return FakeChannel(self._broker)
+
+    def process_data_events(self, time_limit: float = 0) -> None:
+        pass
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+@dataclass
+class Fakes:
+    db: FakeMySQL
+    redis: fakeredis.FakeServer
+    broker: InProcessBroker
+
+
+@contextmanager
+def install(dataset: Dataset) -> Iterator[Fakes]:
+    """Swap the backing services for in-process ones until the block exits."""
+    fakes = Fakes(FakeMySQL(dataset), fakeredis.FakeServer(), InProcessBroker())
+
+    def redis_pool(config):
+        return MeteredConnectionPool(
+            connection_class=fakeredis.FakeRedisConnection,
+            server=fakes.redis,
+            decode_responses=True,
+            max_connections=int(config.get("REDIS_POOL_MAX_SIZE", 20)),
+            timeout=float(config.get("REDIS_POOL_TIMEOUT", 5)),
+        )
+
+    def async_redis_client(config):
+        return fakeredis.FakeAsyncRedis(server=fakes.redis, decode_responses=True)
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.object(
+                DB, "connect", staticmethod(lambda c: FakeConnection(fakes.db))
+            )
+        )
+        stack.enter_context(
+            patch.object(Cache, "create_pool", staticmethod(redis_pool))
+        )
+        stack.callback(Cache.reset)
+        stack.enter_context(
+            patch.object(Cache, "create_async_client", staticmethod(async_redis_client))
+        )
+        stack.enter_context(patch("pika.BlockingConnection", fakes.broker.connect))
+        # create_app() would otherwise retry real MySQL/Redis/RabbitMQ and exit
+        stack.enter_context(patch("app.init_dependencies", lambda app: None))
+        stack.enter_context(
+            patch.object(DevelopmentConfig, "RATELIMIT_STORAGE_URI", "memory://")
+        )
+        previous = (celery.conf.broker_url, celery.conf.result_backend)
+        celery.conf.update(broker_url="memory://", result_backend="cache+memory://")
+        stack.callback(
+            celery.conf.update, broker_url=previous[0], result_backend=previous[1]
+        )
+        yield fakes
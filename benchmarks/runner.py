@@ -0,0 +1,352 @@
+"""
+Drives ``create_app()`` in-process through Flask test clients.
+
+Each scenario runs ``--requests`` times spread over ``--concurrency``
+threads, every thread with its own client. Requests never leave the
+process, so the numbers cover routing, validation, auth, services,
+repositories, caches and serialization, not the network or gunicorn.
+Compare runs made on the same machine only.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+from app import create_app
+from app.db.db import DB
+from app.extensions.event_hub import EventHub
+from app.repositories.application_events import ApplicationEvents
+from app.utils.security import Security
+
+from . import dataset as seed
+from . import fakes
+from .stats import compare, summarize
+
+PAGE_LIMIT = 20
+
+
+@dataclass
+class Context:
+    app: object
+    data: seed.Dataset
+    base: str
+    tokens: dict[int, str]
+    rng: random.Random
+    _pairs: object = None
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _local: threading.local = field(default_factory=threading.local)
+
+    def client(self):
+        if not hasattr(self._local, "client"):
+            self._local.client = self.app.test_client()
+        return self._local.client
+
+    def random_job_id(self) -> int:
+        with self._lock:
+            return self.rng.randint(1, len(self.data.jobs))
+
+    def next_pair(self) -> tuple[int, int]:
+        """A (user, job) pair that has not applied yet."""
+        with self._lock:
+            if self._pairs is None:
+                applied = {(a["user_id"], a["job_id"]) for a in self.data.applications}
+                self._pairs = (
+                    (user["user_id"], job["job_id"])
+                    for job in self.data.jobs
+                    for user in self.data.users
+                    if (user["user_id"], job["job_id"]) not in applied
+                )
+            return next(self._pairs)
+
+    def close_stream(self) -> None:
+        """Streams keep their request context, close them on their own thread."""
+        stream = getattr(self._local, "stream", None)
+        if stream is not None:
+            del self._local.stream
+            stream[0].close()
+
+
+def public_jobs(ctx: Context, i: int) -> int:
+    pages = max(1, len(ctx.data.jobs) // PAGE_LIMIT)
+    page = i % pages + 1
+    url = f"{ctx.base}/public/jobs?page={page}&limit={PAGE_LIMIT}"
+    return ctx.client().get(url).status_code
+
+
+def public_job_detail(ctx: Context, i: int) -> int:
+    return ctx.client().get(f"{ctx.base}/public/jobs/{ctx.random_job_id()}").status_code
+
+
+def user_login(ctx: Context, i: int) -> int:
+    user = ctx.data.users[i % len(ctx.data.users)]
+    response = ctx.client().post(
+        f"{ctx.base}/user/login",
+        json={"email": user["email"], "password": ctx.data.password},
+    )
+    return response.status_code
+
+
+def application_create(ctx: Context, i: int) -> int:
+    user_id, job_id = ctx.next_pair()
+    response = ctx.client().post(
+        f"{ctx.base}/applications/job/create",
+        json={
+            "job_id": job_id,
+            "status": 1,
+            "cover_letter": "Benchmark application",
+            "resume_url": f"https://bench.example.com/cv/{user_id}.pdf",
+        },
+        headers={"Authorization": f"Bearer {ctx.tokens[user_id]}"},
+    )
+    return response.status_code
+
+
+def _open_stream(ctx: Context, user_id: int):
+    response = ctx.client().get(
+        f"{ctx.base}/applications/user/stream?token={ctx.tokens[user_id]}",
+        buffered=False,
+    )
+    return response, iter(response.response)
+
+
+def sse_user_stream(ctx: Context, i: int) -> int:
+    """Connect, receive the snapshot, disconnect."""
+    user = ctx.data.users[i % len(ctx.data.users)]
+    response, chunks = _open_stream(ctx, user["user_id"])
+    try:
+        first = next(chunks)
+        return response.status_code if first.startswith(b"data:") else 599
+    finally:
+        response.close()
+
+
+def sse_event_delivery(ctx: Context, i: int) -> int:
+    """Publish an application change and wait for it on an open stream."""
+    stream = getattr(ctx._local, "stream", None)
+    if stream is None:
+        user_id = ctx.data.users[i % len(ctx.data.users)]["user_id"]
+        response, chunks = _open_stream(ctx, user_id)
+        stream = ctx._local.stream = (response, chunks, user_id)
+        next(chunks)  # snapshot
+
+    _, chunks, user_id = stream
+    application = {"application_id": -i, "user_id": user_id, "job_id": 1, "status": 2}
+    with ctx.app.app_context():
+        ApplicationEvents.publish("updated", application)
+    for chunk in chunks:
+        if chunk.startswith(b"event: application"):
+            return 200
+    return 599
+
+
+@dataclass
+class Scenario:
+    name: str
+    run: Callable[[Context, int], int]
+    expected: int = 200
+
+
+SCENARIOS = [
+    Scenario("public_jobs", public_jobs),
+    Scenario("public_job_detail", public_job_detail),
+    Scenario("user_login", user_login),
+    Scenario("application_create", application_create, 201),
+    Scenario("sse_user_stream", sse_user_stream),
+    Scenario("sse_event_delivery", sse_event_delivery),
+]
+
+
+def run_scenario(
+    ctx: Context, scenario: Scenario, requests: int, concurrency: int, warmup: int
+) -> dict:
+    for i in range(warmup):
+        scenario.run(ctx, i)
+    ctx.close_stream()
+
+    counter = itertools.count(warmup)
+    lock = threading.Lock()
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    errors = 0
+
+    def worker():
+        try:
+            measure()
+        finally:
+            ctx.close_stream()
+
+    def measure():
+        nonlocal errors
+        while True:
+            with lock:
+                i = next(counter)
+                if i >= warmup + requests:
+                    return
+            start = time.perf_counter()
+            try:
+                status = scenario.run(ctx, i)
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"{scenario.name}: {e!r}")
+                status = 0
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] += 1
+                if status != scenario.expected:
+                    errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    wall = time.perf_counter() - started
+
+    return summarize(latencies, statuses, errors, wall)
+
+
+def git_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return output.stdout.strip()
+    except Exception:
+        return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the API hot paths."
+    )
+    parser.add_argument("--requests", type=int, default=200, help="per scenario")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--applications", type=int, default=2000)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[s.name for s in SCENARIOS],
+        help="run only these scenarios (repeatable)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["fake", "live"],
+        default="fake",
+        help="fake: in-process stand-ins; live: the services in the environment",
+    )
+    parser.add_argument(
+        "--seed-db",
+        action="store_true",
+        help="with --backend live, load the dataset into the (empty) database",
+    )
+    parser.add_argument("--output", help="write the results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--log-level", default="WARNING")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.seed_db and args.backend != "live":
+        parser.error("--seed-db needs --backend live")
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    data = seed.generate(
+        seed=args.seed,
+        users=args.users,
+        jobs=args.jobs,
+        applications=args.applications,
+        rounds=int(os.getenv("BCRYPT_ROUNDS", 12)),
+    )
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+
+    with ExitStack() as stack:
+        if args.backend == "fake":
+            stack.enter_context(fakes.install(data))
+            # kombu warns about the hostless memory:// URL on every connection
+            logging.getLogger("kombu.connection").setLevel(logging.ERROR)
+        app = create_app()
+        stack.callback(Security._hasher.shutdown)
+
+        if args.seed_db:
+            with app.app_context():
+                seed.load_mysql(DB.get_db(), data)
+                DB.close_db()
+
+        with app.app_context():
+            tokens = {
+                user["user_id"]: Security.create_jwt_token(
+                    user["user_id"], user["email"]
+                )
+                for user in data.users
+            }
+        ctx = Context(
+            app=app,
+            data=data,
+            base=app.config.get("API_BASE", "/v1/api"),
+            tokens=tokens,
+            rng=random.Random(args.seed),
+        )
+
+        results = {}
+        for scenario in scenarios:
+            results[scenario.name] = run_scenario(
+                ctx, scenario, args.requests, args.concurrency, args.warmup
+            )
+            summary = results[scenario.name]
+            print(
+                f"{scenario.name:<20} {summary['throughput_rps']:>9} req/s  "
+                f"p50 {summary['p50_ms']:>8}ms  p99 {summary['p99_ms']:>8}ms  "
+                f"errors {summary['errors']}"
+            )
+
+        if EventHub._instance is not None:
+            EventHub._instance.stop()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "seed": args.seed,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "dataset": data.sizes(),
+        },
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
@@ -0,0 +1,55 @@
+import math
+from collections import Counter
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(
+    latencies: list[float], statuses: Counter, errors: int, elapsed: float
+) -> dict:
+    """Throughput and latency figures of one scenario, latencies in seconds."""
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "status_codes": {str(code): n for code, n in sorted(statuses.items())},
+        "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p90_ms": round(percentile(ordered, 90) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.2) -> list[str]:
+    """
+    Regressions of ``current`` against ``baseline`` results files: p99 up
+    or throughput down by more than ``tolerance``, or new errors.
+    """
+    regressions = []
+    for name, base in baseline.get("scenarios", {}).items():
+        result = current.get("scenarios", {}).get(name)
+        if result is None:
+            continue
+        if base["p99_ms"] and result["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {result['p99_ms']}ms vs {base['p99_ms']}ms"
+            )
+        if base["throughput_rps"] and result["throughput_rps"] < base[
+            "throughput_rps"
+        ] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['throughput_rps']} req/s "
+                f"vs {base['throughput_rps']} req/s"
+            )
+        if result["errors"] > base["errors"]:
+            regressions.append(f"{name}: {result['errors']} errors vs {base['errors']}")
+    return regressions
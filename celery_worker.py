@@ -1,6 +1,53 @@
+import os
+import sys
+
 from app import create_app
-from app.extensions.celery import celery  # noqa: F401
+from app.extensions.celery import (
+    QUEUE_AUTH,
+    QUEUE_DEFAULT,
+    QUEUE_NOTIFICATIONS,
+    QUEUE_RESET,
+    celery,
+)
 
 flask_app = create_app()
 
-__all__ = ["celery", "flask_app"]
+# Worker pools by name: the queues each consumes and its default
+# concurrency. Running one pool per queue keeps a backlog of
+# notifications from delaying verification codes; "all" is the single
+# worker used in development.
+POOLS = {
+    "auth": ([QUEUE_AUTH], 2),
+    "reset": ([QUEUE_RESET], 2),
+    "notifications": ([QUEUE_NOTIFICATIONS], 4),
+    "default": ([QUEUE_DEFAULT], 2),
+    "all": ([QUEUE_AUTH, QUEUE_RESET, QUEUE_NOTIFICATIONS, QUEUE_DEFAULT], 4),
+}
+
+
+def worker_argv(pool: str) -> list[str]:
+    """``celery worker`` arguments for a named pool."""
+    queues, concurrency = POOLS[pool]
+    concurrency = os.getenv(f"CELERY_{pool.upper()}_CONCURRENCY", concurrency)
+    return [
+        "worker",
+        "--queues",
+        ",".join(queues),
+        "--concurrency",
+        str(concurrency),
+        "--hostname",
+        f"{pool}@%h",
+        "--loglevel",
+        os.getenv("CELERY_LOG_LEVEL", "info"),
+    ]
+
+
+__all__ = ["celery", "flask_app", "POOLS", "worker_argv"]
+
+
+if __name__ == "__main__":
+    # python celery_worker.py [auth|reset|notifications|default|all]
+    pool = sys.argv[1] if len(sys.argv) > 1 else "all"
+    if pool not in POOLS:
+        sys.exit(f"Unknown worker pool '{pool}', expected one of: {', '.join(POOLS)}")
+    celery.worker_main(worker_argv(pool))
@@ -6,7 +6,16 @@ import { applicationStatusLabel, userStatusLabel } from "../lib/labels";
 
 type Me = Record<string, unknown>;
 type ProfileWrap = { profile?: Record<string, unknown> };
-type Apps = { applications?: Record<string, unknown>[] };
+type Application = Record<string, unknown>;
+type Apps = { applications?: Application[]; next_cursor?: string | null };
+
+// The stream's snapshot is the newest page of the list API; keep the older
+// pages already loaded below it instead of dropping them.
+function mergeSnapshot(loaded: Application[], snapshot: Application[]): Application[] {
+  if (!snapshot.length) return snapshot;
+  const oldest = Math.min(...snapshot.map((app) => Number(app.application_id)));
+  return [...snapshot, ...loaded.filter((app) => Number(app.application_id) < oldest)];
+}
 
 function appStatusClass(status: number | string | undefined): string {
   const n = Number(status);
@@ -22,7 +31,7 @@ export default function DashboardPage() {
 
   const [me, setMe] = useState<Me | null>(null);
   const [profile, setProfile] = useState<Record<string, unknown> | null>(null);
-  const [applications, setApplications] = useState<Record<string, unknown>[]>([]);
+  const [applications, setApplications] = useState<Application[]>([]);
   const [err, setErr] = useState<string[] | null>(null);
   const [liveConnected, setLiveConnected] = useState(false);
   const [loading, setLoading] = useState(true);
@@ -46,8 +55,19 @@ export default function DashboardPage() {
         if (!cancelled) setProfile(null);
       }
       try {
-        const a = await apiRequest<Apps>(`/applications/user/list`, { method: "GET", token: userToken });
-        if (!cancelled) setApplications(Array.isArray(a.applications) ? a.applications : []);
+        // Follow next_cursor so every application is listed, not only the first page
+        const all: Application[] = [];
+        let cursor: string | null | undefined = null;
+        do {
+          const query: string = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+          const a: Apps = await apiRequest<Apps>(`/applications/user/list${query}`, {
+            method: "GET",
+            token: userToken,
+          });
+          if (Array.isArray(a.applications)) all.push(...a.applications);
+          cursor = a.next_cursor;
+        } while (cursor && !cancelled);
+        if (!cancelled) setApplications(all);
       } catch (e) {
         errors.push(e instanceof ApiError ? e.message : "Could not load applications");
         if (!cancelled) setApplications([]);
@@ -71,7 +91,8 @@ export default function DashboardPage() {
     source.onmessage = (event) => {
       try {
         const payload = JSON.parse(event.data) as Apps;
-        if (Array.isArray(payload.applications)) setApplications(payload.applications);
+        const snapshot = payload.applications;
+        if (Array.isArray(snapshot)) setApplications((loaded) => mergeSnapshot(loaded, snapshot));
       } catch { /* ignore */ }
     };
     source.onerror = () => { setLiveConnected(false); source.close(); };
@@ -0,0 +1,14 @@
+-- Full-text relevance search over the job text columns
+CREATE FULLTEXT INDEX `ft_jobs_search` ON `jobs`(`title`, `description`, `requirements`);
+
+-- Filter indexes for /public/jobs/search. Status is always filtered so it
+-- leads every index. Without a keyword the results are newest first:
+-- (status, job_id) and (status, employment_type, job_id) hand rows over
+-- already in job_id order, so a page stops after LIMIT + OFFSET rows.
+CREATE INDEX `idx_jobs_status_id` ON `jobs`(`status`, `job_id`);
+CREATE INDEX `idx_jobs_status_type_id` ON `jobs`(`status`, `employment_type`, `job_id`);
+
+-- Location is compared with a prefix LIKE, a range, so these narrow the
+-- rows and only the matches are sorted.
+CREATE INDEX `idx_jobs_status_type_location` ON `jobs`(`status`, `employment_type`, `location`);
+CREATE INDEX `idx_jobs_status_location` ON `jobs`(`status`, `location`);
@@ -0,0 +1,15 @@
+-- Notifications written in the same transaction as the application change
+-- they describe; the outbox relay turns them into emails and deletes them.
+CREATE TABLE IF NOT EXISTS `notification_outbox` (
+    `outbox_id` BIGINT AUTO_INCREMENT PRIMARY KEY,
+    `event_type` VARCHAR(64) NOT NULL,
+    `payload` JSON NOT NULL,
+    `attempts` TINYINT UNSIGNED NOT NULL DEFAULT 0,
+    -- Not claimed before this time: pushed out by the lease while a relay
+    -- holds the row, and by the retry backoff after a failed attempt
+    `next_attempt_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB;
+
+-- The relay claims the rows that are due, oldest first
+CREATE INDEX `idx_outbox_due` ON `notification_outbox`(`next_attempt_at`, `outbox_id`);
@@ -0,0 +1,4 @@
+-- Newest-first listing of a user's applications without a status filter.
+-- InnoDB appends the primary key, so this orders a user's rows by
+-- application_id; the status-filtered listing uses idx_job_app_user_status.
+CREATE INDEX `idx_job_app_user_id` ON `job_applications`(`user_id`, `application_id`);
@@ -0,0 +1,3 @@
+-- Employer applicant lists page in (created_at, application_id) order per
+-- job; this index returns a page of ids without sorting the applicant set.
+CREATE INDEX `idx_job_app_job_created` ON `job_applications`(`job_id`, `created_at`, `application_id`);
@@ -0,0 +1,16 @@
+-- Applications per job and status, kept up to date in the transaction
+-- that creates or re-statuses an application, so job lists can show
+-- applicant numbers without counting job_applications.
+CREATE TABLE IF NOT EXISTS `job_application_counts` (
+    `job_id` INT NOT NULL,
+    `status` TINYINT NOT NULL,
+    `applications` INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (`job_id`, `status`),
+    FOREIGN KEY (`job_id`) REFERENCES `jobs`(`job_id`)
+) ENGINE=InnoDB;
+
+INSERT INTO `job_application_counts` (`job_id`, `status`, `applications`)
+SELECT `job_id`, `status`, COUNT(*)
+FROM `job_applications`
+GROUP BY `job_id`, `status`
+ON DUPLICATE KEY UPDATE `applications` = VALUES(`applications`);
@@ -5,12 +5,16 @@ from flask import Flask, json
 from flask_restful import Api
 
 from app.controllers.application_controllers import (
+    ApplicationBulkUpdateController,
+    ApplicationCountsController,
+    ApplicationsExportController,
     ApplicationsCreateController,
     ApplicationsListController,
     ApplicationUpdateController,
     UsersJobApplicationController,
     UsersJobApplicationsController,
 )
+from app.utils.exceptions import InvalidCredentialsError
 
 
 class TestApplicationControllers(unittest.TestCase):
@@ -19,6 +23,8 @@ class TestApplicationControllers(unittest.TestCase):
         api = Api(self.app)
 
         api.add_resource(ApplicationsListController, "/applications")
+        api.add_resource(ApplicationCountsController, "/applications/counts")
+        api.add_resource(ApplicationsExportController, "/applications/export")
         api.add_resource(ApplicationsCreateController, "/applications/create")
         api.add_resource(UsersJobApplicationsController, "/applications/user")
         api.add_resource(
@@ -27,8 +33,14 @@ class TestApplicationControllers(unittest.TestCase):
         api.add_resource(
             ApplicationUpdateController, "/applications/<int:application_id>/update"
         )
+        api.add_resource(ApplicationBulkUpdateController, "/applications/update")
 
         self.client = self.app.test_client()
+
+        decode = patch("app.utils.auth.Security.decode_jwt_token")
+        self.mock_decode = decode.start()
+        self.mock_decode.return_value = {"profile_id": 1, "email": "user@example.com"}
+        self.addCleanup(decode.stop)
         self.headers = {"Authorization": "Bearer testtoken"}
         self.valid_payload = {"status": "Open"}
 
@@ -48,6 +60,67 @@ class TestApplicationControllers(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn("info", response.get_json())
 
+    # --- ApplicationCountsController ---
+    @patch(
+        "app.controllers.application_controllers.ApplicationService.count_job_applications"
+    )
+    def test_count_applications_success(self, mock_service):
+        mock_service.return_value = {"job_id": 1, "total": 2, "by_status": {"1": 2}}
+
+        response = self.client.get(
+            "/applications/counts?job_id=1", headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["total"], 2)
+
+    @patch(
+        "app.controllers.application_controllers.ApplicationService.count_job_applications"
+    )
+    def test_count_applications_of_other_employer(self, mock_service):
+        mock_service.side_effect = InvalidCredentialsError("Job 1 is not yours")
+
+        response = self.client.get(
+            "/applications/counts?job_id=1", headers=self.headers
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_count_applications_requires_job_id(self):
+        response = self.client.get("/applications/counts", headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    # --- ApplicationsExportController ---
+    @patch(
+        "app.controllers.application_controllers.ApplicationService.export_job_applications"
+    )
+    def test_export_applications_streams_csv(self, mock_service):
+        mock_service.return_value = iter(
+            [{"application_id": 1, "status": 2}, {"application_id": 2, "status": 1}]
+        )
+
+        response = self.client.get(
+            "/applications/export?job_id=4&format=csv", headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/csv")
+        self.assertIn("job-4-applications.csv", response.headers["Content-Disposition"])
+        self.assertEqual(
+            response.get_data(as_text=True).splitlines(),
+            ["application_id,status", "1,2", "2,1"],
+        )
+        mock_service.assert_called_once_with(1, 4)
+
+    @patch(
+        "app.controllers.application_controllers.ApplicationService.export_job_applications"
+    )
+    def test_export_applications_of_other_employer(self, mock_service):
+        mock_service.side_effect = InvalidCredentialsError("Job 4 is not yours")
+
+        response = self.client.get(
+            "/applications/export?job_id=4", headers=self.headers
+        )
+        self.assertEqual(response.status_code, 403)
+
     # --- ApplicationsCreateController ---
     @patch(
         "app.controllers.application_controllers.ApplicationService.make_application"
@@ -65,6 +138,9 @@ class TestApplicationControllers(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.get_json()["msg"], "success")
+        mock_service.assert_called_once_with(
+            1, "user@example.com", {"job_id": 1, "cover_letter": "I am interested"}
+        )
 
     @patch("app.controllers.application_controllers.JobApplicationSchema.load")
     def test_create_application_validation_error(self, mock_load):
@@ -86,12 +162,34 @@ class TestApplicationControllers(unittest.TestCase):
         "app.controllers.application_controllers.ApplicationService.list_users_applications"
     )
     def test_list_user_applications_success(self, mock_service):
-        mock_service.return_value = [{"id": 1, "job": "QA Engineer"}]
+        mock_service.return_value = {
+            "limit": 20,
+            "count": 1,
+            "applications": [{"id": 1, "job": "QA Engineer"}],
+            "next_cursor": None,
+        }
 
         response = self.client.get("/applications/user", headers=self.headers)
         self.assertEqual(response.status_code, 200)
         self.assertIn("applications", response.get_json())
 
+    @patch(
+        "app.controllers.application_controllers.ApplicationService.list_users_applications"
+    )
+    def test_list_user_applications_passes_filters(self, mock_service):
+        mock_service.return_value = {"applications": []}
+
+        response = self.client.get(
+            "/applications/user?limit=5&status=2&include_cover_letter=true",
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_service.call_args[0][1:], (5, None, 2, True))
+
+    def test_list_user_applications_rejects_bad_status(self):
+        response = self.client.get("/applications/user?status=9", headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
     # --- UsersJobApplicationController ---
     @patch(
         "app.controllers.application_controllers.ApplicationService.get_job_application"
@@ -155,3 +253,30 @@ class TestApplicationControllers(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 404)
         self.assertIn("Application 999 was not updated", response.get_json()["msg"])
+
+    # --- ApplicationBulkUpdateController ---
+    @patch(
+        "app.controllers.application_controllers.ApplicationService.bulk_update_applications"
+    )
+    def test_bulk_update_applications(self, mock_service):
+        mock_service.return_value = {"status": 3, "updated": [1, 2], "not_updated": []}
+
+        response = self.client.put(
+            "/applications/update",
+            data=json.dumps({"application_ids": [1, 2], "status": 3}),
+            headers=self.headers,
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["updated"], [1, 2])
+        mock_service.assert_called_once_with(1, [1, 2], 3)
+
+    def test_bulk_update_rejects_oversized_batch(self):
+        response = self.client.put(
+            "/applications/update",
+            data=json.dumps({"application_ids": list(range(1, 502)), "status": 3}),
+            headers=self.headers,
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("application_ids", response.get_json()["errors"])
@@ -2,13 +2,13 @@ import unittest
 from unittest.mock import patch
 
 from app.services.application_service import ApplicationService
-from app.utils.exceptions import GenericDatabaseError
+from app.utils.exceptions import GenericDatabaseError, InvalidCredentialsError
 
 
 class TestApplicationService(unittest.TestCase):
     def setUp(self):
-        self.token = "validtoken"
-        self.decoded = {"profile_id": 1, "email": "user@example.com"}
+        self.user_id = 1
+        self.email = "user@example.com"
         self.payload = {
             "job_id": 1,
             "status": 1,
@@ -17,70 +17,41 @@ class TestApplicationService(unittest.TestCase):
         }
 
     # --- make_application ---
-    @patch(
-        "app.services.application_service.NotificationService.notify_employer_of_new_application"
-    )
-    @patch(
-        "app.services.application_service.NotificationService.notify_applicant_of_submission"
-    )
-    @patch(
-        "app.services.application_service.ApplicationRepository.get_job_info_for_notification"
-    )
     @patch("app.services.application_service.ApplicationRepository.create_application")
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_make_application_success(
-        self,
-        mock_decode,
-        mock_create,
-        mock_job_info,
-        mock_notify_applicant,
-        mock_notify_employer,
-    ):
-        mock_decode.return_value = self.decoded
+    def test_make_application_success(self, mock_create):
         mock_create.return_value = 1
-        mock_job_info.return_value = {
-            "job_title": "Backend Engineer",
-            "company_name": "Acme",
-            "employer_email": "hr@acme.com",
-        }
-        result = ApplicationService.make_application(self.token, self.payload)
+        result = ApplicationService.make_application(
+            self.user_id, self.email, self.payload
+        )
         self.assertTrue(result)
-        mock_notify_applicant.assert_called_once()
-        mock_notify_employer.assert_called_once()
+        # The applicant's email goes to the outbox with the insert
+        mock_create.assert_called_once_with(self.user_id, self.payload, self.email)
 
     @patch("app.services.application_service.ApplicationRepository.create_application")
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_make_application_failure_no_rows(self, mock_decode, mock_create):
-        mock_decode.return_value = self.decoded
+    def test_make_application_failure_no_rows(self, mock_create):
         mock_create.return_value = 0
-        result = ApplicationService.make_application(self.token, self.payload)
+        result = ApplicationService.make_application(
+            self.user_id, self.email, self.payload
+        )
         self.assertFalse(result)
 
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_make_application_invalid_token(self, mock_decode):
-        mock_decode.return_value = None
+    def test_make_application_missing_user_id(self):
         with self.assertRaises(GenericDatabaseError):
-            ApplicationService.make_application(self.token, self.payload)
-
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_make_application_missing_user_id(self, mock_decode):
-        mock_decode.return_value = {"profile_id": None, "email": "x@y.com"}
-        with self.assertRaises(GenericDatabaseError):
-            ApplicationService.make_application(self.token, self.payload)
+            ApplicationService.make_application(None, self.email, self.payload)
 
     def test_make_application_invalid_payload_type(self):
         with self.assertRaises(GenericDatabaseError):
-            ApplicationService.make_application(self.token, ["not_a_dict"])
+            ApplicationService.make_application(
+                self.user_id, self.email, ["not_a_dict"]
+            )
 
     # --- get_all_job_applications ---
     @patch(
         "app.services.application_service.ApplicationRepository.get_jobs_applications"
     )
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_get_all_job_applications_success(self, mock_decode, mock_get_jobs):
-        mock_decode.return_value = self.decoded
+    def test_get_all_job_applications_success(self, mock_get_jobs):
         mock_get_jobs.return_value = [{"id": 1}]
-        result = ApplicationService.get_all_job_applications(self.token, 1, 10, 1)
+        result = ApplicationService.get_all_job_applications(self.user_id, 1, 10, 1)
         self.assertEqual(result["page"], 1)
         self.assertEqual(result["limit"], 10)
         self.assertEqual(result["count"], 1)
@@ -89,90 +60,152 @@ class TestApplicationService(unittest.TestCase):
     @patch(
         "app.services.application_service.ApplicationRepository.get_jobs_applications"
     )
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_get_all_job_applications_error(self, mock_decode, mock_get_jobs):
-        mock_decode.return_value = self.decoded
+    def test_get_all_job_applications_error(self, mock_get_jobs):
         mock_get_jobs.side_effect = Exception("DB error")
         with self.assertRaises(GenericDatabaseError):
-            ApplicationService.get_all_job_applications(self.token, 1, 10, 1)
+            ApplicationService.get_all_job_applications(self.user_id, 1, 10, 1)
+
+    @patch(
+        "app.services.application_service.ApplicationRepository.get_jobs_applications_after"
+    )
+    @patch(
+        "app.services.application_service.ApplicationRepository.get_jobs_applications"
+    )
+    def test_get_all_job_applications_keyset(self, mock_get_jobs, mock_after):
+        mock_get_jobs.return_value = [
+            {"application_id": 4, "created_at": "2025-01-01T10:00:00"},
+            {"application_id": 6, "created_at": "2025-01-01T10:00:00"},
+        ]
+        first = ApplicationService.get_all_job_applications(self.user_id, 3, 2, 1)
+
+        mock_after.return_value = [{"application_id": 9, "created_at": "x"}]
+        second = ApplicationService.get_all_job_applications(
+            self.user_id, 3, 2, 1, first["next_cursor"]
+        )
+
+        mock_after.assert_called_once_with(3, self.user_id, "2025-01-01 10:00:00", 6, 3)
+        self.assertEqual(second["count"], 1)
+        self.assertIsNone(second["next_cursor"])
+
+    # --- count_job_applications ---
+    @patch(
+        "app.services.application_service.ApplicationRepository.count_job_applications"
+    )
+    @patch("app.services.application_service.JobRepository.get_job")
+    def test_count_job_applications(self, mock_get_job, mock_count):
+        mock_get_job.return_value = {"job_id": 3, "admin_id": self.user_id}
+        mock_count.return_value = {1: 4, 3: 1}
+
+        result = ApplicationService.count_job_applications(self.user_id, 3)
+
+        self.assertEqual(result["total"], 5)
+        self.assertEqual(result["by_status"], {"1": 4, "2": 0, "3": 1, "4": 0})
 
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_get_all_job_applications_invalid_token(self, mock_decode):
-        mock_decode.return_value = None
+    @patch("app.services.application_service.JobRepository.get_job")
+    def test_count_job_applications_of_other_employer(self, mock_get_job):
+        mock_get_job.return_value = {"job_id": 3, "admin_id": 99}
+        with self.assertRaises(InvalidCredentialsError):
+            ApplicationService.count_job_applications(self.user_id, 3)
+
+    # --- export_job_applications ---
+    @patch(
+        "app.services.application_service.ApplicationRepository.stream_job_applications"
+    )
+    @patch("app.services.application_service.JobRepository.get_job")
+    def test_export_job_applications_checks_owner_first(
+        self, mock_get_job, mock_stream
+    ):
+        mock_get_job.return_value = {"job_id": 3, "admin_id": 99}
+        with self.assertRaises(InvalidCredentialsError):
+            ApplicationService.export_job_applications(self.user_id, 3)
+        mock_stream.assert_not_called()
+
+        mock_get_job.return_value = {"job_id": 3, "admin_id": self.user_id}
+        ApplicationService.export_job_applications(self.user_id, 3)
+        mock_stream.assert_called_once_with(3, self.user_id)
+
+    def test_get_all_job_applications_missing_id(self):
         with self.assertRaises(GenericDatabaseError):
-            ApplicationService.get_all_job_applications(self.token, 1, 10, 1)
+            ApplicationService.get_all_job_applications(None, 1, 10, 1)
 
     # --- get_job_application ---
     @patch(
         "app.services.application_service.ApplicationRepository.get_user_application"
     )
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_get_job_application_success(self, mock_decode, mock_get_user_app):
-        mock_decode.return_value = self.decoded
+    def test_get_job_application_success(self, mock_get_user_app):
         mock_get_user_app.return_value = {"id": 1}
-        result = ApplicationService.get_job_application(self.token, 1)
+        result = ApplicationService.get_job_application(self.user_id, 1)
         self.assertEqual(result["id"], 1)
 
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_get_job_application_invalid_token(self, mock_decode):
-        mock_decode.return_value = None
+    def test_get_job_application_missing_id(self):
         with self.assertRaises(GenericDatabaseError):
-            ApplicationService.get_job_application(self.token, 1)
+            ApplicationService.get_job_application(None, 1)
 
     # --- list_users_applications ---
     @patch(
         "app.services.application_service.ApplicationRepository.get_user_applications"
     )
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_list_users_applications_success(self, mock_decode, mock_get_apps):
-        mock_decode.return_value = self.decoded
-        mock_get_apps.return_value = [{"id": 1}]
-        result = ApplicationService.list_users_applications(self.token)
-        self.assertEqual(result[0]["id"], 1)
-
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_list_users_applications_invalid_token(self, mock_decode):
-        mock_decode.return_value = None
-        with self.assertRaises(GenericDatabaseError):
-            ApplicationService.list_users_applications(self.token)
+    def test_list_users_applications_success(self, mock_get_apps):
+        mock_get_apps.return_value = [{"application_id": 1}]
+        result = ApplicationService.list_users_applications(self.user_id)
+        self.assertEqual(result["applications"][0]["application_id"], 1)
+        self.assertIsNone(result["next_cursor"])
+        mock_get_apps.assert_called_once_with(self.user_id, 51, None, None, False)
 
-    # --- update_an_application ---
     @patch(
-        "app.services.application_service.NotificationService.notify_applicant_status_change"
-    )
-    @patch(
-        "app.services.application_service.ApplicationRepository.get_application_details"
+        "app.services.application_service.ApplicationRepository.get_user_applications"
     )
+    def test_list_users_applications_cursor_round_trip(self, mock_get_apps):
+        mock_get_apps.return_value = [{"application_id": i} for i in (9, 8, 7)]
+        first = ApplicationService.list_users_applications(self.user_id, limit=2)
+        self.assertEqual(first["count"], 2)
+        self.assertIsNotNone(first["next_cursor"])
+
+        mock_get_apps.return_value = [{"application_id": 7}]
+        second = ApplicationService.list_users_applications(
+            self.user_id, limit=2, cursor=first["next_cursor"], status=2
+        )
+        mock_get_apps.assert_called_with(self.user_id, 3, 8, 2, False)
+        self.assertIsNone(second["next_cursor"])
+
+    def test_list_users_applications_bad_cursor(self):
+        with self.assertRaises(GenericDatabaseError):
+            ApplicationService.list_users_applications(self.user_id, cursor="bad!")
+
+    def test_list_users_applications_missing_id(self):
+        with self.assertRaises(GenericDatabaseError):
+            ApplicationService.list_users_applications(None)
+
+    # --- update_an_application ---
     @patch("app.services.application_service.ApplicationRepository.update_application")
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_update_an_application_success(
-        self,
-        mock_decode,
-        mock_update,
-        mock_details,
-        mock_notify,
-    ):
-        mock_decode.return_value = self.decoded
+    def test_update_an_application_success(self, mock_update):
         mock_update.return_value = 1
-        mock_details.return_value = {
-            "applicant_email": "user@example.com",
-            "job_title": "Engineer",
-            "company_name": "Acme",
-        }
-        result = ApplicationService.update_an_application(self.token, 1, 2)
+        result = ApplicationService.update_an_application(self.user_id, 1, 2)
         self.assertTrue(result)
-        mock_notify.assert_called_once()
+        mock_update.assert_called_once_with(1, self.user_id, 2)
 
     @patch("app.services.application_service.ApplicationRepository.update_application")
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_update_an_application_not_found(self, mock_decode, mock_update):
-        mock_decode.return_value = self.decoded
+    def test_update_an_application_not_found(self, mock_update):
         mock_update.return_value = 0
-        result = ApplicationService.update_an_application(self.token, 1, 2)
+        result = ApplicationService.update_an_application(self.user_id, 1, 2)
         self.assertFalse(result)
 
-    @patch("app.services.application_service.Security.decode_jwt_token")
-    def test_update_an_application_invalid_token(self, mock_decode):
-        mock_decode.return_value = None
+    def test_update_an_application_missing_id(self):
+        with self.assertRaises(GenericDatabaseError):
+            ApplicationService.update_an_application(None, 1, 2)
+
+    # --- bulk_update_applications ---
+    @patch("app.services.application_service.ApplicationRepository.update_applications")
+    def test_bulk_update_reports_ids_not_updated(self, mock_update):
+        mock_update.return_value = [1, 3]
+
+        result = ApplicationService.bulk_update_applications(
+            self.user_id, [3, 1, 3, 8], 2
+        )
+
+        mock_update.assert_called_once_with([3, 1, 8], self.user_id, 2)
+        self.assertEqual(result, {"status": 2, "updated": [1, 3], "not_updated": [8]})
+
+    def test_bulk_update_missing_admin(self):
         with self.assertRaises(GenericDatabaseError):
-            ApplicationService.update_an_application(self.token, 1, 2)
+            ApplicationService.bulk_update_applications(None, [1], 2)
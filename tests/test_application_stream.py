@@ -0,0 +1,239 @@
+import json
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from app.extensions.event_hub import RESYNC, EventHub
+from app.repositories.application_events import ApplicationEvents
+from app.services.application_stream_service import ApplicationStreamService
+from app.utils.exceptions import InvalidCredentialsError
+from app.utils.metrics import Metrics
+
+
+class TestApplicationEvents(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+
+    @patch("app.repositories.application_events.Cache.connect_redis")
+    def test_publish_to_user_and_job_channels(self, mock_redis):
+        pipe = mock_redis.return_value.pipeline.return_value
+
+        ApplicationEvents.publish(
+            "updated", {"application_id": 1, "user_id": 5, "job_id": 3, "status": 2}
+        )
+
+        channels = [call.args[0] for call in pipe.publish.call_args_list]
+        self.assertEqual(channels, ["applications:user:5", "applications:job:3"])
+        payload = json.loads(pipe.publish.call_args_list[0].args[1])
+        self.assertEqual(payload["type"], "updated")
+        pipe.execute.assert_called_once()
+        self.assertEqual(Metrics.get("application_events.published"), 1)
+
+    @patch("app.repositories.application_events.Cache.connect_redis")
+    def test_publish_fails_open(self, mock_redis):
+        mock_redis.side_effect = Exception("redis down")
+
+        ApplicationEvents.publish("created", {"user_id": 5, "job_id": 3})
+
+        self.assertEqual(Metrics.get("application_events.errors"), 1)
+
+
+class TestEventHub(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        self.hub = EventHub(MagicMock())
+
+    def test_dispatch_reaches_only_channel_subscribers(self):
+        # A live thread stub keeps subscribe() from starting the listener
+        self.hub._thread = MagicMock(is_alive=lambda: True)
+        first = self.hub.subscribe("applications:user:1")
+        other = self.hub.subscribe("applications:user:2")
+
+        self.hub.dispatch("applications:user:1", {"type": "updated"})
+
+        self.assertEqual(first.get(timeout=0), {"type": "updated"})
+        self.assertIsNone(other.get(timeout=0))
+
+    def test_overflow_drops_pending_events_and_resyncs(self):
+        self.hub._thread = MagicMock(is_alive=lambda: True)
+        sub = self.hub.subscribe("applications:job:3", maxsize=1)
+
+        self.hub.dispatch("applications:job:3", {"n": 1})
+        self.hub.dispatch("applications:job:3", {"n": 2})
+
+        self.assertIs(sub.get(timeout=0), RESYNC)
+        self.assertIsNone(sub.get(timeout=0))
+        self.assertEqual(Metrics.get("event_hub.overflows"), 1)
+
+    def test_close_unsubscribes(self):
+        self.hub._thread = MagicMock(is_alive=lambda: True)
+        sub = self.hub.subscribe("applications:job:3")
+
+        sub.close()
+
+        self.assertEqual(self.hub._subs, {})
+
+    def test_subscriber_thread_dispatches_pmessages(self):
+        pubsub = self.hub._client_factory.return_value.pubsub.return_value
+        messages = [
+            {"type": "pmessage", "channel": "applications:user:1", "data": '{"a": 1}'},
+        ]
+
+        def get_message(timeout):
+            if messages:
+                return messages.pop()
+            self.hub.stop()
+            return None
+
+        pubsub.get_message.side_effect = get_message
+        sub = self.hub.subscribe("applications:user:1")
+        self.hub._thread.join(timeout=2)
+
+        self.assertEqual(sub.get(timeout=0), {"a": 1})
+        pubsub.psubscribe.assert_called_once_with("applications:*")
+        pubsub.close.assert_called_once()
+
+
+class FakeSubscription:
+    def __init__(self, events):
+        self.events = list(events)
+        self.closed = False
+
+    def get(self, timeout):
+        return self.events.pop(0) if self.events else None
+
+    def close(self):
+        self.closed = True
+
+
+class TestApplicationStreamService(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SSE_HEARTBEAT_SECONDS=0, SSE_CLIENT_QUEUE_SIZE=10)
+        self.ctx = self.app.test_request_context()
+        self.ctx.push()
+        self.release = patch(
+            "app.services.application_stream_service.release_connections"
+        ).start()
+        self.hub = patch(
+            "app.services.application_stream_service.EventHub.instance"
+        ).start()
+        self.decode = patch(
+            "app.services.application_stream_service.Security.decode_jwt_token"
+        ).start()
+        self.decode.return_value = {"profile_id": 5, "exp": time.time() + 60}
+
+    def tearDown(self):
+        patch.stopall()
+        self.ctx.pop()
+
+    def subscribe(self, events):
+        subscription = FakeSubscription(events)
+        self.hub.return_value.subscribe.return_value = subscription
+        return subscription
+
+    @patch("app.services.application_stream_service.ApplicationRepository")
+    def test_user_stream_patches_snapshot_in_memory(self, mock_repo):
+        mock_repo.get_user_applications.return_value = [
+            {"application_id": 1, "status": 1}
+        ]
+        sub = self.subscribe(
+            [{"type": "updated", "application": {"application_id": 1, "status": 3}}]
+        )
+
+        stream = ApplicationStreamService.open_user_stream("token")
+        snapshot, delta, full = next(stream), next(stream), next(stream)
+        stream.close()
+
+        self.assertIn('"status": 1', snapshot)
+        self.assertTrue(delta.startswith("event: application\n"))
+        self.assertEqual(
+            json.loads(full[len("data: ") :])["applications"][0]["status"], 3
+        )
+        mock_repo.get_user_applications.assert_called_once_with(5, 50)
+        self.hub.return_value.subscribe.assert_called_once_with(
+            "applications:user:5", 10
+        )
+        self.assertTrue(sub.closed)
+
+    @patch("app.services.application_stream_service.ApplicationRepository")
+    def test_resync_and_new_applications_reload_snapshot(self, mock_repo):
+        mock_repo.get_user_applications.return_value = []
+        self.subscribe(
+            [
+                RESYNC,
+                {"type": "created", "application": {"application_id": 9}},
+            ]
+        )
+
+        stream = ApplicationStreamService.open_user_stream("token")
+        messages = [next(stream) for _ in range(4)]
+        stream.close()
+
+        self.assertEqual(mock_repo.get_user_applications.call_count, 3)
+        self.assertTrue(messages[2].startswith("event: application\n"))
+
+    @patch("app.services.application_stream_service.ApplicationRepository")
+    def test_idle_stream_sends_heartbeat_without_queries(self, mock_repo):
+        mock_repo.get_user_applications.return_value = []
+        self.subscribe([])
+
+        stream = ApplicationStreamService.open_user_stream("token")
+        next(stream)
+        heartbeat = next(stream)
+        stream.close()
+
+        self.assertEqual(heartbeat, ": keep-alive\n\n")
+        mock_repo.get_user_applications.assert_called_once()
+
+    @patch("app.services.application_stream_service.ApplicationRepository")
+    def test_stream_ends_when_token_expires(self, mock_repo):
+        mock_repo.get_user_applications.return_value = []
+        self.decode.return_value = {"profile_id": 5, "exp": time.time() - 1}
+        sub = self.subscribe([])
+
+        messages = list(ApplicationStreamService.open_user_stream("token"))
+
+        self.assertIn("Token expired", messages[-1])
+        self.assertTrue(sub.closed)
+
+    @patch("app.services.application_stream_service.JobRepository.get_job")
+    def test_admin_stream_rejects_foreign_job(self, mock_get_job):
+        mock_get_job.return_value = {"job_id": 3, "admin_id": 99}
+
+        with self.assertRaises(InvalidCredentialsError):
+            ApplicationStreamService.open_admin_stream("token", 3)
+
+    @patch("app.services.application_stream_service.ApplicationRepository")
+    @patch("app.services.application_stream_service.JobRepository.get_job")
+    def test_admin_stream_updates_status_on_page(self, mock_get_job, mock_repo):
+        mock_get_job.return_value = {"job_id": 3, "admin_id": 5}
+        mock_repo.get_jobs_applications.return_value = [
+            {"application_id": 1, "status": 1, "modified_at": None}
+        ]
+        self.subscribe(
+            [
+                {
+                    "type": "updated",
+                    "application": {
+                        "application_id": 1,
+                        "status": 2,
+                        "modified_at": "2025-01-02T00:00:00",
+                    },
+                }
+            ]
+        )
+
+        stream = ApplicationStreamService.open_admin_stream("token", 3)
+        next(stream), next(stream)
+        page = json.loads(next(stream)[len("data: ") :])
+        stream.close()
+
+        self.assertEqual(page["applications"][0]["status"], 2)
+        mock_repo.get_jobs_applications.assert_called_once_with(3, 10, 0, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
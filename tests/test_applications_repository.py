@@ -1,7 +1,10 @@
+import json
 import unittest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+from pymysql.cursors import SSDictCursor
+
 from app.repositories.applications_repository import (
     ApplicationRepository,
     serialize_application,
@@ -56,6 +59,91 @@ class TestApplicationRepository(unittest.TestCase):
         result = ApplicationRepository.get_jobs_applications(1, 10, 0, 1)
         self.assertEqual(result[0]["created_at"], "2025-01-01T00:00:00")
 
+        # The page of ids is chosen before user and profile are joined
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("FROM (\n", query)
+        self.assertIn("ORDER BY page.created_at, page.application_id", query)
+        self.assertEqual(params, [1, 1, 10, 0])
+
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_get_jobs_applications_after_uses_keyset(self, mock_get_db):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        ApplicationRepository.get_jobs_applications_after(
+            3, 5, "2025-01-01 10:00:00", 40, 11
+        )
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("page.created_at = %s AND page.application_id > %s", query)
+        self.assertEqual(
+            params,
+            [3, 5, "2025-01-01 10:00:00", "2025-01-01 10:00:00", 40, 11, 0],
+        )
+
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_stream_job_applications_reads_unbuffered(self, mock_get_db):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.__iter__.return_value = iter(
+            [{"application_id": 1, "created_at": datetime(2025, 1, 1)}]
+        )
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        rows = list(ApplicationRepository.stream_job_applications(3, 5))
+
+        self.assertEqual(
+            rows, [{"application_id": 1, "created_at": "2025-01-01T00:00:00"}]
+        )
+        mock_get_db.return_value.cursor.assert_called_once_with(SSDictCursor)
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("j.admin_id = %s", query)
+        self.assertEqual(params, (3, 5))
+
+    @patch("app.repositories.application_counts_repository.DB.get_db")
+    def test_count_job_applications_reads_summary_table(self, mock_get_db):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {"job_id": 2, "status": 1, "applications": 4},
+            {"job_id": 2, "status": 2, "applications": 0},
+            {"job_id": 2, "status": 3, "applications": 1},
+        ]
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        self.assertEqual(ApplicationRepository.count_job_applications(2), {1: 4, 3: 1})
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("FROM job_application_counts", query)
+        self.assertEqual(params, [2])
+
+    @patch("app.repositories.applications_repository.ApplicationEvents")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_update_application_moves_job_counters(self, mock_get_db, mock_events):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {
+                "application_id": 1,
+                "user_id": 5,
+                "job_id": 3,
+                "status": 1,
+                "modified_at": datetime(2025, 1, 2),
+            }
+        ]
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        ApplicationRepository.update_application(1, 1, 2)
+
+        lock, update, counters = [c[0] for c in mock_cursor.execute.call_args_list]
+        self.assertIn("FOR UPDATE OF ja", lock[0])
+        self.assertEqual(update[1], [2, datetime(2025, 1, 2), 1])
+        self.assertIn("INSERT INTO job_application_counts", counters[0])
+        self.assertEqual(counters[1], [3, 1, -1, 3, 2, 1])
+        _, (application,) = mock_events.publish_many.call_args[0]
+        self.assertEqual(application["status"], 2)
+
     @patch("app.repositories.applications_repository.DB.get_db")
     def test_get_user_application_success(self, mock_get_db):
         mock_conn = MagicMock()
@@ -94,15 +182,76 @@ class TestApplicationRepository(unittest.TestCase):
         mock_get_db.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
 
-        result = ApplicationRepository.get_user_applications(1)
+        result = ApplicationRepository.get_user_applications(1, 20)
         self.assertEqual(result[0]["created_at"], "2025-01-01T00:00:00")
 
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertNotIn("cover_letter", query)
+        self.assertEqual(params, [1, 20])
+
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_get_user_applications_filters_and_pages(self, mock_get_db):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        ApplicationRepository.get_user_applications(
+            1, 11, before_id=40, status=2, include_cover_letter=True
+        )
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn(", cover_letter", query)
+        self.assertIn("user_id = %s AND status = %s AND application_id < %s", query)
+        self.assertIn("ORDER BY application_id DESC", query)
+        self.assertEqual(params, [1, 2, 40, 11])
+
+    @patch("app.repositories.applications_repository.ApplicationEvents")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_update_applications_in_a_fixed_number_of_statements(
+        self, mock_get_db, mock_events
+    ):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        now = datetime(2025, 1, 2)
+        mock_cursor.fetchall.return_value = [
+            {"application_id": 4, "user_id": 5, "job_id": 3, "status": 1},
+            {"application_id": 6, "user_id": 7, "job_id": 3, "status": 3},
+            {"application_id": 9, "user_id": 8, "job_id": 2, "status": 1},
+        ]
+        for row, email in zip(mock_cursor.fetchall.return_value, ["a@t", "b@t", None]):
+            row.update(modified_at=now, applicant_email=email)
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        updated = ApplicationRepository.update_applications([4, 6, 9, 12], 1, 3)
+
+        self.assertEqual(updated, [4, 6, 9])
+        lock, update, counters, outbox = [
+            c[0] for c in mock_cursor.execute.call_args_list
+        ]
+        self.assertEqual(lock[1], [4, 6, 9, 12, 1])
+        self.assertEqual(update[1], [3, now, 4, 6, 9])
+        # Application 6 already had status 3 and does not move a counter
+        self.assertEqual(counters[1], [3, 1, -1, 3, 3, 1, 2, 1, -1, 2, 3, 1])
+        self.assertEqual(outbox[0].count("(%s, %s)"), 2)
+        mock_get_db.return_value.commit.assert_called_once()
+        _, applications = mock_events.publish_many.call_args[0]
+        self.assertEqual([a["status"] for a in applications], [3, 3, 3])
+
     @patch("app.repositories.applications_repository.DB.get_db")
     def test_update_application_success(self, mock_get_db):
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         mock_cursor.__enter__.return_value = mock_cursor
-        mock_cursor.rowcount = 1
+        mock_cursor.fetchall.return_value = [
+            {
+                "application_id": 1,
+                "job_id": 1,
+                "status": 2,
+                "modified_at": datetime(2025, 1, 2),
+                "applicant_email": "a@test.com",
+            }
+        ]
         mock_get_db.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
 
@@ -116,13 +265,155 @@ class TestApplicationRepository(unittest.TestCase):
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         mock_cursor.__enter__.return_value = mock_cursor
-        mock_cursor.rowcount = 0
+        mock_cursor.fetchall.return_value = []
         mock_get_db.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
 
         result = ApplicationRepository.update_application(1, 1, 2)
         self.assertFalse(result)
 
+    @patch("app.repositories.applications_repository.ApplicationEvents")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_create_application_publishes_event(self, mock_get_db, mock_events):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.lastrowid = 7
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        data = {"job_id": 3, "status": 1, "cover_letter": "", "resume_url": ""}
+        ApplicationRepository.create_application(5, data)
+
+        event_type, application = mock_events.publish.call_args[0]
+        self.assertEqual(event_type, "created")
+        self.assertEqual(application["application_id"], 7)
+        self.assertEqual(application["user_id"], 5)
+        self.assertEqual(application["job_id"], 3)
+
+    @patch("app.repositories.applications_repository.ApplicationEvents")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_update_application_publishes_changed_row(self, mock_get_db, mock_events):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {
+                "application_id": 1,
+                "user_id": 5,
+                "job_id": 3,
+                "status": 2,
+                "modified_at": datetime(2025, 1, 2),
+            }
+        ]
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        ApplicationRepository.update_application(1, 1, 2)
+
+        mock_events.publish_many.assert_called_once()
+        event_type, (application,) = mock_events.publish_many.call_args[0]
+        self.assertEqual(event_type, "updated")
+        self.assertEqual(application["modified_at"], "2025-01-02T00:00:00")
+
+    @patch("app.repositories.applications_repository.ApplicationEvents")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_update_application_no_event_when_unchanged(
+        self, mock_get_db, mock_events
+    ):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        ApplicationRepository.update_application(1, 1, 2)
+
+        mock_cursor.execute.assert_called_once()
+        mock_events.publish_many.assert_not_called()
+
+    @patch("app.repositories.applications_repository.ApplicationEvents")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_create_application_writes_outbox_before_commit(
+        self, mock_get_db, mock_events
+    ):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.lastrowid = 7
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.commit.side_effect = lambda: self.assertEqual(
+            mock_cursor.execute.call_count, 3
+        )
+
+        data = {"job_id": 3, "status": 1, "cover_letter": "", "resume_url": ""}
+        result = ApplicationRepository.create_application(5, data, "a@test.com")
+
+        self.assertEqual(result, 7)
+        query, (event_type, payload) = mock_cursor.execute.call_args[0]
+        self.assertIn("INSERT INTO notification_outbox", query)
+        self.assertEqual(event_type, "application.created")
+        self.assertEqual(
+            json.loads(payload), {"applicant_email": "a@test.com", "job_id": 3}
+        )
+        mock_conn.commit.assert_called_once()
+
+    @patch("app.repositories.applications_repository.ApplicationEvents")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_update_application_writes_outbox(self, mock_get_db, mock_events):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {
+                "application_id": 1,
+                "user_id": 5,
+                "job_id": 3,
+                "status": 2,
+                "modified_at": datetime(2025, 1, 2),
+                "applicant_email": "a@test.com",
+            }
+        ]
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        ApplicationRepository.update_application(1, 1, 2)
+
+        query, (event_type, payload) = mock_cursor.execute.call_args[0]
+        self.assertIn("INSERT INTO notification_outbox", query)
+        self.assertEqual(event_type, "application.status_changed")
+        self.assertEqual(
+            json.loads(payload),
+            {"applicant_email": "a@test.com", "job_id": 3, "status": 2},
+        )
+        mock_conn.commit.assert_called_once()
+        # The address goes to the outbox, not to the stream event
+        _, (application,) = mock_events.publish_many.call_args[0]
+        self.assertNotIn("applicant_email", application)
+
+    @patch("app.repositories.applications_repository.JobCache")
+    @patch("app.repositories.applications_repository.DB.get_db")
+    def test_job_info_for_notification_is_read_through_cache(
+        self, mock_get_db, mock_cache
+    ):
+        mock_cache.version.return_value = 4
+        mock_cache.get_notification_info.return_value = None
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        row = {"job_title": "QA", "company_name": "Acme", "employer_email": "hr@a.com"}
+        mock_cursor.fetchone.return_value = row
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        self.assertEqual(ApplicationRepository.get_job_info_for_notification(3), row)
+        mock_cache.set_notification_info.assert_called_once_with(4, 3, row)
+
+        mock_cache.get_notification_info.return_value = row
+        mock_get_db.reset_mock()
+        ApplicationRepository.get_job_info_for_notification(3)
+        mock_get_db.assert_not_called()
+
     @patch("app.repositories.applications_repository.DB.get_db")
     def test_create_application_db_error(self, mock_get_db):
         mock_conn = MagicMock()
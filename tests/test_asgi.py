@@ -0,0 +1,234 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from flask import Flask
+
+from app.asgi import StreamApp
+from app.extensions.event_hub import RESYNC, AsyncEventHub
+from app.services.application_stream_service import StreamSpec
+from app.utils.metrics import Metrics
+
+
+def http_scope(path, query=b"", method="GET"):
+    return {"type": "http", "path": path, "method": method, "query_string": query}
+
+
+class FakeHub:
+    def __init__(self, events):
+        self.events = list(events)
+        self.closed = False
+
+    def subscribe(self, channel, maxsize):
+        self.channel = channel
+        return self
+
+    async def get(self, timeout):
+        if self.events:
+            return self.events.pop(0)
+        await asyncio.sleep(0)
+        return None
+
+    def close(self):
+        self.closed = True
+
+    def stats(self):
+        return {}
+
+
+class TestStreamApp(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        self.flask_app = Flask(__name__)
+        self.flask_app.config.update(API_BASE="/v1/api", SSE_HEARTBEAT_SECONDS=1)
+
+    def call(self, app, scope, max_messages=10):
+        sent = []
+        disconnect = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if len(sent) >= max_messages:
+                disconnect.set()
+                # Let the disconnect watcher observe it before the next send
+                await asyncio.sleep(0)
+
+        asyncio.run(app(scope, receive, send))
+        return sent
+
+    def user_spec(self, refresh_payload='data: {"applications": []}\n\n'):
+        refresh = MagicMock(return_value=({}, refresh_payload))
+        apply = MagicMock(return_value=None)
+        spec = StreamSpec(
+            {"profile_id": 5, "exp": time.time() + 60},
+            "applications:user:5",
+            refresh,
+            apply,
+        )
+        return spec
+
+    @patch("app.asgi.ApplicationStreamService.user_stream_spec")
+    def test_user_stream_sends_snapshot_events_and_heartbeats(self, mock_spec):
+        spec = self.user_spec()
+        mock_spec.return_value = spec
+        event = {"type": "created", "application": {"application_id": 9}}
+        hub = FakeHub([event])
+        app = StreamApp(self.flask_app, hub=hub)
+
+        sent = self.call(
+            app, http_scope("/v1/api/applications/user/stream", b"token=abc"), 5
+        )
+
+        start = sent[0]
+        self.assertEqual(start["status"], 200)
+        self.assertIn((b"content-type", b"text/event-stream"), start["headers"])
+        bodies = [m["body"].decode() for m in sent[1:]]
+        self.assertTrue(bodies[0].startswith("data: "))
+        self.assertTrue(bodies[1].startswith("event: application\n"))
+        self.assertEqual(spec.refresh.call_count, 2)
+        self.assertEqual(bodies[3], ": keep-alive\n\n")
+        self.assertEqual(hub.channel, "applications:user:5")
+        self.assertTrue(hub.closed)
+        mock_spec.assert_called_once_with("abc")
+
+    @patch("app.asgi.ApplicationStreamService.user_stream_spec")
+    def test_resync_reloads_snapshot_without_delta(self, mock_spec):
+        spec = self.user_spec()
+        mock_spec.return_value = spec
+        app = StreamApp(self.flask_app, hub=FakeHub([RESYNC]))
+
+        sent = self.call(
+            app, http_scope("/v1/api/applications/user/stream", b"token=abc"), 3
+        )
+
+        bodies = [m["body"].decode() for m in sent[1:]]
+        self.assertTrue(all(body.startswith("data: ") for body in bodies))
+        self.assertEqual(spec.refresh.call_count, 2)
+
+    @patch("app.asgi.ApplicationStreamService.user_stream_spec")
+    def test_stream_closes_when_token_expires(self, mock_spec):
+        spec = self.user_spec()._replace(decoded={"profile_id": 5, "exp": 1})
+        mock_spec.return_value = spec
+        hub = FakeHub([])
+        app = StreamApp(self.flask_app, hub=hub)
+
+        sent = self.call(
+            app, http_scope("/v1/api/applications/user/stream", b"token=abc")
+        )
+
+        self.assertIn(b"Token expired", sent[-2]["body"])
+        self.assertFalse(sent[-1].get("more_body", False))
+        self.assertTrue(hub.closed)
+
+    def test_user_stream_requires_token(self):
+        app = StreamApp(self.flask_app, hub=FakeHub([]))
+
+        sent = self.call(app, http_scope("/v1/api/applications/user/stream"))
+
+        self.assertEqual(sent[0]["status"], 401)
+
+    @patch("app.asgi.ApplicationStreamService.admin_stream_spec")
+    def test_admin_stream_rejects_bad_token_before_streaming(self, mock_spec):
+        mock_spec.side_effect = Exception("Invalid token")
+        app = StreamApp(self.flask_app, hub=FakeHub([]))
+
+        sent = self.call(
+            app,
+            http_scope("/v1/api/applications/admin/stream", b"token=x&job_id=3"),
+        )
+
+        self.assertEqual(sent[0]["status"], 401)
+        self.assertEqual(json.loads(sent[1]["body"]), {"error": "Invalid token"})
+        mock_spec.assert_called_once_with("x", 3)
+
+    def test_admin_stream_requires_job_id(self):
+        app = StreamApp(self.flask_app, hub=FakeHub([]))
+
+        sent = self.call(
+            app, http_scope("/v1/api/applications/admin/stream", b"token=x")
+        )
+
+        self.assertEqual(sent[0]["status"], 400)
+
+    def test_other_paths_go_to_fallback(self):
+        fallback = AsyncMock()
+        app = StreamApp(self.flask_app, fallback=fallback, hub=FakeHub([]))
+
+        self.call(app, http_scope("/v1/api/public/jobs"))
+
+        fallback.assert_awaited_once()
+
+    def test_lifespan_shutdown_stops_hub(self):
+        hub = FakeHub([])
+        hub.stop = AsyncMock()
+        app = StreamApp(self.flask_app, hub=hub)
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(app({"type": "lifespan"}, receive, send))
+
+        self.assertEqual(
+            sent, ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        )
+        hub.stop.assert_awaited_once()
+
+
+class TestAsyncEventHub(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+
+    def test_listener_fans_out_and_overflow_resyncs(self):
+        pubsub = MagicMock()
+        pubsub.psubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        messages = [
+            {"type": "pmessage", "channel": "applications:job:3", "data": '{"n": 1}'},
+            {"type": "pmessage", "channel": "applications:job:3", "data": '{"n": 2}'},
+        ]
+
+        async def listen():
+            for message in messages:
+                yield message
+            await asyncio.Event().wait()
+
+        pubsub.listen = listen
+        client = MagicMock(aclose=AsyncMock())
+        client.pubsub.return_value = pubsub
+
+        async def scenario():
+            hub = AsyncEventHub(lambda: client)
+            small = hub.subscribe("applications:job:3", maxsize=1)
+            large = hub.subscribe("applications:job:3", maxsize=10)
+            await asyncio.sleep(0.01)
+            results = (
+                await small.get(0),
+                await small.get(0),
+                await large.get(0),
+                await large.get(0),
+            )
+            small.close()
+            await hub.stop()
+            return hub, results
+
+        hub, results = asyncio.run(scenario())
+
+        self.assertEqual(results, (RESYNC, None, {"n": 1}, {"n": 2}))
+        self.assertEqual(hub.stats(), {"streams": 1, "channels": 1})
+        pubsub.psubscribe.assert_awaited_once_with("applications:*")
+        self.assertEqual(Metrics.get("event_hub.overflows"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
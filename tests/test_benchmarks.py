@@ -0,0 +1,102 @@
+import unittest
+from collections import Counter
+
+from flask import Flask
+
+from app.repositories.applications_repository import ApplicationRepository
+from app.repositories.jobs_repository import JobRepository
+from app.repositories.user_repository import UserRepository
+from benchmarks import dataset, fakes
+from benchmarks.stats import compare, percentile, summarize
+
+
+def result(p99_ms=10.0, throughput_rps=100.0, errors=0):
+    return {
+        "scenarios": {
+            "public_jobs": {
+                "p99_ms": p99_ms,
+                "throughput_rps": throughput_rps,
+                "errors": errors,
+            }
+        }
+    }
+
+
+class TestBenchmarkStats(unittest.TestCase):
+
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    def test_summarize_reports_milliseconds(self):
+        summary = summarize([0.01, 0.02, 0.03, 0.04], Counter({200: 3, 500: 1}), 1, 2)
+
+        self.assertEqual(summary["throughput_rps"], 2.0)
+        self.assertEqual(summary["p50_ms"], 20.0)
+        self.assertEqual(summary["max_ms"], 40.0)
+        self.assertEqual(summary["status_codes"], {"200": 3, "500": 1})
+
+    def test_compare_flags_regressions_past_tolerance(self):
+        self.assertEqual(compare(result(11.0, 90.0), result(), 0.2), [])
+        self.assertEqual(len(compare(result(13.0, 70.0, 1), result(), 0.2)), 3)
+
+
+class TestBenchmarkDataset(unittest.TestCase):
+
+    def test_same_seed_same_rows(self):
+        first = dataset.generate(seed=7, users=20, jobs=30, applications=40, rounds=4)
+        second = dataset.generate(seed=7, users=20, jobs=30, applications=40, rounds=4)
+
+        self.assertEqual(first.jobs, second.jobs)
+        self.assertEqual(first.applications, second.applications)
+
+    def test_applications_are_unique_per_user_and_job(self):
+        data = dataset.generate(users=5, jobs=4, applications=100, rounds=4)
+
+        pairs = {(row["user_id"], row["job_id"]) for row in data.applications}
+        self.assertEqual(len(pairs), 20)
+        self.assertEqual(len(data.applications), 20)
+
+
+class TestBenchmarkFakes(unittest.TestCase):
+    """The fake must keep answering the SQL the real repositories send."""
+
+    def setUp(self):
+        self.data = dataset.generate(users=3, jobs=5, applications=4, rounds=4)
+        self.app = Flask(__name__)
+        self.app.config.update(ENV="dev", DB_POOL_MIN_SIZE=0)
+        installed = fakes.install(self.data)
+        installed.__enter__()
+        self.addCleanup(installed.__exit__, None, None, None)
+
+    def test_repositories_read_and_write_through_the_fake(self):
+        user = self.data.users[0]
+        with self.app.app_context():
+            self.assertEqual(len(JobRepository.get_jobs(2, 0)), 2)
+            self.assertEqual(JobRepository.get_job(3)["job_id"], 3)
+            self.assertEqual(
+                UserRepository.find_user_by_mail(user["email"])["user_id"],
+                user["user_id"],
+            )
+            taken = {(a["user_id"], a["job_id"]) for a in self.data.applications}
+            job_id = next(
+                job["job_id"]
+                for job in self.data.jobs
+                if (user["user_id"], job["job_id"]) not in taken
+            )
+            application_id = ApplicationRepository.create_application(
+                user["user_id"],
+                {"job_id": job_id, "status": 1, "cover_letter": "", "resume_url": ""},
+            )
+            applications = ApplicationRepository.get_user_applications(
+                user["user_id"], 20
+            )
+
+        self.assertIn(application_id, [a["application_id"] for a in applications])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+import fakeredis
+
+from app.extensions.celery import celery
+from app.extensions.celery_results import purge_results
+from app.utils.mails import Mails
+
+
+class TestCeleryResults(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+        # Celery writes results with SETEX and a one-day expiry by default
+        for i in range(4):
+            self.client.setex(f"celery-task-meta-old-{i}", 86400, "{}")
+        self.client.set("celery-task-meta-persisted", "{}")
+        self.client.set("jobs:v1:list", "[]")
+
+    def test_mail_tasks_store_no_result(self):
+        self.assertTrue(celery.conf.task_ignore_result)
+        self.assertTrue(Mails.send_mail_task.ignore_result)
+        self.assertTrue(Mails.send_batch_task.ignore_result)
+        self.assertGreater(celery.conf.result_expires, 0)
+
+    def test_purge_removes_results_with_expiry(self):
+        counts = purge_results(self.client, batch_size=2)
+
+        self.assertEqual(counts, {"scanned": 5, "deleted": 5})
+        self.assertEqual(self.client.keys(), [b"jobs:v1:list"])
+
+    def test_keep_expiring_removes_only_keys_without_expiry(self):
+        counts = purge_results(self.client, keep_expiring=True, batch_size=2)
+
+        self.assertEqual(counts, {"scanned": 5, "deleted": 1})
+        self.assertEqual(len(self.client.keys("celery-task-meta-old-*")), 4)
+        self.assertFalse(self.client.exists("celery-task-meta-persisted"))
+
+    def test_dry_run_deletes_nothing(self):
+        counts = purge_results(self.client, dry_run=True)
+
+        self.assertEqual(counts["deleted"], 5)
+        self.assertEqual(len(self.client.keys()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
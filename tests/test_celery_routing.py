@@ -0,0 +1,41 @@
+import unittest
+
+from app.extensions.celery import (
+    PRIORITY_AUTH,
+    PRIORITY_NOTIFICATIONS,
+    PRIORITY_RESET,
+    QUEUE_DEFAULT,
+    QUEUE_NOTIFICATIONS,
+    celery,
+)
+
+
+class TestCeleryRouting(unittest.TestCase):
+    def route(self, name):
+        return celery.amqp.router.route({}, name)["queue"].name
+
+    def test_mail_tasks_default_to_notifications_queue(self):
+        self.assertEqual(
+            self.route("app.utils.mails.send_mail_task"), QUEUE_NOTIFICATIONS
+        )
+        self.assertEqual(
+            self.route("app.services.notification_service.flush_digests_task"),
+            QUEUE_NOTIFICATIONS,
+        )
+
+    def test_other_tasks_use_default_queue(self):
+        self.assertEqual(self.route("app.tasks.something"), QUEUE_DEFAULT)
+
+    def test_queues_support_priorities(self):
+        for queue in celery.conf.task_queues:
+            self.assertEqual(queue.queue_arguments["x-max-priority"], 10)
+        self.assertGreater(PRIORITY_AUTH, PRIORITY_RESET)
+        self.assertGreater(PRIORITY_RESET, PRIORITY_NOTIFICATIONS)
+
+    def test_messages_are_acked_after_running(self):
+        self.assertTrue(celery.conf.task_acks_late)
+        self.assertEqual(celery.conf.worker_prefetch_multiplier, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
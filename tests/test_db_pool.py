@@ -0,0 +1,199 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pymysql
+from flask import Flask
+from pymysql.constants import SERVER_STATUS
+
+from app.db.db import DB
+from app.db.pool import ConnectionPool
+from app.utils.exceptions import DatabasePoolExhaustedError, GenericDatabaseError
+from app.utils.metrics import Metrics
+
+
+def make_conn():
+    conn = MagicMock()
+    conn.open = True
+    conn.server_status = 0
+    return conn
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        self.connect = MagicMock(side_effect=lambda: make_conn())
+
+    def test_acquire_reuses_released_connection(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=2)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.connect.call_count, 1)
+        self.assertEqual(Metrics.get("db_pool.checkouts"), 2)
+        self.assertEqual(Metrics.get("db_pool.creates"), 1)
+
+    def test_acquire_times_out_when_pool_is_full(self):
+        pool = ConnectionPool(
+            self.connect, min_size=0, max_size=1, checkout_timeout=0.01
+        )
+        pool.acquire()
+
+        with self.assertRaises(DatabasePoolExhaustedError):
+            pool.acquire()
+
+        self.assertEqual(Metrics.get("db_pool.waits"), 1)
+        self.assertEqual(Metrics.get("db_pool.timeouts"), 1)
+
+    def test_failed_connect_frees_the_slot(self):
+        self.connect.side_effect = [Exception("refused"), make_conn()]
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1)
+
+        with self.assertRaises(Exception):
+            pool.acquire()
+
+        self.assertIsNotNone(pool.acquire())
+        self.assertEqual(pool.stats()["size"], 1)
+
+    def test_release_rolls_back_open_transaction(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1)
+        conn = pool.acquire()
+        conn.server_status = SERVER_STATUS.SERVER_STATUS_IN_TRANS
+
+        pool.release(conn)
+
+        conn.rollback.assert_called_once()
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_release_skips_rollback_without_transaction(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1)
+        conn = pool.acquire()
+
+        pool.release(conn)
+
+        conn.rollback.assert_not_called()
+
+    def test_release_discards_closed_connection(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1)
+        conn = pool.acquire()
+        conn.open = False
+
+        pool.release(conn)
+
+        self.assertEqual(pool.stats()["size"], 0)
+        self.assertEqual(Metrics.get("db_pool.discards"), 1)
+
+    def test_stale_connection_is_health_checked_and_replaced(self):
+        pool = ConnectionPool(
+            self.connect, min_size=0, max_size=1, health_check_interval=0
+        )
+        dead = pool.acquire()
+        dead.ping.side_effect = Exception("gone away")
+        pool.release(dead)
+
+        conn = pool.acquire()
+
+        self.assertIsNot(conn, dead)
+        dead.ping.assert_called_once_with(reconnect=False)
+        self.assertEqual(Metrics.get("db_pool.health_check_failures"), 1)
+
+    def test_recent_connection_is_not_pinged(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        pool.acquire()
+
+        conn.ping.assert_not_called()
+
+    def test_idle_connections_above_min_size_are_closed(self):
+        pool = ConnectionPool(self.connect, min_size=1, max_size=3, idle_timeout=-1)
+        a, b = pool.acquire(), pool.acquire()
+        pool.release(a)
+        pool.release(b)
+
+        pool.acquire()
+
+        self.assertEqual(pool.stats()["size"], 1)
+        a.close.assert_called_once()
+
+    def test_warm_opens_min_size_connections(self):
+        pool = ConnectionPool(self.connect, min_size=2, max_size=5)
+
+        pool.warm()
+
+        self.assertEqual(pool.stats()["idle"], 2)
+        self.assertEqual(self.connect.call_count, 2)
+
+    def test_release_ignores_connections_after_fork(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1)
+        conn = pool.acquire()
+        pool.pid = -1
+
+        pool.release(conn)
+
+        conn.close.assert_not_called()
+        self.assertEqual(pool.stats()["idle"], 0)
+
+
+class TestDB(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(
+            DB_HOST="localhost",
+            DB_PORT=3306,
+            DB_USER="root",
+            DB_PASSWORD="root",
+            DB_NAME="test",
+            DB_POOL_MIN_SIZE=0,
+            DB_POOL_MAX_SIZE=2,
+        )
+        self.app.teardown_appcontext(DB.close_db)
+        DB._pool = None
+
+    def tearDown(self):
+        DB._pool = None
+
+    @patch("app.db.db.pymysql.connect")
+    def test_get_db_reuses_pooled_connection_across_requests(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+
+        with self.app.app_context():
+            first = DB.get_db()
+            self.assertIs(DB.get_db(), first)
+        with self.app.app_context():
+            second = DB.get_db()
+
+        self.assertIs(first, second)
+        mock_connect.assert_called_once()
+
+    @patch("app.db.db.pymysql.connect")
+    def test_get_pool_is_rebuilt_after_fork(self, mock_connect):
+        with self.app.app_context():
+            pool = DB.get_pool()
+            pool.pid = -1
+            self.assertIsNot(DB.get_pool(), pool)
+
+    @patch("app.db.db.pymysql.connect")
+    def test_get_db_wraps_mysql_errors(self, mock_connect):
+        mock_connect.side_effect = pymysql.MySQLError("refused")
+
+        with self.app.app_context():
+            with self.assertRaises(GenericDatabaseError):
+                DB.get_db()
+
+    @patch("app.db.db.pymysql.connect")
+    def test_pool_stats_registered_as_gauge(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+
+        with self.app.app_context():
+            DB.get_db()
+            gauges = Metrics.snapshot()["gauges"]
+
+        self.assertEqual(gauges["db_pool"]["in_use"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
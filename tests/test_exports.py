@@ -0,0 +1,56 @@
+import csv
+import io
+import json
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from app.utils.exports import to_csv, to_ndjson
+
+
+class TestExports(unittest.TestCase):
+    def rows(self, count):
+        for i in range(count):
+            yield {
+                "job_id": i,
+                "title": f"Job {i}, remote",
+                "deadline": date(2025, 1, 1),
+            }
+
+    @patch("app.utils.exports.EXPORT_CHUNK_ROWS", 2)
+    def test_ndjson_writes_a_line_per_row_in_chunks(self):
+        chunks = list(to_ndjson(self.rows(3)))
+
+        self.assertEqual(len(chunks), 2)
+        lines = "".join(chunks).splitlines()
+        self.assertEqual(json.loads(lines[2])["deadline"], "2025-01-01")
+
+    @patch("app.utils.exports.EXPORT_CHUNK_ROWS", 2)
+    def test_csv_writes_header_once_and_quotes_values(self):
+        chunks = list(to_csv(self.rows(5)))
+
+        self.assertEqual(len(chunks), 3)
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[4]["title"], "Job 4, remote")
+
+    def test_empty_export_has_no_body(self):
+        self.assertEqual(list(to_csv(iter([]))), [])
+        self.assertEqual(list(to_ndjson(iter([]))), [])
+
+    def test_rows_are_pulled_as_chunks_are_sent(self):
+        pulled = []
+
+        def rows():
+            for i in range(1200):
+                pulled.append(i)
+                yield {"application_id": i}
+
+        first = next(to_ndjson(rows()))
+
+        self.assertEqual(len(first.splitlines()), 500)
+        self.assertEqual(len(pulled), 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.exceptions import PasswordHasherBusyError
+from app.utils.hashing import PasswordHasher
+from app.utils.metrics import Metrics
+
+
+class TestPasswordHasher(unittest.TestCase):
+
+    def setUp(self):
+        Metrics.reset()
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+
+    def blocking(self):
+        self.release.wait(5)
+        return True
+
+    def threaded_hasher(self, **kwargs) -> PasswordHasher:
+        # Same bookkeeping as the process pool without spawning interpreters
+        hasher = PasswordHasher(workers=1, **kwargs)
+        hasher._executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(hasher._executor.shutdown, wait=False)
+        return hasher
+
+    def test_inline_hash_uses_configured_rounds(self):
+        hasher = PasswordHasher(rounds=4)
+
+        hashed = hasher.hash("secret")
+
+        self.assertTrue(hashed.startswith("$2b$04$"))
+        self.assertTrue(hasher.check("secret", hashed))
+        self.assertFalse(hasher.check("wrong", hashed))
+        self.assertEqual(Metrics.snapshot()["timers"]["bcrypt.check"]["count"], 2)
+
+    def test_process_pool_round_trip(self):
+        hasher = PasswordHasher(workers=1, rounds=4)
+        self.addCleanup(hasher.shutdown)
+
+        hashed = hasher.hash("secret")
+
+        self.assertTrue(hasher.check("secret", hashed))
+        self.assertEqual(hasher.stats()["in_flight"], 0)
+        self.assertEqual(Metrics.snapshot()["timers"]["bcrypt.hash"]["count"], 1)
+
+    def test_rejects_when_saturated(self):
+        hasher = self.threaded_hasher(queue_size=1)
+        waiters = [
+            threading.Thread(target=hasher._run, args=("check", self.blocking))
+            for _ in range(2)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        while hasher.stats()["in_flight"] < 2:
+            pass
+
+        with self.assertRaises(PasswordHasherBusyError):
+            hasher._run("check", self.blocking)
+
+        self.release.set()
+        for waiter in waiters:
+            waiter.join()
+        self.assertEqual(Metrics.get("bcrypt.rejected"), 1)
+        self.assertEqual(hasher.stats()["in_flight"], 0)
+
+    def test_timeout_keeps_slot_until_worker_finishes(self):
+        hasher = self.threaded_hasher(timeout=0.05)
+
+        with self.assertRaises(PasswordHasherBusyError):
+            hasher._run("check", self.blocking)
+
+        self.assertEqual(Metrics.get("bcrypt.timeouts"), 1)
+        self.assertEqual(hasher.stats()["in_flight"], 1)
+        with self.assertRaises(PasswordHasherBusyError):
+            hasher._run("check", self.blocking)
+        self.assertEqual(Metrics.get("bcrypt.rejected"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
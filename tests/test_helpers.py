@@ -153,6 +153,21 @@ class TestHelpers(unittest.TestCase):
         with self.assertRaises(ValueError):
             Helpers.compare_token_time({"time": "not-a-date"})
 
+    # ---------- cursors ----------
+    def test_cursor_round_trip(self):
+        cursor = Helpers.encode_cursor({"job_id": 42})
+        self.assertNotIn("=", cursor)
+        self.assertEqual(Helpers.decode_cursor(cursor), {"job_id": 42})
+
+    def test_decode_cursor_rejects_garbage(self):
+        with self.assertRaises(ValueError):
+            Helpers.decode_cursor("not a cursor!")
+
+    def test_decode_cursor_rejects_non_object(self):
+        cursor = Helpers.encode_cursor([1, 2])  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            Helpers.decode_cursor(cursor)
+
 
 if __name__ == "__main__":
     unittest.main()
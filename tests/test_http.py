@@ -0,0 +1,107 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from flask import Flask
+
+from app.utils.http import HTTPClient
+from app.utils.mails import SENDGRID_SEND_URL, Mails
+from app.utils.metrics import Metrics
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answers 503 to the first ``failures`` requests, then 200."""
+
+    protocol_version = "HTTP/1.1"
+    failures = 0
+    requests = 0
+    ports: set = set()
+
+    def do_POST(self):
+        cls = type(self)
+        cls.requests += 1
+        cls.ports.add(self.client_address[1])
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = 503 if cls.requests <= cls.failures else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHTTPClient(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        HTTPClient.reset()
+        self.addCleanup(HTTPClient.reset)
+        FlakyHandler.failures = 0
+        FlakyHandler.requests = 0
+        FlakyHandler.ports = set()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/messages"
+
+        self.app = Flask(__name__)
+        self.app.config.update(MAIL_HTTP_RETRIES=2, MAIL_HTTP_BACKOFF=0.01)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.addCleanup(self.app_context.pop)
+
+    def test_connections_are_kept_alive(self):
+        for _ in range(3):
+            HTTPClient.post("mailgun", self.url, data={"to": "a@example.com"})
+
+        self.assertEqual(FlakyHandler.requests, 3)
+        self.assertEqual(len(FlakyHandler.ports), 1)
+        self.assertEqual(Metrics.get("http.mailgun.status_200"), 3)
+        self.assertEqual(Metrics.snapshot()["timers"]["http.mailgun"]["count"], 3)
+
+    def test_server_errors_are_retried(self):
+        FlakyHandler.failures = 2
+
+        response = HTTPClient.post("mailgun", self.url, data={})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(FlakyHandler.requests, 3)
+        self.assertEqual(Metrics.get("http.mailgun.retries"), 2)
+
+    def test_exhausted_retries_return_last_response(self):
+        FlakyHandler.failures = 10
+
+        response = HTTPClient.post("mailgun", self.url, data={})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(Metrics.get("http.mailgun.errors"), 1)
+
+    def test_session_is_rebuilt_after_fork(self):
+        session = HTTPClient.session()
+        self.assertIs(HTTPClient.session(), session)
+
+        HTTPClient._pid = -1
+        self.assertIsNot(HTTPClient.session(), session)
+
+    def test_sendgrid_goes_through_shared_session(self):
+        self.app.config["SENDGRID_API_KEY"] = "sg-key"
+
+        with patch("app.utils.mails.HTTPClient.post") as post:
+            post.return_value.status_code = 202
+            Mails.send_by_sendgrid("from@test.com", "to@test.com", "Hi", "Body")
+
+        provider, url = post.call_args.args
+        self.assertEqual((provider, url), ("sendgrid", SENDGRID_SEND_URL))
+        self.assertEqual(
+            post.call_args.kwargs["headers"]["Authorization"], "Bearer sg-key"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,8 +6,11 @@ from flask_restful import Api
 
 # Import your controllers
 from app.controllers.job_controllers import (
+    AdminJobsExportController,
+    ImportJobsController,
     JobObjectController,
     JobsListController,
+    JobsSearchController,
     ModifyJobObjectController,
     PostJobController,
 )
@@ -20,12 +23,20 @@ class JobControllerTestCase(unittest.TestCase):
         api = Api(self.app)
 
         api.add_resource(PostJobController, "/jobs")
+        api.add_resource(ImportJobsController, "/jobs/import")
+        api.add_resource(AdminJobsExportController, "/jobs/export")
         api.add_resource(JobsListController, "/jobs/list")
+        api.add_resource(JobsSearchController, "/jobs/search")
         api.add_resource(JobObjectController, "/jobs/<int:job_id>")
         api.add_resource(ModifyJobObjectController, "/jobs/<int:job_id>/update")
 
         self.client = self.app.test_client()
 
+        decode = patch("app.utils.auth.Security.decode_jwt_token")
+        self.mock_decode = decode.start()
+        self.mock_decode.return_value = {"profile_id": 1, "email": "user@example.com"}
+        self.addCleanup(decode.stop)
+
         self.payload = {
             "title": "QA Engineer",
             "details": {
@@ -69,6 +80,21 @@ class JobControllerTestCase(unittest.TestCase):
         self.assertEqual(response.status_code, 201)
         data = response.get_json()
         self.assertEqual(data["msg"], "job created")
+        self.assertEqual(mock_add_job.call_args.args[0]["admin_id"], 1)
+        self.mock_decode.assert_called_once_with("testtoken")
+
+    def test_post_job_rejects_bad_token(self):
+        self.mock_decode.side_effect = Exception("Token expired")
+
+        response = self.client.post(
+            "/jobs",
+            data=json.dumps(self.payload),
+            headers={"Authorization": "Bearer expired"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.get_json()["error"], "Token expired")
 
     def test_post_job_missing_auth(self):
         payload = {"title": "QA Engineer", "details": {"description": "Testing"}}
@@ -89,6 +115,39 @@ class JobControllerTestCase(unittest.TestCase):
         self.assertIn("result", data)
         self.assertEqual(data["result"][0]["title"], "QA Engineer")
 
+    @patch("app.controllers.job_controllers.JobService.fetch_jobs")
+    def test_get_jobs_list_passes_cursor(self, mock_fetch_jobs):
+        mock_fetch_jobs.return_value = {"jobs": [], "next_cursor": None}
+
+        response = self.client.get("/jobs/list?limit=10&cursor=eyJqb2JfaWQiOjQyfQ")
+
+        self.assertEqual(response.status_code, 200)
+        mock_fetch_jobs.assert_called_once_with(1, 10, "eyJqb2JfaWQiOjQyfQ")
+
+    @patch("app.controllers.job_controllers.JobService.search_jobs")
+    def test_search_jobs_success(self, mock_search):
+        mock_search.return_value = {"page": 1, "limit": 10, "count": 0, "jobs": []}
+
+        response = self.client.get(
+            "/jobs/search?q=python&location=Nairobi&employment_type=Full%20time"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        mock_search.assert_called_once_with(
+            {
+                "q": "python",
+                "location": "Nairobi",
+                "employment_type": "Full time",
+                "status": "Open",
+            },
+            1,
+            10,
+        )
+
+    def test_search_jobs_rejects_unknown_employment_type(self):
+        response = self.client.get("/jobs/search?employment_type=Freelance")
+        self.assertEqual(response.status_code, 400)
+
     @patch("app.controllers.job_controllers.JobService.fetch_job")
     def test_get_job_object_not_found(self, mock_fetch_job):
         mock_fetch_job.return_value = None
@@ -111,6 +170,7 @@ class JobControllerTestCase(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         data = response.get_json()
         self.assertEqual(data["title"], "Updated Job")
+        self.assertEqual(mock_update_job.call_args.args[:2], (1, 1))
 
     @patch("app.controllers.job_controllers.JobService.update_job")
     def test_put_job_update_not_found(self, mock_update_job):
@@ -126,3 +186,68 @@ class JobControllerTestCase(unittest.TestCase):
 
         self.assertEqual(response.status_code, 401)
         self.assertEqual(response.get_json()["msg"], "error job not found")
+
+    @patch("app.controllers.job_controllers.JobService.import_jobs")
+    def test_import_jobs_reads_each_format(self, mock_import):
+        mock_import.side_effect = lambda admin_id, items, **kwargs: {
+            "rows": [item if isinstance(item, dict) else str(item) for item in items]
+        }
+        headers = {"Authorization": "Bearer testtoken"}
+        details = self.payload["details"]
+        csv_body = (
+            "title," + ",".join(details) + "\n"
+            "QA Engineer," + ",".join(f'"{v}"' for v in details.values()) + "\n"
+        )
+        bodies = {
+            "application/json": json.dumps([self.payload]),
+            "application/x-ndjson": json.dumps(self.payload) + "\n\n{oops\n",
+            "text/csv": csv_body,
+        }
+
+        rows = {}
+        for content_type, body in bodies.items():
+            response = self.client.post(
+                "/jobs/import", data=body, headers=headers, content_type=content_type
+            )
+            self.assertEqual(response.status_code, 200)
+            rows[content_type] = response.get_json()["rows"]
+
+        self.assertEqual(rows["application/json"], [self.payload])
+        self.assertEqual(rows["text/csv"], [self.payload])
+        self.assertEqual(
+            rows["application/x-ndjson"], [self.payload, "Line is not valid JSON"]
+        )
+        self.assertEqual(mock_import.call_args.args[0], 1)
+
+    def test_import_jobs_rejects_unsupported_content(self):
+        headers = {"Authorization": "Bearer testtoken"}
+
+        response = self.client.post(
+            "/jobs/import", data="jobs", headers=headers, content_type="text/plain"
+        )
+        self.assertEqual(response.status_code, 415)
+
+        response = self.client.post(
+            "/jobs/import",
+            data=json.dumps(self.payload),
+            headers=headers,
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+    @patch("app.controllers.job_controllers.JobService.export_admin_jobs")
+    def test_export_jobs_streams_ndjson(self, mock_export):
+        mock_export.return_value = iter([{"job_id": 1}, {"job_id": 2}])
+        headers = {"Authorization": "Bearer testtoken"}
+
+        response = self.client.get("/jobs/export", headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines], [{"job_id": 1}, {"job_id": 2}]
+        )
+
+        response = self.client.get("/jobs/export?format=xlsx", headers=headers)
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,49 @@
+import io
+import unittest
+
+from app.utils.exceptions import ImportRowError
+from app.utils.job_import import read_csv, read_json, read_ndjson
+
+
+class TestJobImportReaders(unittest.TestCase):
+    def test_ndjson_reports_bad_lines_and_reads_on(self):
+        stream = io.BytesIO(
+            b'{"title": "QA"}\n'
+            b"\n"
+            b"not json\n"
+            b'{"title": "Caf\xe9"}\n'
+            b'{"title": "SRE"}\n'
+        )
+
+        rows = list(read_ndjson(stream))
+
+        self.assertEqual(rows[0], {"title": "QA"})
+        self.assertEqual(str(rows[1]), "Line is not valid JSON")
+        self.assertIsInstance(rows[2], ImportRowError)
+        self.assertEqual(str(rows[2]), "Line is not valid UTF-8")
+        self.assertEqual(rows[3], {"title": "SRE"})
+
+    def test_csv_reports_a_row_that_is_not_utf8_and_reads_on(self):
+        stream = io.BytesIO(
+            b"title,location\r\n"
+            b'"QA, remote",Nairobi\r\n'
+            b"Caf\xe9 manager,Mombasa\r\n"
+            b"SRE,\r\n"
+        )
+
+        rows = list(read_csv(stream))
+
+        self.assertEqual(
+            rows[0], {"title": "QA, remote", "details": {"location": "Nairobi"}}
+        )
+        self.assertIsInstance(rows[1], ImportRowError)
+        self.assertEqual(str(rows[1]), "Row is not valid UTF-8")
+        self.assertEqual(rows[2], {"title": "SRE", "details": {}})
+
+    def test_json_body_that_is_not_utf8_is_rejected_up_front(self):
+        with self.assertRaises(ValueError):
+            next(read_json(io.BytesIO(b'[{"title": "Caf\xe9"}]')))
+
+
+if __name__ == "__main__":
+    unittest.main()
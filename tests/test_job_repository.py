@@ -2,11 +2,16 @@ import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, date
 
+import pymysql
+from pymysql.cursors import SSDictCursor
+
 from app.repositories.jobs_repository import (
     JobRepository,
     serialize_job,
     convert_employment_type,
     convert_job_status,
+    escape_like,
+    to_boolean_query,
 )
 from app.utils.exceptions import GenericDatabaseError
 
@@ -40,6 +45,16 @@ class TestHelpers(unittest.TestCase):
         with self.assertRaises(ValueError):
             convert_job_status("archived")
 
+    def test_to_boolean_query_requires_and_prefixes_words(self):
+        self.assertEqual(to_boolean_query("python  dev"), "+python* +dev*")
+
+    def test_to_boolean_query_strips_operators(self):
+        self.assertEqual(to_boolean_query('-"python" +(flask)*'), "+python* +flask*")
+        self.assertEqual(to_boolean_query("+-*"), "")
+
+    def test_escape_like(self):
+        self.assertEqual(escape_like("50%_off"), "50\\%\\_off")
+
 
 class TestJobRepository(unittest.TestCase):
     @patch("app.repositories.jobs_repository.DB.get_db")
@@ -129,6 +144,141 @@ class TestJobRepository(unittest.TestCase):
         self.assertTrue(result)
         mock_cursor.execute.assert_called()
 
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_get_jobs_after_seeks_by_job_id(self, mock_get_db):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [{"job_id": 43, "title": "QA Engineer"}]
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        jobs = JobRepository.get_jobs_after(42, 11)
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("job_id > %s", query)
+        self.assertNotIn("OFFSET", query)
+        self.assertEqual(params, (42, 11))
+        self.assertEqual(jobs[0]["job_id"], 43)
+
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_get_jobs_by_admin_after_scopes_admin(self, mock_get_db):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        JobRepository.get_jobs_by_admin_after(7, 42, 11)
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("admin_id = %s AND job_id > %s", query)
+        self.assertEqual(params, (7, 42, 11))
+
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_search_jobs_ranks_by_relevance(self, mock_get_db):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {"job_id": 3, "title": "Python Developer", "relevance": 1.234567}
+        ]
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        filters = {
+            "q": "python",
+            "status": "Open",
+            "employment_type": "Full time",
+            "location": "Nai",
+        }
+        jobs = JobRepository.search_jobs(filters, 10, 0)
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("IN BOOLEAN MODE", query)
+        self.assertIn("ORDER BY relevance DESC", query)
+        self.assertEqual(
+            params, ("+python*", "5", "1", "Nai%", "+python*", 10, 0)
+        )
+        self.assertEqual(jobs[0]["relevance"], 1.2346)
+
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_search_jobs_without_keyword_filters_only(self, mock_get_db):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        JobRepository.search_jobs({"status": "Closed"}, 10, 20)
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertNotIn("MATCH", query)
+        self.assertIn("ORDER BY job_id DESC", query)
+        self.assertEqual(params, ("6", 10, 20))
+
+    def test_search_jobs_rejects_unknown_employment_type(self):
+        with self.assertRaises(ValueError):
+            JobRepository.search_jobs({"employment_type": "Freelance"}, 10, 0)
+
+    @patch("app.repositories.jobs_repository.JobCache")
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_get_jobs_served_from_cache(self, mock_get_db, mock_cache):
+        mock_cache.version.return_value = 4
+        mock_cache.get_jobs.return_value = [{"job_id": 1, "title": "QA Engineer"}]
+
+        jobs = JobRepository.get_jobs(limit=10, offset=0)
+
+        self.assertEqual(jobs[0]["title"], "QA Engineer")
+        mock_cache.get_jobs.assert_called_once_with(4, 10, 0)
+        mock_get_db.assert_not_called()
+
+    @patch("app.repositories.jobs_repository.JobCache")
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_get_job_fills_cache_on_miss(self, mock_get_db, mock_cache):
+        mock_cache.version.return_value = 4
+        mock_cache.get_job.return_value = None
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = {"job_id": 1, "title": "QA Engineer"}
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        job = JobRepository.get_job(1)
+
+        mock_cache.set_job.assert_called_once_with(4, 1, job)
+
+    @patch("app.repositories.jobs_repository.JobCache")
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_update_job_invalidates_cache(self, mock_get_db, mock_cache):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.rowcount = 1
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        JobRepository.update_job(1, 1, {"title": "Updated Job"})
+
+        mock_cache.invalidate.assert_called_once()
+
+    @patch("app.repositories.jobs_repository.JobCache")
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_update_job_without_match_keeps_cache(self, mock_get_db, mock_cache):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.rowcount = 0
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        JobRepository.update_job(1, 1, {"title": "Updated Job"})
+
+        mock_cache.invalidate.assert_not_called()
+
     @patch("app.repositories.jobs_repository.DB.get_db")
     def test_update_job_no_valid_fields(self, mock_get_db):
         mock_conn = MagicMock()
@@ -139,3 +289,80 @@ class TestJobRepository(unittest.TestCase):
 
         with self.assertRaises(GenericDatabaseError):
             JobRepository.update_job(1, 1, {"invalid_field": "value"})
+
+    @patch("app.repositories.jobs_repository.JobCache")
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_insert_jobs_uses_one_multi_row_insert(self, mock_get_db, mock_cache):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.lastrowid = 40
+        # auto_increment_increment = 2
+        mock_cursor.fetchall.return_value = [{"job_id": 40}, {"job_id": 42}]
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        job = {
+            "admin_id": 1,
+            "title": "QA Engineer",
+            "description": "Testing APIs",
+            "location": "Nairobi",
+            "employment_type": "Full time",
+            "company_name": "Shade Limited",
+            "status": "Open",
+        }
+
+        job_ids = JobRepository.insert_jobs([job, {**job, "title": "SRE"}])
+
+        self.assertEqual(job_ids, [40, 42])
+        snapshot, (query, params), (read_back, read_params) = [
+            c[0] for c in mock_cursor.execute.call_args_list
+        ]
+        self.assertEqual(snapshot[0], "START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        self.assertEqual(query.count("(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)"), 2)
+        self.assertIn("WHERE job_id >= %s", read_back)
+        self.assertEqual(read_params, (40, 2))
+        self.assertEqual(params[1], "QA Engineer")
+        self.assertEqual(params[12], "SRE")
+        self.assertEqual(params[5], "1")
+        mock_conn.commit.assert_called_once()
+        mock_cache.invalidate.assert_called_once()
+
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_insert_jobs_rolls_back_on_error(self, mock_get_db):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.execute.side_effect = pymysql.MySQLError("Data too long")
+        mock_get_db.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        job = {
+            "admin_id": 1,
+            "title": "QA Engineer",
+            "description": "Testing APIs",
+            "location": "Nairobi",
+            "employment_type": "Full time",
+            "company_name": "Shade Limited",
+            "status": "Open",
+        }
+
+        with self.assertRaises(GenericDatabaseError):
+            JobRepository.insert_jobs([job])
+        mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
+
+    @patch("app.repositories.jobs_repository.DB.get_db")
+    def test_stream_jobs_by_admin_reads_unbuffered(self, mock_get_db):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.__iter__.return_value = iter(
+            [{"job_id": 1, "deadline": date(2025, 12, 31)}, {"job_id": 2}]
+        )
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        rows = JobRepository.stream_jobs_by_admin(7)
+        mock_get_db.assert_not_called()
+
+        self.assertEqual(next(rows)["deadline"], "2025-12-31")
+        mock_get_db.return_value.cursor.assert_called_once_with(SSDictCursor)
+        self.assertEqual(mock_cursor.execute.call_args[0][1], (7,))
+        self.assertEqual(len(list(rows)), 1)
@@ -2,48 +2,47 @@ import unittest
 from unittest.mock import patch
 
 from app.services.job_service import JobService
-from app.utils.exceptions import GenericDatabaseError
+from app.utils.exceptions import (
+    GenericDatabaseError,
+    ImportRowError,
+    InvalidLoginAttemptError,
+)
+from app.utils.helpers import Helpers
 
 
 class TestJobService(unittest.TestCase):
 
     @patch("app.services.job_service.JobRepository.insert_job")
-    @patch("app.services.job_service.Security.decode_jwt_token")
-    def test_add_job_success(self, mock_decode, mock_insert):
-        mock_decode.return_value = {"profile_id": 1, "email": "admin@example.com"}
+    def test_add_job_success(self, mock_insert):
         mock_insert.return_value = 10
 
         data = {
             "title": "QA Engineer",
             "description": "Testing APIs",
-            "token": "validtoken",
+            "admin_id": 1,
         }
 
         result = JobService.add_job(data)
         self.assertEqual(result, 10)
-        self.assertEqual(data["admin_id"], 1)
+        mock_insert.assert_called_once_with(data)
 
-    @patch("app.services.job_service.Security.decode_jwt_token")
-    def test_add_job_invalid_token(self, mock_decode):
-        mock_decode.return_value = {"profile_id": None, "email": "admin@example.com"}
+    def test_add_job_missing_admin(self):
         data = {
             "title": "QA Engineer",
             "description": "Testing APIs",
-            "token": "badtoken",
+            "admin_id": None,
         }
 
         with self.assertRaises(GenericDatabaseError):
             JobService.add_job(data)
 
     @patch("app.services.job_service.JobRepository.insert_job")
-    @patch("app.services.job_service.Security.decode_jwt_token")
-    def test_add_job_insert_failure(self, mock_decode, mock_insert):
-        mock_decode.return_value = {"profile_id": 1, "email": "admin@example.com"}
+    def test_add_job_insert_failure(self, mock_insert):
         mock_insert.return_value = None
         data = {
             "title": "QA Engineer",
             "description": "Testing APIs",
-            "token": "validtoken",
+            "admin_id": 1,
         }
 
         result = JobService.add_job(data)
@@ -59,6 +58,83 @@ class TestJobService(unittest.TestCase):
         self.assertEqual(result["count"], 1)
         self.assertEqual(result["jobs"][0]["title"], "QA Engineer")
 
+    @patch("app.services.job_service.JobRepository.get_jobs")
+    def test_fetch_jobs_full_page_returns_next_cursor(self, mock_get_jobs):
+        mock_get_jobs.return_value = [{"job_id": 1}, {"job_id": 2}]
+
+        result = JobService.fetch_jobs(page=1, limit=2)
+
+        self.assertEqual(Helpers.decode_cursor(result["next_cursor"]), {"job_id": 2})
+
+    @patch("app.services.job_service.JobRepository.get_jobs_after")
+    def test_fetch_jobs_by_cursor_seeks_past_job_id(self, mock_get_jobs_after):
+        mock_get_jobs_after.return_value = [
+            {"job_id": 43},
+            {"job_id": 44},
+            {"job_id": 45},
+        ]
+        cursor = Helpers.encode_cursor({"job_id": 42})
+
+        result = JobService.fetch_jobs(page=1, limit=2, cursor=cursor)
+
+        mock_get_jobs_after.assert_called_once_with(42, 3)
+        self.assertEqual(result["count"], 2)
+        self.assertNotIn("page", result)
+        self.assertEqual(Helpers.decode_cursor(result["next_cursor"]), {"job_id": 44})
+
+    @patch("app.services.job_service.JobRepository.get_jobs_after")
+    def test_fetch_jobs_by_cursor_last_page(self, mock_get_jobs_after):
+        mock_get_jobs_after.return_value = [{"job_id": 43}]
+        cursor = Helpers.encode_cursor({"job_id": 42})
+
+        result = JobService.fetch_jobs(page=1, limit=2, cursor=cursor)
+
+        self.assertIsNone(result["next_cursor"])
+
+    def test_fetch_jobs_invalid_cursor(self):
+        with self.assertRaises(GenericDatabaseError):
+            JobService.fetch_jobs(page=1, limit=2, cursor=Helpers.encode_cursor({}))
+
+    @patch("app.services.job_service.ApplicationCountsRepository.get_counts")
+    @patch("app.services.job_service.JobRepository.get_jobs_by_admin_after")
+    def test_fetch_admin_jobs_by_cursor(self, mock_get_jobs, mock_counts):
+        mock_get_jobs.return_value = [{"job_id": 11}]
+        mock_counts.return_value = {}
+        cursor = Helpers.encode_cursor({"job_id": 10})
+
+        result = JobService.fetch_admin_jobs(7, 1, 5, cursor)
+
+        mock_get_jobs.assert_called_once_with(7, 10, 6)
+        self.assertIsNone(result["next_cursor"])
+        self.assertEqual(result["jobs"][0]["applications"]["total"], 0)
+
+    @patch("app.services.job_service.ApplicationCountsRepository.get_counts")
+    @patch("app.services.job_service.JobRepository.get_jobs_by_admin")
+    def test_fetch_admin_jobs_counts_applications_per_page(
+        self, mock_get_jobs, mock_counts
+    ):
+        mock_get_jobs.return_value = [{"job_id": 4}, {"job_id": 9}]
+        mock_counts.return_value = {4: {1: 3, 2: 1}}
+
+        result = JobService.fetch_admin_jobs(7, 1, 5)
+
+        mock_counts.assert_called_once_with([4, 9])
+        self.assertEqual(
+            result["jobs"][0]["applications"],
+            {"total": 4, "by_status": {"1": 3, "2": 1, "3": 0, "4": 0}},
+        )
+        self.assertEqual(result["jobs"][1]["applications"]["total"], 0)
+
+    @patch("app.services.job_service.JobRepository.search_jobs")
+    def test_search_jobs_pages_by_offset(self, mock_search):
+        mock_search.return_value = [{"job_id": 3, "relevance": 1.2}]
+
+        result = JobService.search_jobs({"q": "python"}, page=3, limit=10)
+
+        mock_search.assert_called_once_with({"q": "python"}, 10, 20)
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["page"], 3)
+
     @patch("app.services.job_service.JobRepository.get_job")
     def test_fetch_job_success(self, mock_get_job):
         mock_get_job.return_value = {"id": 1, "title": "QA Engineer"}
@@ -67,26 +143,78 @@ class TestJobService(unittest.TestCase):
 
     @patch("app.services.job_service.JobRepository.update_job")
     @patch("app.services.job_service.JobRepository.get_job")
-    @patch("app.services.job_service.Security.decode_jwt_token")
-    def test_update_job_success(self, mock_decode, mock_get_job, mock_update_job):
-        mock_decode.return_value = {"profile_id": 1, "email": "admin@example.com"}
+    def test_update_job_success(self, mock_get_job, mock_update_job):
         mock_update_job.return_value = 1
         mock_get_job.return_value = {"id": 1, "title": "Updated Job"}
 
-        result = JobService.update_job(1, "validtoken", {"title": "Updated Job"})
+        result = JobService.update_job(1, 1, {"title": "Updated Job"})
         self.assertEqual(result["title"], "Updated Job")
+        mock_update_job.assert_called_once_with(1, 1, {"title": "Updated Job"})
 
-    @patch("app.services.job_service.Security.decode_jwt_token")
-    def test_update_job_invalid_token(self, mock_decode):
-        mock_decode.return_value = {"profile_id": None, "email": "admin@example.com"}
+    def test_update_job_missing_admin(self):
         with self.assertRaises(GenericDatabaseError):
-            JobService.update_job(1, "badtoken", {"title": "Updated Job"})
+            JobService.update_job(1, None, {"title": "Updated Job"})
 
     @patch("app.services.job_service.JobRepository.update_job")
-    @patch("app.services.job_service.Security.decode_jwt_token")
-    def test_update_job_not_found(self, mock_decode, mock_update_job):
-        mock_decode.return_value = {"profile_id": 1, "email": "admin@example.com"}
+    def test_update_job_not_found(self, mock_update_job):
         mock_update_job.return_value = 0
 
         with self.assertRaises(GenericDatabaseError):
-            JobService.update_job(999, "validtoken", {"title": "Updated Job"})
+            JobService.update_job(999, 1, {"title": "Updated Job"})
+
+    # --- import_jobs ---
+    def job(self, title="QA Engineer", **details):
+        return {
+            "title": title,
+            "details": {
+                "description": "Testing APIs",
+                "location": "Nairobi",
+                "employment_type": "Full time",
+                "status": "Open",
+                "company_name": "Shade Limited",
+                **details,
+            },
+        }
+
+    @patch("app.services.job_service.JobRepository.insert_jobs")
+    def test_import_jobs_inserts_valid_rows_per_chunk(self, mock_insert):
+        mock_insert.side_effect = lambda jobs: list(range(100, 100 + len(jobs)))
+        items = [
+            self.job("A"),
+            self.job("B", location=""),
+            ImportRowError("Line is not valid JSON"),
+            self.job("C"),
+            self.job("D"),
+        ]
+
+        result = JobService.import_jobs(1, iter(items), chunk_size=3)
+
+        self.assertEqual(mock_insert.call_count, 2)
+        first_chunk = mock_insert.call_args_list[0][0][0]
+        self.assertEqual([job["title"] for job in first_chunk], ["A"])
+        self.assertEqual(first_chunk[0]["admin_id"], 1)
+        self.assertEqual((result["created"], result["failed"]), (3, 2))
+        self.assertEqual(
+            [r.get("job_id") for r in result["results"]], [100, None, None, 100, 101]
+        )
+        self.assertIn("location", result["results"][1]["errors"]["details"])
+        self.assertEqual(
+            result["results"][2]["errors"], {"_schema": ["Line is not valid JSON"]}
+        )
+
+    @patch("app.services.job_service.JobRepository.insert_jobs")
+    def test_import_jobs_reports_failed_chunk_and_row_limit(self, mock_insert):
+        mock_insert.side_effect = [GenericDatabaseError("Data too long"), [7]]
+
+        result = JobService.import_jobs(
+            1, iter([self.job("A"), self.job("B"), self.job("C")]), 1, max_rows=2
+        )
+
+        self.assertTrue(result["truncated"])
+        self.assertEqual(result["results"][0]["row"], 1)
+        self.assertIn("errors", result["results"][0])
+        self.assertEqual(result["results"][1], {"row": 2, "job_id": 7})
+
+    def test_import_jobs_requires_admin(self):
+        with self.assertRaises(InvalidLoginAttemptError):
+            JobService.import_jobs(None, iter([]))
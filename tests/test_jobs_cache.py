@@ -0,0 +1,75 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from app.repositories.jobs_cache import VERSION_KEY, JobCache
+
+
+class TestJobCache(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(JOBS_CACHE_LIST_TTL=60, JOBS_CACHE_DETAIL_TTL=300)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        patcher = patch("app.repositories.jobs_cache.Cache.connect_redis")
+        self.mock_connect = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = MagicMock()
+        self.mock_connect.return_value = self.client
+
+    def tearDown(self):
+        self.ctx.pop()
+
+    def test_version_defaults_to_zero(self):
+        self.client.get.return_value = None
+        self.assertEqual(JobCache.version(), 0)
+        self.client.get.assert_called_once_with(VERSION_KEY)
+
+    def test_version_is_none_when_redis_fails(self):
+        self.client.get.side_effect = Exception("connection refused")
+        self.assertIsNone(JobCache.version())
+
+    def test_get_jobs_hit(self):
+        self.client.get.return_value = json.dumps([{"job_id": 1}])
+
+        jobs = JobCache.get_jobs(3, 10, 0)
+
+        self.assertEqual(jobs, [{"job_id": 1}])
+        self.client.get.assert_called_once_with("jobs:s1:v3:list:10:0")
+
+    def test_get_jobs_miss(self):
+        self.client.get.return_value = None
+        self.assertIsNone(JobCache.get_jobs(3, 10, 0))
+
+    def test_get_skips_redis_without_version(self):
+        self.assertIsNone(JobCache.get_job(None, 1))
+        self.client.get.assert_not_called()
+
+    def test_set_jobs_uses_list_ttl(self):
+        JobCache.set_jobs(2, [{"job_id": 1}], 10, 0)
+
+        self.client.setex.assert_called_once_with(
+            "jobs:s1:v2:list:10:0", 60, json.dumps([{"job_id": 1}])
+        )
+
+    def test_set_job_uses_detail_ttl(self):
+        JobCache.set_job(2, 7, {"job_id": 7})
+
+        self.client.setex.assert_called_once_with(
+            "jobs:s1:v2:detail:7", 300, json.dumps({"job_id": 7})
+        )
+
+    def test_set_failure_is_swallowed(self):
+        self.client.setex.side_effect = Exception("read only replica")
+        JobCache.set_job(2, 7, {"job_id": 7})
+
+    def test_invalidate_bumps_version(self):
+        JobCache.invalidate()
+        self.client.incr.assert_called_once_with(VERSION_KEY)
+
+
+if __name__ == "__main__":
+    unittest.main()
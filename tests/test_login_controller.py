@@ -5,7 +5,7 @@ from flask import Flask
 from marshmallow import ValidationError
 
 from app.controllers.user_controllers import LoginUserController
-from app.utils.exceptions import InvalidCredentialsError
+from app.utils.exceptions import InvalidCredentialsError, PasswordHasherBusyError
 
 
 class TestLoginController(unittest.TestCase):
@@ -109,6 +109,19 @@ class TestLoginController(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertIn("credentials_error", response.get_json())
 
+    @patch("app.controllers.user_controllers.UserService.get_user")
+    @patch("app.controllers.user_controllers.LoginUserController.login_schema.load")
+    def test_login_bcrypt_pool_busy(self, mock_load, mock_get_user):
+        "Should return 503 with Retry-After when password checks are saturated"
+        mock_load.return_value = self.payload
+        mock_get_user.side_effect = PasswordHasherBusyError("busy")
+
+        response = self.client.post(self.endpoint, json=self.payload)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+        self.assertEqual(response.get_json()["error"], "busy")
+
     @patch("app.controllers.user_controllers.Security.create_jwt_token")
     @patch("app.controllers.user_controllers.UserService.get_user")
     @patch("app.controllers.user_controllers.LoginUserController.login_schema.load")
@@ -0,0 +1,171 @@
+import tempfile
+import unittest
+from email import message_from_bytes
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+from celery.exceptions import Retry
+from flask import Flask
+
+from app.utils.exceptions import MailDeliveryError, MailRejectedError
+from app.utils.mail_router import OPEN, CircuitBreaker, MailRouter, TokenBucket
+from app.utils.mails import FileTransport, Mails, MailgunTransport
+from app.utils.metrics import Metrics
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status} error", response=response)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_on_failure_rate_and_probes_after_timeout(self):
+        breaker = CircuitBreaker("mailgun", failure_rate=0.5, min_calls=4)
+        for success in (True, False, True, False):
+            self.assertTrue(breaker.allow())
+            breaker.record(success)
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertGreater(breaker.retry_after(), 0)
+
+        breaker.opened_at -= breaker.reset_timeout
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())  # one probe at a time
+        breaker.record(True)
+        self.assertTrue(breaker.allow())
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("mailgun", min_calls=1)
+        breaker.record(False)
+        breaker.opened_at -= breaker.reset_timeout
+
+        self.assertTrue(breaker.allow())
+        breaker.record(False)
+        self.assertEqual(breaker.state, OPEN)
+
+    def test_token_bucket_refuses_past_rate(self):
+        bucket = TokenBucket(2)
+
+        self.assertTrue(bucket.take())
+        self.assertTrue(bucket.take())
+        self.assertFalse(bucket.take())
+
+
+class TestMailRouter(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        MailRouter.reset()
+        self.addCleanup(MailRouter.reset)
+        self.app = Flask(__name__)
+        self.app.config.update(
+            MAIL_PROVIDERS="mailgun,sendgrid",
+            MAIL_CIRCUIT_MIN_CALLS=2,
+            MAIL_CIRCUIT_FAILURE_RATE=0.5,
+        )
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.addCleanup(self.app_context.pop)
+
+        self.mailgun = patch.object(Mails, "send_by_mailgun").start()
+        self.sendgrid = patch.object(Mails, "send_by_sendgrid").start()
+        self.addCleanup(patch.stopall)
+
+    def send(self):
+        return MailRouter.send("from@test.com", "to@test.com", "Hi", "Body")
+
+    def test_primary_provider_is_used(self):
+        self.assertEqual(self.send(), "mailgun")
+        self.sendgrid.assert_not_called()
+        self.assertEqual(Metrics.get("mail.mailgun.sent"), 1)
+
+    def test_fails_over_and_stops_calling_a_broken_provider(self):
+        self.mailgun.side_effect = http_error(503)
+
+        for _ in range(4):
+            self.assertEqual(self.send(), "sendgrid")
+
+        # The circuit opened after two failures; later sends skip Mailgun
+        self.assertEqual(self.mailgun.call_count, 2)
+        self.assertEqual(MailRouter.stats()["mailgun"]["state"], OPEN)
+        self.assertEqual(Metrics.get("mail.failovers"), 4)
+
+    def test_rejected_message_is_not_failed_over(self):
+        self.mailgun.side_effect = http_error(400)
+
+        with self.assertRaises(MailRejectedError):
+            self.send()
+        self.sendgrid.assert_not_called()
+
+    def test_all_providers_down_reports_retry_delay(self):
+        self.mailgun.side_effect = http_error(503)
+        self.sendgrid.side_effect = requests.exceptions.ConnectionError("down")
+        for _ in range(2):
+            with self.assertRaises(MailDeliveryError):
+                self.send()
+
+        with self.assertRaises(MailDeliveryError) as ctx:
+            self.send()
+        self.assertGreater(ctx.exception.retry_after, 25)
+        self.assertEqual(self.mailgun.call_count, 2)
+
+    def test_rate_budget_spills_to_next_provider(self):
+        self.app.config["MAIL_PROVIDER_RATE_LIMITS"] = "mailgun=1"
+
+        self.assertEqual(self.send(), "mailgun")
+        self.assertEqual(self.send(), "sendgrid")
+        self.assertEqual(Metrics.get("mail.mailgun.throttled"), 1)
+
+    def test_over_budget_provider_still_used_when_it_is_the_only_one(self):
+        self.app.config.update(
+            MAIL_PROVIDERS="mailgun", MAIL_PROVIDER_RATE_LIMITS="mailgun=1"
+        )
+
+        self.assertEqual(self.send(), "mailgun")
+        self.assertEqual(self.send(), "mailgun")
+
+
+class TestTransports(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.app.config["MAIL_FILE_DIR"] = self.folder.name
+
+    def test_file_transport_writes_eml(self):
+        with self.app.app_context():
+            FileTransport.send_batch(
+                "from@test.com", {"a@test.com": {"subject": "Digest", "body": "Hi"}}
+            )
+
+        (path,) = Path(self.folder.name).glob("*.eml")
+        message = message_from_bytes(path.read_bytes())
+        self.assertEqual(message["To"], "a@test.com")
+        self.assertEqual(message["Subject"], "Digest")
+
+    def test_mailgun_transport_uses_recipient_variables(self):
+        with patch.object(Mails, "send_batch_by_mailgun") as batch:
+            MailgunTransport.send_batch("from@test.com", {"a@test.com": {}})
+
+        batch.assert_called_once_with(
+            "from@test.com",
+            {"a@test.com": {}},
+            "%recipient.subject%",
+            "%recipient.body%",
+        )
+
+    def test_send_mail_task_retries_after_circuit_delay(self):
+        error = MailDeliveryError("down", retry_after=12)
+        with patch.object(MailRouter, "send", side_effect=error), patch.object(
+            Mails.send_mail_task, "retry", side_effect=Retry()
+        ) as retry:
+            with self.assertRaises(Retry):
+                Mails.send_mail_task("from@test.com", "a@test.com", "Hi", "Body")
+
+        retry.assert_called_once_with(exc=error, countdown=12)
+
+
+if __name__ == "__main__":
+    unittest.main()
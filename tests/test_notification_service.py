@@ -1,9 +1,13 @@
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
+import fakeredis
 from flask import Flask
 
-from app.services.notification_service import NotificationService
+from app.repositories.notification_digest_cache import NotificationDigestCache
+from app.services.notification_service import NotificationService, render
+from app.utils.mails import Mails
 
 
 class TestNotificationService(unittest.TestCase):
@@ -37,6 +41,7 @@ class TestNotificationService(unittest.TestCase):
         )
         self.mock_mail_task = self.mail_patcher.start()
         self.mock_mail_task.delay = MagicMock()
+        self.mock_mail_task.apply_async = MagicMock()
 
         self.addCleanup(self.mail_patcher.stop)
         self.addCleanup(self.app_context.pop)
@@ -49,8 +54,11 @@ class TestNotificationService(unittest.TestCase):
         )
 
         self.assertTrue(result)
-        self.mock_mail_task.delay.assert_called_once()
-        args = self.mock_mail_task.delay.call_args[0]
+        self.mock_mail_task.apply_async.assert_called_once()
+        kwargs = self.mock_mail_task.apply_async.call_args.kwargs
+        self.assertEqual(kwargs["queue"], "mail.auth")
+        self.assertEqual(kwargs["priority"], 9)
+        args = kwargs["args"]
         self.assertEqual(args[0], self.sender)
         self.assertEqual(args[1], self.email)
         self.assertIn("Candidate: Verify your account", args[2])
@@ -64,8 +72,8 @@ class TestNotificationService(unittest.TestCase):
         )
 
         self.assertTrue(result)
-        self.mock_mail_task.delay.assert_called_once()
-        args = self.mock_mail_task.delay.call_args[0]
+        self.mock_mail_task.apply_async.assert_called_once()
+        args = self.mock_mail_task.apply_async.call_args.kwargs["args"]
         self.assertIn("Employer: Verify your account", args[2])
         self.assertIn("employer", args[3].lower())
 
@@ -75,8 +83,10 @@ class TestNotificationService(unittest.TestCase):
         result = NotificationService.send_password_reset(self.email, self.token)
 
         self.assertTrue(result)
-        self.mock_mail_task.delay.assert_called_once()
-        args = self.mock_mail_task.delay.call_args[0]
+        self.mock_mail_task.apply_async.assert_called_once()
+        kwargs = self.mock_mail_task.apply_async.call_args.kwargs
+        self.assertEqual(kwargs["queue"], "mail.reset")
+        args = kwargs["args"]
         self.assertIn("Candidate: Reset your password", args[2])
         self.assertIn("reset-password", args[3])
         self.assertIn(self.token, args[3])
@@ -176,8 +186,167 @@ class TestNotificationService(unittest.TestCase):
                 self.email, self.job_title, self.status, self.company_name
             )
         )
-        # Six successful calls, one per public method invocation.
-        self.assertEqual(self.mock_mail_task.delay.call_count, 6)
+        # Six successful calls, one per public method invocation: the
+        # auth and reset mails are routed explicitly, the rest use the
+        # default notifications route.
+        self.assertEqual(self.mock_mail_task.apply_async.call_count, 3)
+        self.assertEqual(self.mock_mail_task.delay.call_count, 3)
+
+
+class TestNotificationDigests(unittest.TestCase):
+    """Application notifications buffered per recipient in (fake) Redis."""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(
+            EMAIL_FROM="no-reply@jobboard.test",
+            NOTIFICATION_DIGEST_WINDOW_SECONDS=300,
+            MAILGUN_BATCH_SIZE=2,
+        )
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.addCleanup(self.app_context.pop)
+
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patches = {
+            "redis": patch(
+                "app.repositories.notification_digest_cache.Cache.connect_redis",
+                return_value=self.redis,
+            ),
+            "mail": patch("app.services.notification_service.Mails.send_mail_task"),
+            "batch": patch("app.services.notification_service.Mails.send_batch_task"),
+            "flush": patch(
+                "app.services.notification_service.NotificationService"
+                ".flush_digests_task"
+            ),
+        }
+        self.mocks = {name: p.start() for name, p in patches.items()}
+        for p in patches.values():
+            self.addCleanup(p.stop)
+
+    def due_now(self):
+        """Pretend every open window has elapsed."""
+        for email in self.redis.zrange("notify:digest:pending", 0, -1):
+            self.redis.zadd("notify:digest:pending", {email: 0})
+
+    def test_notifications_are_buffered_and_flush_scheduled_once(self):
+        for applicant in ("a@example.com", "b@example.com", "c@example.com"):
+            NotificationService.notify_employer_of_new_application(
+                "boss@example.com", "Backend Engineer", applicant
+            )
+
+        self.mocks["mail"].delay.assert_not_called()
+        self.mocks["flush"].apply_async.assert_called_once_with(countdown=305)
+        self.assertEqual(NotificationDigestCache.pending(), 1)
+
+    def test_flush_sends_one_digest_per_recipient_in_batches(self):
+        for applicant in ("a@example.com", "b@example.com"):
+            NotificationService.notify_employer_of_new_application(
+                "boss@example.com", "Backend Engineer", applicant
+            )
+        NotificationService.notify_applicant_of_submission(
+            "a@example.com", "Backend Engineer", "Acme"
+        )
+        NotificationService.notify_applicant_status_change(
+            "c@example.com", "Designer", 3, "Acme"
+        )
+        self.due_now()
+
+        self.assertEqual(NotificationService.flush_digests(), 3)
+
+        batches = [c.args for c in self.mocks["batch"].delay.call_args_list]
+        self.assertEqual([len(recipients) for _, recipients in batches], [2, 1])
+        recipients = {**batches[0][1], **batches[1][1]}
+        self.assertIn(
+            "2 new candidate applications", recipients["boss@example.com"]["subject"]
+        )
+        self.assertIn("b@example.com", recipients["boss@example.com"]["body"])
+        self.assertIn(
+            "Your application is received", recipients["a@example.com"]["subject"]
+        )
+        self.assertEqual(NotificationDigestCache.pending(), 0)
+
+    def test_flush_leaves_open_windows_alone(self):
+        NotificationService.notify_applicant_of_submission(
+            "a@example.com", "Backend Engineer", "Acme"
+        )
+
+        self.assertEqual(NotificationService.flush_digests(), 0)
+        self.mocks["batch"].delay.assert_not_called()
+        self.assertEqual(NotificationDigestCache.pending(), 1)
+
+    def test_flush_backs_off_while_another_flush_runs(self):
+        NotificationDigestCache.acquire_flush_lock()
+
+        self.assertIsNone(NotificationService.flush_digests())
+
+    def test_redis_outage_sends_directly(self):
+        self.redis = fakeredis.FakeRedis(
+            server=fakeredis.FakeServer(), decode_responses=True
+        )
+        self.redis.connection_pool.connection_kwargs["server"].connected = False
+        self.mocks["redis"].return_value = self.redis
+
+        NotificationService.notify_applicant_of_submission(
+            "a@example.com", "Backend Engineer", "Acme"
+        )
+
+        self.mocks["mail"].delay.assert_called_once()
+
+    def test_digest_keeps_latest_status_per_application(self):
+        subject, body = render(
+            [
+                {"type": "status", "job_title": "Designer", "status": 2},
+                {"type": "status", "job_title": "Designer", "status": 3},
+                {"type": "submission", "job_title": "Editor", "company_name": "Acme"},
+            ]
+        )
+
+        self.assertEqual(subject, "Candidate: 2 application updates")
+        self.assertIn("'Designer' is now 'Interview'", body)
+        self.assertNotIn("In review", body)
+
+
+class TestMailgunBatch(unittest.TestCase):
+    def test_batch_sends_recipient_variables(self):
+        app = Flask(__name__)
+        app.config.update(
+            MAILGUN_DOMAIN="mg.test",
+            MAILGUN_API_KEY="key",
+            MAILGUN_BASE_URL="https://mg",
+        )
+        recipients = {"a@example.com": {"subject": "Hi", "body": "Body"}}
+
+        with app.app_context(), patch("app.utils.mails.HTTPClient.post") as post:
+            Mails.send_batch_by_mailgun(
+                "from@test", recipients, "%recipient.subject%", "%recipient.body%"
+            )
+
+        data = post.call_args.kwargs["data"]
+        self.assertEqual(data["to"], ["a@example.com"])
+        self.assertEqual(json.loads(data["recipient-variables"]), recipients)
+        self.assertEqual(data["subject"], "%recipient.subject%")
+        self.assertEqual(data["text"], "%recipient.body%")
+        self.assertNotIn("html", data)
+
+
+class TestSendgridBatch(unittest.TestCase):
+    def test_batch_sends_plain_text_body(self):
+        app = Flask(__name__)
+        app.config.update(SENDGRID_API_KEY="key")
+        recipients = {"a@example.com": {"subject": "Hi", "body": "Line 1\nLine 2"}}
+
+        with app.app_context(), patch("app.utils.mails.HTTPClient.post") as post:
+            Mails.send_batch_by_sendgrid("from@test", recipients)
+
+        message = post.call_args.kwargs["json"]
+        self.assertEqual(
+            message["content"], [{"type": "text/plain", "value": "-body-"}]
+        )
+        self.assertEqual(
+            message["personalizations"][0]["substitutions"],
+            {"-body-": "Line 1\nLine 2"},
+        )
 
 
 if __name__ == "__main__":
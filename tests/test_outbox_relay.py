@@ -0,0 +1,250 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.repositories.applications_repository import ApplicationRepository
+from app.repositories.outbox_repository import (
+    APPLICATION_CREATED,
+    APPLICATION_STATUS_CHANGED,
+    OutboxRepository,
+)
+from app.services.outbox_relay import OUTBOX_RETRY_MAX_SECONDS, OutboxRelay, retry_delay
+from app.utils.metrics import Metrics
+
+
+def outbox_row(outbox_id, event_type, payload, attempts=0):
+    return {
+        "outbox_id": outbox_id,
+        "event_type": event_type,
+        "payload": payload,
+        "attempts": attempts,
+    }
+
+
+class TestOutboxRelay(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        self.notify = patch("app.services.outbox_relay.NotificationService").start()
+        self.claim = patch.object(OutboxRepository, "claim").start()
+        self.complete = patch.object(OutboxRepository, "complete").start()
+        self.job_info = patch.object(
+            ApplicationRepository, "get_job_info_for_notification"
+        ).start()
+        self.job_info.return_value = {
+            "job_title": "Engineer",
+            "company_name": "Acme",
+            "employer_email": "hr@acme.com",
+        }
+        self.addCleanup(patch.stopall)
+
+    def test_relays_rows_and_deletes_them(self):
+        self.claim.return_value = [
+            outbox_row(
+                1, APPLICATION_CREATED, {"applicant_email": "a@test.com", "job_id": 7}
+            ),
+            outbox_row(
+                2,
+                APPLICATION_STATUS_CHANGED,
+                {"applicant_email": "a@test.com", "job_id": 7, "status": 3},
+            ),
+        ]
+
+        self.assertEqual(OutboxRelay.drain(batch_size=10), 2)
+
+        self.notify.notify_applicant_of_submission.assert_called_once_with(
+            "a@test.com", "Engineer", "Acme"
+        )
+        self.notify.notify_employer_of_new_application.assert_called_once_with(
+            "hr@acme.com", "Engineer", "a@test.com"
+        )
+        self.notify.notify_applicant_status_change.assert_called_once_with(
+            "a@test.com", "Engineer", 3, "Acme"
+        )
+        # Both rows are about job 7, which is looked up once
+        self.job_info.assert_called_once_with(7)
+        self.complete.assert_called_once_with([1, 2], {})
+        self.assertEqual(Metrics.get("outbox.relayed"), 2)
+
+    def test_failed_row_is_kept_for_another_attempt(self):
+        self.claim.return_value = [
+            outbox_row(
+                1,
+                APPLICATION_STATUS_CHANGED,
+                {"applicant_email": "a@t.com", "job_id": 7},
+            ),
+            outbox_row(
+                2,
+                APPLICATION_STATUS_CHANGED,
+                {"applicant_email": "b@t.com", "job_id": 7, "status": 2},
+            ),
+        ]
+
+        OutboxRelay.drain()
+
+        # Row 1 has no status, so its handler fails; row 2 still goes out
+        self.complete.assert_called_once_with([2], {1: 30})
+        self.assertEqual(Metrics.get("outbox.failed"), 1)
+
+    def test_last_attempt_is_counted_as_dead(self):
+        self.claim.return_value = [outbox_row(1, "unknown", {"job_id": 7}, attempts=4)]
+
+        OutboxRelay.drain(max_attempts=5)
+
+        self.assertEqual(Metrics.get("outbox.dead"), 1)
+
+    def test_rows_for_a_deleted_job_are_dropped(self):
+        self.job_info.return_value = {}
+        self.claim.return_value = [
+            outbox_row(1, APPLICATION_CREATED, {"applicant_email": "a@t", "job_id": 9})
+        ]
+
+        OutboxRelay.drain()
+
+        self.notify.notify_applicant_of_submission.assert_not_called()
+        self.complete.assert_called_once_with([1], {})
+
+    def test_retry_delay_doubles_up_to_the_cap(self):
+        self.assertEqual(
+            [retry_delay(attempts, 30) for attempts in range(4)], [30, 60, 120, 240]
+        )
+        self.assertEqual(retry_delay(20, 30), OUTBOX_RETRY_MAX_SECONDS)
+
+    def test_empty_outbox_does_nothing(self):
+        self.claim.return_value = []
+
+        self.assertEqual(OutboxRelay.drain(), 0)
+        self.complete.assert_not_called()
+
+
+class FakeOutbox:
+    """The claim/complete contract of ``notification_outbox`` on a fake clock"""
+
+    def __init__(self, rows):
+        self.now = 0
+        self.rows = {row["outbox_id"]: dict(row, next_attempt_at=0) for row in rows}
+
+    def claim(self, limit, max_attempts, lease_seconds):
+        due = [
+            row
+            for row in self.rows.values()
+            if row["next_attempt_at"] <= self.now and row["attempts"] < max_attempts
+        ][:limit]
+        for row in due:
+            row["next_attempt_at"] = self.now + lease_seconds
+        return [dict(row) for row in due]
+
+    def complete(self, sent_ids, retry_after):
+        for outbox_id in sent_ids:
+            del self.rows[outbox_id]
+        for outbox_id, delay in retry_after.items():
+            self.rows[outbox_id]["attempts"] += 1
+            self.rows[outbox_id]["next_attempt_at"] = self.now + delay
+
+
+class TestOutboxRelayBackoff(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        self.notify = patch("app.services.outbox_relay.NotificationService").start()
+        self.outbox = FakeOutbox(
+            [
+                outbox_row(
+                    1,
+                    APPLICATION_CREATED,
+                    {"applicant_email": "a@test.com", "job_id": 7},
+                )
+            ]
+        )
+        patch.object(OutboxRepository, "claim", self.outbox.claim).start()
+        patch.object(OutboxRepository, "complete", self.outbox.complete).start()
+        patch.object(
+            ApplicationRepository,
+            "get_job_info_for_notification",
+            return_value={"job_title": "Engineer", "company_name": "Acme"},
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def test_failed_row_is_not_reclaimed_before_its_backoff(self):
+        self.notify.notify_applicant_of_submission.side_effect = [
+            ConnectionError("broker down"),
+            None,
+        ]
+
+        self.assertEqual(OutboxRelay.drain(lease_seconds=60, retry_seconds=30), 1)
+        self.outbox.now = 29
+        self.assertEqual(OutboxRelay.drain(lease_seconds=60, retry_seconds=30), 0)
+        self.outbox.now = 30
+        self.assertEqual(OutboxRelay.drain(lease_seconds=60, retry_seconds=30), 1)
+
+        self.assertEqual(self.notify.notify_applicant_of_submission.call_count, 2)
+        self.assertEqual(self.outbox.rows, {})
+
+    def test_second_failure_waits_twice_as_long(self):
+        self.notify.notify_applicant_of_submission.side_effect = ConnectionError()
+
+        OutboxRelay.drain(retry_seconds=30)
+        self.outbox.now = 30
+        OutboxRelay.drain(retry_seconds=30)
+
+        self.assertEqual(self.outbox.rows[1]["attempts"], 2)
+        self.assertEqual(self.outbox.rows[1]["next_attempt_at"], 90)
+
+    def test_leased_row_is_not_claimed_by_another_relay(self):
+        self.assertEqual(len(self.outbox.claim(10, 5, 60)), 1)
+
+        self.assertEqual(OutboxRelay.drain(), 0)
+        self.notify.notify_applicant_of_submission.assert_not_called()
+
+
+class TestOutboxRepository(unittest.TestCase):
+    @patch("app.repositories.outbox_repository.DB.get_db")
+    def test_claim_skips_locked_rows_and_decodes_payload(self, mock_get_db):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            outbox_row(1, APPLICATION_CREATED, '{"applicant_email": "a@t.com"}')
+        ]
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        rows = OutboxRepository.claim(50, 5, 60)
+
+        (query, params), (lease, lease_params) = [
+            c[0] for c in mock_cursor.execute.call_args_list
+        ]
+        self.assertIn("next_attempt_at <= NOW()", query)
+        self.assertIn("FOR UPDATE SKIP LOCKED", query)
+        self.assertEqual(params, (5, 50))
+        self.assertIn("SET next_attempt_at = NOW() + INTERVAL %s SECOND", lease)
+        self.assertEqual(lease_params, [60, 1])
+        # The lease is committed before the rows are published
+        mock_get_db.return_value.commit.assert_called_once()
+        self.assertEqual(rows[0]["payload"], {"applicant_email": "a@t.com"})
+
+    @patch("app.repositories.outbox_repository.DB.get_db")
+    def test_claim_with_nothing_due_leases_nothing(self, mock_get_db):
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        mock_get_db.return_value.cursor.return_value = mock_cursor
+
+        self.assertEqual(OutboxRepository.claim(50, 5, 60), [])
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+
+    @patch("app.repositories.outbox_repository.DB.get_db")
+    def test_complete_deletes_sent_and_counts_failed_in_one_commit(self, mock_get_db):
+        mock_conn = mock_get_db.return_value
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value = mock_cursor
+        mock_conn.cursor.return_value = mock_cursor
+
+        OutboxRepository.complete([1, 2], {3: 30, 4: 60, 5: 30})
+
+        delete, *updates = [c[0] for c in mock_cursor.execute.call_args_list]
+        self.assertTrue(delete[0].startswith("DELETE FROM notification_outbox"))
+        self.assertEqual(delete[1], [1, 2])
+        self.assertIn("attempts = attempts + 1", updates[0][0])
+        self.assertIn("next_attempt_at = NOW() + INTERVAL %s SECOND", updates[0][0])
+        self.assertEqual([params for _, params in updates], [[30, 3, 5], [60, 4]])
+        mock_conn.commit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,11 @@ class TestProfileControllers(unittest.TestCase):
 
         self.client = self.app.test_client()
 
+        decode = patch("app.utils.auth.Security.decode_jwt_token")
+        self.mock_decode = decode.start()
+        self.mock_decode.return_value = {"profile_id": 1, "email": "user@example.com"}
+        self.addCleanup(decode.stop)
+
         self.valid_payload = {
             "first_name": "Steve",
             "last_name": "Tester",
@@ -8,7 +8,7 @@ from app.utils.exceptions import GenericDatabaseError
 class TestProfileService(unittest.TestCase):
 
     def setUp(self):
-        self.token = "validtoken"
+        self.user_id = 1
         self.payload = {
             "first_name": "Steve",
             "last_name": "Tester",
@@ -17,67 +17,43 @@ class TestProfileService(unittest.TestCase):
 
     # --- create_profile tests ---
     @patch("app.services.profile_service.ProfileRepository.add_profile")
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_create_profile_success(self, mock_decode, mock_add_profile):
-        mock_decode.return_value = {"profile_id": 1}
+    def test_create_profile_success(self, mock_add_profile):
         mock_add_profile.return_value = 1
 
-        result = ProfileService.create_profile(self.token, self.payload)
+        result = ProfileService.create_profile(self.user_id, self.payload)
         self.assertEqual(result, 1)
 
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_create_profile_invalid_token(self, mock_decode):
-        mock_decode.return_value = None
+    def test_create_profile_missing_user_id(self):
         with self.assertRaises(GenericDatabaseError):
-            ProfileService.create_profile(self.token, self.payload)
-
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_create_profile_missing_user_id(self, mock_decode):
-        mock_decode.return_value = {"profile_id": None}
-        with self.assertRaises(GenericDatabaseError):
-            ProfileService.create_profile(self.token, self.payload)
+            ProfileService.create_profile(None, self.payload)
 
     @patch("app.services.profile_service.ProfileRepository.add_profile")
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_create_profile_not_created(self, mock_decode, mock_add_profile):
-        mock_decode.return_value = {"profile_id": 1}
+    def test_create_profile_not_created(self, mock_add_profile):
         mock_add_profile.return_value = 0
 
-        result = ProfileService.create_profile(self.token, self.payload)
+        result = ProfileService.create_profile(self.user_id, self.payload)
         self.assertEqual(result, 0)
 
     def test_create_profile_invalid_payload_type(self):
         with self.assertRaises(GenericDatabaseError):
-            ProfileService.create_profile(self.token, "not_a_dict")
+            ProfileService.create_profile(self.user_id, "not_a_dict")
 
     # --- get_profile tests ---
     @patch("app.services.profile_service.ProfileRepository.get_profile")
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_get_profile_success(self, mock_decode, mock_get_profile):
-        mock_decode.return_value = {"profile_id": 1}
+    def test_get_profile_success(self, mock_get_profile):
         mock_get_profile.return_value = {"first_name": "Steve", "last_name": "Tester"}
 
-        profile = ProfileService.get_profile(self.token)
+        profile = ProfileService.get_profile(self.user_id)
         self.assertEqual(profile["first_name"], "Steve")
 
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_get_profile_invalid_token(self, mock_decode):
-        mock_decode.return_value = None
-        with self.assertRaises(Exception):
-            ProfileService.get_profile(self.token)
-
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_get_profile_missing_user_id(self, mock_decode):
-        mock_decode.return_value = {"profile_id": None}
+    def test_get_profile_missing_user_id(self):
         with self.assertRaises(Exception):
-            ProfileService.get_profile(self.token)
+            ProfileService.get_profile(None)
 
     @patch("app.services.profile_service.ProfileRepository.get_profile")
-    @patch("app.services.profile_service.Security.decode_jwt_token")
-    def test_get_profile_not_found(self, mock_decode, mock_get_profile):
-        mock_decode.return_value = {"profile_id": 1}
+    def test_get_profile_not_found(self, mock_get_profile):
         mock_get_profile.return_value = None
 
         with self.assertRaises(Exception) as ctx:
-            ProfileService.get_profile(self.token)
+            ProfileService.get_profile(self.user_id)
         self.assertIn("Failed to get profile", str(ctx.exception))
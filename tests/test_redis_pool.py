@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+
+import fakeredis
+import redis
+from flask import Flask
+
+from app.db.redis import Cache, MeteredConnectionPool
+from app.extensions.limiter import init_limiter
+from app.utils.metrics import Metrics
+
+
+def fake_pool(config):
+    return MeteredConnectionPool(
+        connection_class=fakeredis.FakeRedisConnection,
+        server=fakeredis.FakeServer(),
+        decode_responses=True,
+        max_connections=int(config.get("REDIS_POOL_MAX_SIZE", 20)),
+        timeout=float(config.get("REDIS_POOL_TIMEOUT", 5)),
+    )
+
+
+class TestRedisPool(unittest.TestCase):
+    def setUp(self):
+        Metrics.reset()
+        Cache.reset()
+        self.addCleanup(Cache.reset)
+        patcher = patch.object(Cache, "create_pool", side_effect=fake_pool)
+        self.mock_create_pool = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.app = Flask(__name__)
+        self.app.config.update(
+            ENV="dev", REDIS_POOL_MAX_SIZE=1, REDIS_POOL_TIMEOUT=0.01
+        )
+
+    def test_clients_share_one_pool(self):
+        with self.app.app_context():
+            client = Cache.connect_redis()
+            client.set("key", "value")
+
+            self.assertIs(Cache.connect_redis(), client)
+            self.assertEqual(Cache.create_client(self.app.config).get("key"), "value")
+
+        self.mock_create_pool.assert_called_once()
+        self.assertEqual(
+            Metrics.snapshot()["gauges"]["redis_pool"],
+            {"max_size": 1, "created": 1, "idle": 1, "in_use": 0},
+        )
+
+    def test_exhausted_pool_is_counted(self):
+        with self.app.app_context():
+            pubsub = Cache.connect_redis().pubsub()
+            pubsub.subscribe("events")
+            self.addCleanup(pubsub.close)
+
+            with self.assertRaises(redis.ConnectionError):
+                Cache.connect_redis().get("key")
+
+        self.assertEqual(Metrics.get("redis.pool.exhausted"), 1)
+
+    def test_connection_options_enable_keepalive(self):
+        options = Cache.connection_options({"REDIS_SOCKET_TIMEOUT": "2"})
+
+        self.assertTrue(options["socket_keepalive"])
+        self.assertEqual(options["socket_timeout"], 2.0)
+        self.assertTrue(options["decode_responses"])
+
+    def test_limiter_uses_shared_pool(self):
+        self.app.config["RATELIMIT_STORAGE_URI"] = "redis://localhost:6379/0"
+
+        with patch("app.extensions.limiter.limiter.init_app"):
+            init_limiter(self.app)
+
+        self.assertIs(
+            self.app.config["RATELIMIT_STORAGE_OPTIONS"]["connection_pool"],
+            Cache.get_pool(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,8 +4,10 @@ import unittest
 from unittest.mock import patch
 
 import jwt
+from flask import Flask
 
-from app.utils.security import Security
+from app.utils.metrics import Metrics
+from app.utils.security import Security, TokenCache
 
 
 class TestSecurity(unittest.TestCase):
@@ -15,11 +17,18 @@ class TestSecurity(unittest.TestCase):
         os.environ["JWT_SECRET"] = "testsecret"
         os.environ["JWT_ALGORITHM"] = "HS256"
         os.environ["JWT_TOKEN_EXPIRY_HOURS"] = "1"
+        Security._settings = None
+        Security._token_cache = TokenCache()
+        Metrics.reset()
 
         self.password = "my_secret_password_1234"
         self.profile_id = 1001
         self.email = "user@example.com"
 
+    def tearDown(self):
+        Security._settings = None
+        Security._token_cache = TokenCache()
+
     # ------------ 1. PASSWORD HASHING --------------------#
     def test_hash_password_returns_string(self):
         hashed = Security.hash_password(self.password)
@@ -157,6 +166,80 @@ class TestSecurity(unittest.TestCase):
             Security.decode_jwt_token(token)
         self.assertIn("Invalid token", str(ctx.exception))
 
+    # ---------- 4. VERIFIED TOKEN CACHE ------------------#
+    def test_decode_jwt_caches_verified_token(self):
+        token = Security.create_jwt_token(self.profile_id, self.email)
+
+        with patch("app.utils.security.jwt.decode", wraps=jwt.decode) as decode:
+            first = Security.decode_jwt_token(token)
+            second = Security.decode_jwt_token(token)
+
+        self.assertEqual(first, second)
+        decode.assert_called_once()
+        self.assertEqual(Metrics.get("jwt_cache.misses"), 1)
+        self.assertEqual(Metrics.get("jwt_cache.hits"), 1)
+
+    def test_decode_jwt_returns_copies_of_cached_payload(self):
+        token = Security.create_jwt_token(self.profile_id, self.email)
+
+        Security.decode_jwt_token(token)["profile_id"] = 999
+
+        self.assertEqual(Security.decode_jwt_token(token)["profile_id"], 1001)
+
+    def test_decode_jwt_does_not_serve_cached_token_after_exp(self):
+        token = Security.create_jwt_token(self.profile_id, self.email)
+        Security.decode_jwt_token(token)
+
+        with patch("app.utils.security.time.time", return_value=9999999999):
+            with patch("app.utils.security.jwt.decode") as decode:
+                decode.side_effect = jwt.ExpiredSignatureError()
+                with self.assertRaises(Exception) as ctx:
+                    Security.decode_jwt_token(token)
+
+        self.assertIn("Token expired", str(ctx.exception))
+
+    def test_decode_jwt_cache_is_bounded(self):
+        Security._token_cache = TokenCache(max_size=1)
+        first = Security.create_jwt_token(1, "a@example.com")
+        second = Security.create_jwt_token(2, "b@example.com")
+
+        Security.decode_jwt_token(first)
+        Security.decode_jwt_token(second)
+        Security.decode_jwt_token(first)
+
+        self.assertEqual(len(Security._token_cache), 1)
+        self.assertEqual(Metrics.get("jwt_cache.misses"), 3)
+
+    def test_decode_jwt_cache_ignores_rotated_secret(self):
+        token = Security.create_jwt_token(self.profile_id, self.email)
+        Security.decode_jwt_token(token)
+
+        with patch.dict(os.environ, {"JWT_SECRET": "rotated"}):
+            with self.assertRaises(Exception) as ctx:
+                Security.decode_jwt_token(token)
+        self.assertIn("Invalid token", str(ctx.exception))
+
+    def test_decode_jwt_memoizes_per_request(self):
+        token = Security.create_jwt_token(self.profile_id, self.email)
+        app = Flask(__name__)
+
+        with app.test_request_context():
+            Security.decode_jwt_token(token)
+            Security.decode_jwt_token(token)
+
+        self.assertEqual(Metrics.get("jwt_cache.request_hits"), 1)
+        self.assertEqual(Metrics.get("jwt_cache.misses"), 1)
+
+    def test_load_settings_reads_environment_once(self):
+        Security.load_settings(cache_size=10)
+        token = Security.create_jwt_token(self.profile_id, self.email)
+
+        with patch.dict(os.environ, {"JWT_SECRET": "changed-later"}):
+            payload = Security.decode_jwt_token(token)
+
+        self.assertEqual(payload["profile_id"], self.profile_id)
+        self.assertEqual(Security._token_cache.max_size, 10)
+
 
 if __name__ == "__main__":
     unittest.main()